@@ -1,4 +1,9 @@
+from sys import argv, exit
+
 from energyplus_rpd.runner import run
 
 
-run()
+if len(argv) > 1 and argv[1] == 'serve':
+    from energyplus_rpd.service import run_service
+    exit(run_service(argv[2:]))
+exit(run())
@@ -0,0 +1,154 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from glob import glob
+from json import dumps
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+from energyplus_rpd.compression import OPEN_BY_COMPRESSION_SUFFIX, without_compression_suffix
+from energyplus_rpd.input_cache import InputCache
+from energyplus_rpd.translation_cache import TranslationCache, translate_with_cache
+from energyplus_rpd.translator import Translator
+from energyplus_rpd.validator import get_shared_validator
+
+JsonDict = Dict[str, Any]
+
+
+def collect_model_paths(source: str) -> List[Path]:
+    """Returns the epJSON files given by a directory, a single epJSON file, a manifest file or a glob pattern
+
+    A manifest is a text file with one epJSON path per line; relative paths are relative to the manifest, and blank
+    lines and lines starting with # are skipped.
+    """
+    source_path = Path(source)
+    if source_path.is_dir():
+        patterns = ['*.epJSON'] + [f'*.epJSON{suffix}' for suffix in OPEN_BY_COMPRESSION_SUFFIX]
+        return sorted(model_path for pattern in patterns for model_path in source_path.rglob(pattern))
+    if source_path.is_file():
+        if without_compression_suffix(source_path).suffix.lower() == '.epjson':
+            return [source_path]
+        model_paths = []
+        for line in source_path.read_text().splitlines():
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            model_path = Path(line)
+            if not model_path.is_absolute():
+                model_path = source_path.parent / model_path
+            model_paths.append(model_path)
+        return model_paths
+    return sorted(Path(match) for match in glob(source, recursive=True))
+
+
+def initialize_worker():
+    # the shared validator is built once in each worker process and reused for every model
+    get_shared_validator()
+
+
+def translate_model(epjson_file_path: Path, add_cp=False, empty_cp=False, stream_hourly=False,
+                    cache: Optional[TranslationCache] = None, input_cache: Optional[InputCache] = None,
+                    timings=False, verify_ids=False, compact=False, compress=False,
+                    load_process_min_bytes: Optional[int] = None, concurrent_load=False, jobs=1) -> JsonDict:
+    # failures are caught and recorded so one bad model does not stop the rest of the batch
+    start = perf_counter()
+    result = {'path': str(epjson_file_path), 'succeeded': True, 'error': '', 'cached': False}
+
+    def translate():
+        t = Translator(epjson_file_path, add_cp=add_cp, empty_cp=empty_cp, stream_hourly=stream_hourly,
+                       timings=timings, verify_ids=verify_ids, compact_output=compact, compress_output=compress,
+                       input_cache=input_cache, input_process_min_bytes=load_process_min_bytes,
+                       concurrent_load=concurrent_load, jobs=jobs)
+        t.process()
+        if t.stage_timer is not None:
+            result['timings'] = t.stage_timer.to_dict()
+            summaries = [t.stage_timer.report(), t.fact_cache.summary(), t.tabular_catalog.summary()]
+            result['timings_report'] = '\n'.join(summaries)
+
+    try:
+        if cache is None or empty_cp:
+            translate()
+        else:
+            result['cached'] = translate_with_cache(cache, epjson_file_path, translate, add_cp, compact, compress)
+    except Exception as e:
+        result['succeeded'] = False
+        result['error'] = f'{type(e).__name__}: {e}'
+    result['wall_time'] = perf_counter() - start
+    return result
+
+
+def run_batch(model_paths: List[Path], workers: Optional[int] = None, add_cp=False, empty_cp=False,
+              stream_hourly=False, cache: Optional[TranslationCache] = None,
+              input_cache: Optional[InputCache] = None, timings=False, verify_ids=False,
+              compact=False, compress=False, load_process_min_bytes: Optional[int] = None,
+              concurrent_load=False, jobs=1) -> List[JsonDict]:
+    """Translates each model and returns one result per model in the order the models were given
+
+    With workers set to 1 the models are translated one after the other in this process, otherwise they are spread
+    over a pool of worker processes (the number of CPUs when workers is None). The options are those of
+    run_with_path and apply to every model.
+    """
+    translate = partial(translate_model, add_cp=add_cp, empty_cp=empty_cp, stream_hourly=stream_hourly, cache=cache,
+                        input_cache=input_cache, timings=timings, verify_ids=verify_ids, compact=compact,
+                        compress=compress, load_process_min_bytes=load_process_min_bytes,
+                        concurrent_load=concurrent_load, jobs=jobs)
+    if workers == 1:
+        initialize_worker()
+        return [translate(model_path) for model_path in model_paths]
+    results: Dict[int, JsonDict] = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=initialize_worker) as executor:
+        futures = {executor.submit(translate, model_path): index for index, model_path in enumerate(model_paths)}
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                # the worker itself failed, for example it was killed, so no timing is available
+                results[index] = {'path': str(model_paths[index]), 'succeeded': False,
+                                  'error': f'{type(e).__name__}: {e}', 'wall_time': 0.0, 'cached': False}
+    return [results[index] for index in range(len(model_paths))]
+
+
+def summarize_batch(results: List[JsonDict], total_wall_time: float) -> str:
+    lines = ['Batch summary', '-------------']
+    for result in results:
+        status = 'ok    ' if result['succeeded'] else 'FAILED'
+        cached = '  (cached)' if result.get('cached') else ''
+        lines.append(f"{status} {result['wall_time']:9.2f} s  {result['path']}{cached}")
+        if 'timings_report' in result:
+            lines.extend('    ' + line for line in result['timings_report'].splitlines())
+    failures = [result for result in results if not result['succeeded']]
+    throughput = len(results) / total_wall_time * 60. if total_wall_time > 0 else 0.
+    lines.append(f'{len(results)} models in {total_wall_time:.2f} s ({throughput:.1f} models per minute), '
+                 f'{len(results) - len(failures)} succeeded, {len(failures)} failed')
+    for failure in failures:
+        lines.append(f"  {failure['path']}: {failure['error']}")
+    return '\n'.join(lines)
+
+
+def write_batch_timings(results: List[JsonDict], timings_file: Path):
+    # the stage timings of every translated model, by the path of its epJSON file
+    timings = {result['path']: result['timings'] for result in results if 'timings' in result}
+    timings_file.write_text(dumps(timings, indent=2))
+
+
+def run_batch_with_source(source: str, workers: Optional[int] = None, add_cp=False, empty_cp=False,
+                          stream_hourly=False, cache: Optional[TranslationCache] = None,
+                          input_cache: Optional[InputCache] = None, timings=False,
+                          timings_file: Optional[Path] = None, verify_ids=False, compact=False,
+                          compress=False, load_process_min_bytes: Optional[int] = None,
+                          concurrent_load=False, jobs=1) -> int:
+    model_paths = collect_model_paths(source)
+    if not model_paths:
+        print(f'No epJSON files found for: {source}')
+        return 1
+    start = perf_counter()
+    results = run_batch(model_paths, workers, add_cp, empty_cp, stream_hourly, cache, input_cache,
+                        timings=timings or timings_file is not None, verify_ids=verify_ids, compact=compact,
+                        compress=compress, load_process_min_bytes=load_process_min_bytes,
+                        concurrent_load=concurrent_load, jobs=jobs)
+    print(summarize_batch(results, perf_counter() - start))
+    if timings_file is not None:
+        write_batch_timings(results, timings_file)
+        print(f"Stage timings written to {timings_file}")
+    return 0 if all(result['succeeded'] for result in results) else 1
@@ -1,12 +1,17 @@
-from json import dumps, loads
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
+
+from energyplus_rpd.json_codec import dumps_indented, loads
 
 
 class ComplianceParameterHandler:
-    def __init__(self, epjson_file_path: Path):
-        self.cp_empty_file_path = epjson_file_path.with_suffix('.comp-param-empty.json')
-        self.cp_file_path = epjson_file_path.with_suffix('.comp-param.json')
+    def __init__(self, epjson_file_path: Optional[Path] = None):
+        # without a path the compliance parameters are set in cp_file directly and no file is read or written
+        self.cp_empty_file_path = None
+        self.cp_file_path = None
+        if epjson_file_path is not None:
+            self.cp_empty_file_path = epjson_file_path.with_suffix('.comp-param-empty.json')
+            self.cp_file_path = epjson_file_path.with_suffix('.comp-param.json')
         self.cp_file = {}
         self.compliance_group_element = {
             # data group: {data element: default value, ...}
@@ -115,7 +120,7 @@ class ComplianceParameterHandler:
         created_dict = {}
         self.add_compliance_parameters('root', created_dict)
         self.mirror_nested(json_dict, created_dict)
-        self.cp_empty_file_path.write_text(dumps(created_dict, indent=2))
+        self.cp_empty_file_path.write_text(dumps_indented(created_dict), encoding='utf-8')
         return created_dict
 
     def mirror_nested(self, in_dict: Dict, out_dict: Dict):
@@ -157,7 +162,8 @@ class ComplianceParameterHandler:
 
     def merge_in_compliance_parameters(self, rpd_dict):
         # this is one of the main entry points
-        self._load_cp_file()
+        if self.cp_file_path is not None:
+            self._load_cp_file()
         rpd_dict = self.update_dict(rpd_dict, self.cp_file)
         return rpd_dict
 
@@ -0,0 +1,44 @@
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+from typing import IO, Optional
+
+# the compressed files that can be read, each is found by adding the suffix to the name of the plain file
+OPEN_BY_COMPRESSION_SUFFIX = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open,
+}
+GZIP_SUFFIX = '.gz'
+
+
+def is_compressed(path: Path) -> bool:
+    return path.suffix.lower() in OPEN_BY_COMPRESSION_SUFFIX
+
+
+def without_compression_suffix(path: Path) -> Path:
+    return path.with_suffix('') if is_compressed(path) else path
+
+
+def open_text(path: Path, mode: str = 'r', encoding: Optional[str] = None) -> IO[str]:
+    # compressed files are decompressed or compressed as a stream while they are read or written
+    if is_compressed(path):
+        return OPEN_BY_COMPRESSION_SUFFIX[path.suffix.lower()](path, mode + 't', encoding=encoding)
+    return open(path, mode, encoding=encoding)
+
+
+def read_text(path: Path) -> str:
+    with open_text(path) as text_file:
+        return text_file.read()
+
+
+def find_plain_or_compressed(path: Path) -> Optional[Path]:
+    """Returns the path if it exists, otherwise the first compressed variant of it that exists, if any"""
+    if path.exists():
+        return path
+    for suffix in OPEN_BY_COMPRESSION_SUFFIX:
+        compressed_path = path.with_name(path.name + suffix)
+        if compressed_path.exists():
+            return compressed_path
+    return None
@@ -0,0 +1,50 @@
+from typing import Dict, FrozenSet, Optional
+
+EMPTY: FrozenSet[str] = frozenset()
+
+
+def normalize(value: str) -> str:
+    return value.upper()
+
+
+class EnumerationIndex:
+    """Every enumeration of the enumeration schemas as a frozenset, built once
+
+    Enumerations are found by name alone, or by schema file name and enumeration name when the schema matters.
+    Values are kept as written in the schema and also by their upper case form so lookups can ignore case and still
+    return the value as the schema writes it.
+    """
+
+    def __init__(self, definitions_by_schema: Dict[str, Dict]):
+        self.values_by_name: Dict[str, FrozenSet[str]] = {}
+        self.canonical_by_name: Dict[str, Dict[str, str]] = {}
+        self.schema_by_name: Dict[str, str] = {}
+        for schema_name, schema in definitions_by_schema.items():
+            for name, definition in schema.get('definitions', {}).items():
+                if 'enum' not in definition or name in self.values_by_name:
+                    continue
+                values = frozenset(value for value in definition['enum'] if isinstance(value, str))
+                self.values_by_name[name] = values
+                self.canonical_by_name[name] = {normalize(value): value for value in values}
+                self.schema_by_name[name] = schema_name
+
+    def values(self, enumeration_name: str, schema_name: Optional[str] = None) -> FrozenSet[str]:
+        if schema_name is not None and self.schema_by_name.get(enumeration_name) != schema_name:
+            return EMPTY
+        return self.values_by_name.get(enumeration_name, EMPTY)
+
+    def canonical(self, enumeration_name: str, value: str, schema_name: Optional[str] = None) -> Optional[str]:
+        # the value is compared without regard to case and returned as the schema writes it, or None if it is missing
+        if schema_name is not None and self.schema_by_name.get(enumeration_name) != schema_name:
+            return None
+        return self.canonical_by_name.get(enumeration_name, {}).get(normalize(value))
+
+    def contains(self, enumeration_name: str, value: str, schema_name: Optional[str] = None) -> bool:
+        return self.canonical(enumeration_name, value, schema_name) is not None
+
+    def contains_exactly(self, enumeration_name: str, value: str, schema_name: Optional[str] = None) -> bool:
+        return value in self.values(enumeration_name, schema_name)
+
+    def summary(self) -> str:
+        value_count = sum(len(values) for values in self.values_by_name.values())
+        return f'enumeration index: {len(self.values_by_name)} enumerations, {value_count} values'
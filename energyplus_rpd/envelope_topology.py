@@ -0,0 +1,49 @@
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
+
+JsonDict = Dict[str, Any]
+
+# the surfaces of a model without any, one object so the topology built from it is found again instead of rebuilt
+NO_BUILDING_SURFACES: Mapping[str, JsonDict] = MappingProxyType({})
+
+
+class EnvelopeTopology:
+    """Index of the building envelope built in one pass over the BuildingSurface:Detailed objects
+
+    Surface and zone names are upper case, as they appear in the tabular reports. Each zone is mapped to its
+    surfaces in input order, and each surface to its zone, its outside boundary condition, its adjacent surface and
+    zone and its subsurfaces, so the zone and surface emitters do not have to rescan every surface per zone.
+    """
+
+    def __init__(self, building_surfaces: Mapping[str, JsonDict], subsurface_by_surface: Dict[str, List[JsonDict]]):
+        self.building_surfaces = building_surfaces
+        self.zone_by_surface: Dict[str, str] = {}
+        self.surface_names_by_zone: Dict[str, List[str]] = {}
+        self.adjacent_surface_by_surface: Dict[str, str] = {}
+        self.outside_boundary_condition_by_surface: Dict[str, str] = {}
+        self.subsurfaces_by_surface = subsurface_by_surface
+        for surface_name, fields in building_surfaces.items():
+            surface_key = surface_name.upper()
+            if 'zone_name' in fields:
+                zone_key = fields['zone_name'].upper()
+                self.zone_by_surface[surface_key] = zone_key
+                self.surface_names_by_zone.setdefault(zone_key, []).append(surface_key)
+            if 'outside_boundary_condition_object' in fields:
+                self.adjacent_surface_by_surface[surface_key] = fields['outside_boundary_condition_object'].upper()
+            if 'outside_boundary_condition' in fields:
+                self.outside_boundary_condition_by_surface[surface_key] = fields['outside_boundary_condition'].upper()
+        self.adjacent_zone_by_surface: Dict[str, str] = {}
+        for surface_key, adjacent_surface in self.adjacent_surface_by_surface.items():
+            if adjacent_surface in self.zone_by_surface:
+                self.adjacent_zone_by_surface[surface_key] = self.zone_by_surface[adjacent_surface]
+
+    def is_built_from(self, building_surfaces: Mapping[str, JsonDict]) -> bool:
+        return self.building_surfaces is building_surfaces
+
+    def surfaces_of_zone(self, zone_name: str) -> List[str]:
+        return self.surface_names_by_zone.get(zone_name, [])
+
+    def summary(self) -> str:
+        subsurface_count = sum(len(subsurfaces) for subsurfaces in self.subsurfaces_by_surface.values())
+        return (f'envelope topology: {len(self.surface_names_by_zone)} zones, {len(self.zone_by_surface)} surfaces, '
+                f'{subsurface_count} subsurfaces')
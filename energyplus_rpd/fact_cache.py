@@ -0,0 +1,55 @@
+from functools import wraps
+from threading import RLock
+from typing import Any, Callable, Dict, Optional
+
+
+class FactCache:
+    """Memoizes facts derived from the inputs, such as the equipment fans, for the length of one translation
+
+    Cached facts are shared by every stage that asks for them, so callers copy a fact before modifying it. The
+    cache is emptied with invalidate, either for some facts or for all of them. Hits and misses are counted for
+    each fact to show which derived maps are asked for more than once. A fact is computed by one thread at a time, so
+    stages running at the same time compute each fact once.
+    """
+
+    def __init__(self):
+        self.values: Dict[str, Any] = {}
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+        # reentrant since computing one fact can ask for another
+        self.lock = RLock()
+
+    def get(self, name: str, compute: Callable[[], Any]) -> Any:
+        with self.lock:
+            if name in self.values:
+                self.hits[name] = self.hits.get(name, 0) + 1
+                return self.values[name]
+            self.misses[name] = self.misses.get(name, 0) + 1
+            value = compute()
+            self.values[name] = value
+            return value
+
+    def invalidate(self, *names: str):
+        # without names every fact is dropped
+        if not names:
+            self.values.clear()
+        for name in names:
+            self.values.pop(name, None)
+
+    def summary(self) -> str:
+        if not self.misses:
+            return 'fact cache: empty'
+        return 'fact cache: ' + ', '.join(f'{name} {self.hits.get(name, 0)} hits {self.misses[name]} misses'
+                                          for name in sorted(self.misses))
+
+
+def cached_fact(name: Optional[str] = None):
+    """Decorates a Translator method without arguments so its result is kept in the fact cache of the translator"""
+    def decorator(method: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        fact_name = name or method.__name__
+
+        @wraps(method)
+        def wrapper(self):
+            return self.fact_cache.get(fact_name, lambda: method(self))
+        return wrapper
+    return decorator
@@ -0,0 +1,104 @@
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from energyplus_rpd.hourly_stream import ColumnSelector, load_hourly_columns, typed_column
+
+SCHEDULE_VALUE_SUFFIX = ':Schedule Value'
+DESIGN_DAY_ROW_COUNT = 8808  # a year of hours plus the summer and winter design days at the start
+HOURS_PER_DAY = 24
+
+JsonDict = Dict[str, Any]
+
+
+def without_schedule_value_suffix(variable: str) -> str:
+    # the hourly output variable of a schedule is named after the schedule
+    if variable.endswith(SCHEDULE_VALUE_SUFFIX):
+        return variable[:-len(SCHEDULE_VALUE_SUFFIX)]
+    return variable
+
+
+def column_key(variable: str) -> str:
+    return without_schedule_value_suffix(variable).upper()
+
+
+def as_list(values: Sequence[Any]) -> List[Any]:
+    return values.tolist() if isinstance(values, memoryview) else list(values)
+
+
+class HourlyStore:
+    """The hourly results as columns: the timestamps and one array of doubles per output variable
+
+    The rows of the hourly results are walked once, and the store is shared by every stage that needs hourly values.
+    A column is found by its output variable name, in any case and with or without the :Schedule Value suffix. The
+    annual period and the design days are memoryview slices of a column, so nothing is copied until the values are
+    turned into lists for the RPD. The input cache keeps the columns of the store as they are.
+    """
+
+    def __init__(self, cols: List[JsonDict], timestamps: List[str], columns: List[Sequence[Any]],
+                 row_count: Optional[int] = None):
+        self.cols = cols
+        self.timestamps = timestamps
+        self.columns = columns
+        self.row_count = len(timestamps) if row_count is None else row_count
+        self.index_by_key: Dict[str, int] = {}
+        for index, col in enumerate(cols[:len(columns)]):
+            # a name given to more than one column finds the last of them, as the schedules have always been read
+            self.index_by_key[column_key(col.get('Variable', ''))] = index
+
+    @classmethod
+    def from_object(cls, hourly_object: JsonDict) -> 'HourlyStore':
+        cols = hourly_object.get('Cols', [])
+        rows = hourly_object.get('Rows', [])
+        # each row is a dictionary with a single timestamp key
+        timestamps = [next(iter(row)) for row in rows]
+        if rows:
+            columns = [typed_column(column) for column in zip(*(next(iter(row.values())) for row in rows))]
+        else:
+            columns = [array('d') for _ in cols]
+        return cls(cols, timestamps, columns)
+
+    @classmethod
+    def from_stream(cls, hourly_json_path: Path, select_columns: ColumnSelector) -> 'HourlyStore':
+        # only the columns chosen by select_columns are read, so the store holds just those and no timestamps
+        selected_cols: List[JsonDict] = []
+
+        def select(cols: List[JsonDict]) -> Dict[str, int]:
+            column_by_name = select_columns(cols)
+            selected_cols.extend(cols[index] for index in column_by_name.values())
+            return column_by_name
+
+        _, columns, row_count = load_hourly_columns(hourly_json_path, select)
+        return cls(selected_cols, [], list(columns.values()), row_count)
+
+    def is_numeric(self) -> bool:
+        return all(not isinstance(column, list) for column in self.columns)
+
+    def find(self, name: str) -> Optional[int]:
+        return self.index_by_key.get(column_key(name))
+
+    def column(self, name: str) -> Sequence[Any]:
+        index = self.find(name)
+        if index is None:
+            raise KeyError(f"No hourly output variable named {name}")
+        column = self.columns[index]
+        return column if isinstance(column, list) else memoryview(column)
+
+    def has_design_days(self) -> bool:
+        return self.row_count == DESIGN_DAY_ROW_COUNT
+
+    def annual(self, name: str) -> Sequence[Any]:
+        column = self.column(name)
+        return column[2 * HOURS_PER_DAY:] if self.has_design_days() else column
+
+    def design_days(self, name: str) -> Tuple[Sequence[Any], Sequence[Any]]:
+        # returns the cooling design day and the heating design day, which are empty when the results have none
+        if not self.has_design_days():
+            return [], []
+        column = self.column(name)
+        return column[:HOURS_PER_DAY], column[HOURS_PER_DAY:2 * HOURS_PER_DAY]
+
+    def split_design_days(self, name: str) -> Tuple[List[Any], List[Any], List[Any]]:
+        # returns the annual hourly values, the cooling design day and the heating design day as lists
+        design_cooling_hourly, design_heating_hourly = self.design_days(name)
+        return as_list(self.annual(name)), as_list(design_cooling_hourly), as_list(design_heating_hourly)
@@ -0,0 +1,154 @@
+from array import array
+from json import JSONDecodeError, JSONDecoder
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+from energyplus_rpd.compression import open_text
+
+CHUNK_SIZE = 1 << 20
+WHITESPACE = ' \t\n\r'
+
+ColumnSelector = Callable[[List[Dict[str, Any]]], Dict[str, int]]
+
+
+def typed_column(values: Sequence[Any]) -> Sequence[Any]:
+    # a column with a value that is not a number, such as null, is kept as it is
+    try:
+        return array('d', values)
+    except TypeError:
+        return list(values)
+
+
+class HourlyJsonStream:
+    """Incremental reader for the EnergyPlus hourly results JSON file
+
+    The file is read in chunks and each top level value, and each element of the Rows array, is decoded on its
+    own so the whole file is never held in memory as a string or as a parsed object.
+    """
+
+    def __init__(self, hourly_json_path: Path, chunk_size: int = CHUNK_SIZE):
+        self.hourly_json_path = hourly_json_path
+        self.chunk_size = chunk_size
+        self.decoder = JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        self.at_end_of_file = False
+        self.file = None
+
+    def _read_more(self) -> bool:
+        if self.at_end_of_file:
+            return False
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.at_end_of_file = True
+            return False
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return True
+
+    def _next_character(self) -> str:
+        # skips whitespace and returns the next significant character without consuming it
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in WHITESPACE:
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._read_more():
+                raise Exception(f"Unexpected end of hourly results file: {self.hourly_json_path}")
+
+    def _expect(self, character: str):
+        found = self._next_character()
+        if found != character:
+            raise Exception(f"Expected '{character}' but found '{found}' in hourly results file: "
+                            f"{self.hourly_json_path}")
+        self.position += 1
+
+    def _decode_value(self) -> Any:
+        self._next_character()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+                # a number that ends exactly at the end of the buffer may continue in the next chunk
+                if end < len(self.buffer) or self.at_end_of_file:
+                    self.position = end
+                    return value
+            except JSONDecodeError:
+                if self.at_end_of_file:
+                    raise
+            self._read_more()
+
+    def _iterate_array(self) -> Iterator[Any]:
+        self._expect('[')
+        if self._next_character() == ']':
+            self.position += 1
+            return
+        while True:
+            yield self._decode_value()
+            if self._next_character() == ',':
+                self.position += 1
+            else:
+                self._expect(']')
+                return
+
+    def iterate_members(self) -> Iterator[Tuple[str, Any]]:
+        # yields the top level keys with either their decoded value or, for Rows, an iterator over the rows
+        with open_text(self.hourly_json_path) as self.file:
+            self._expect('{')
+            if self._next_character() == '}':
+                return
+            while True:
+                key = self._decode_value()
+                self._expect(':')
+                if key == 'Rows' and self._next_character() == '[':
+                    rows = self._iterate_array()
+                    yield key, rows
+                    for _ in rows:  # skip whatever the caller did not consume
+                        pass
+                else:
+                    yield key, self._decode_value()
+                if self._next_character() == ',':
+                    self.position += 1
+                else:
+                    self._expect('}')
+                    return
+
+
+def load_hourly_columns(hourly_json_path: Path, select_columns: ColumnSelector,
+                        chunk_size: int = CHUNK_SIZE) -> Tuple[List[Dict[str, Any]], Dict[str, Sequence[Any]], int]:
+    """Streams the hourly results file and keeps only the columns chosen by select_columns
+
+    select_columns is given the Cols list and returns the index of each column to keep by name. The kept columns
+    are stored as array('d') so memory grows with the number of selected columns instead of with the file size. A
+    column with a value that is not a number, such as the null EnergyPlus writes for a missing value, is kept as a
+    list instead.
+    Returns the Cols list, the selected columns by name and the number of rows.
+    """
+    cols: List[Dict[str, Any]] = []
+    columns: Dict[str, Sequence[Any]] = {}
+    row_count = 0
+    unselected_rows: List[List[Any]] = []
+    for key, value in HourlyJsonStream(hourly_json_path, chunk_size).iterate_members():
+        if key == 'Cols':
+            cols = value
+        elif key == 'Rows':
+            if not cols:
+                # the rows came before the columns so they have to be kept until the columns are known
+                unselected_rows = [next(iter(row.values())) for row in value]
+                row_count = len(unselected_rows)
+                continue
+            column_by_name = select_columns(cols)
+            columns = {name: array('d') for name in column_by_name}
+            for row in value:
+                values_at_time_step = next(iter(row.values()))
+                for name, column_index in column_by_name.items():
+                    value = values_at_time_step[column_index]
+                    try:
+                        columns[name].append(value)
+                    except TypeError:
+                        columns[name] = columns[name].tolist() + [value]
+                row_count += 1
+    if unselected_rows:
+        column_by_name = select_columns(cols)
+        columns = {name: typed_column([values[column_index] for values in unselected_rows])
+                   for name, column_index in column_by_name.items()}
+    return cols, columns, row_count
@@ -0,0 +1,314 @@
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
+
+JsonDict = Dict[str, Any]
+NodeKey = Tuple[str, str]
+
+COMPONENT_LEVELS = (
+    ('Component Type', 'Component Name'),
+    ('Sub-Component Type', 'Sub-Component Name'),
+    ('Sub-Sub-Component Type', 'Sub-Sub-Component Name'),
+)
+
+OA_SYSTEM_TYPE = 'AIRLOOPHVAC:OUTDOORAIRSYSTEM'
+ZONE_EXHAUST_FAN_TYPE = 'FAN:ZONEEXHAUST'
+
+_roles_by_component_type: Dict[str, FrozenSet[str]] = {}
+
+
+def component_roles(component_type: str) -> FrozenSet[str]:
+    # the substring tests are done once for each distinct component type string
+    if component_type in _roles_by_component_type:
+        return _roles_by_component_type[component_type]
+    roles = set()
+    lower_type = component_type.lower()
+    if 'FAN:' in component_type:
+        roles.add('fan')
+    if component_type == ZONE_EXHAUST_FAN_TYPE:
+        roles.add('zone_exhaust_fan')
+    if 'COIL:COOLING:' in component_type:
+        roles.add('cooling_coil')
+    if 'COIL:HEATING:' in component_type:
+        roles.add('heating_coil')
+    if component_type == OA_SYSTEM_TYPE:
+        roles.add('oa_system')
+    if 'ZONEHVAC:AIRDISTRIBUTIONUNIT' in component_type:
+        roles.add('air_distribution_unit')
+    if 'VAV:' in component_type or 'PIU:' in component_type:
+        roles.add('vav')
+    if 'BASEBOARD:' in component_type:
+        roles.add('baseboard')
+    if 'RADIANT' in component_type:
+        roles.add('radiant')
+    if 'VARIABLEREFRIGERANTFLOW' in component_type:
+        roles.add('vrf')
+    if 'desiccant' in lower_type:
+        roles.add('desiccant')
+    if 'coilsystem:cooling:water:heatexchangerassisted ' in lower_type:
+        roles.add('heat_exchanger_assisted_cooling')
+    if 'humidifier:steam:' in lower_type:
+        roles.add('steam_humidifier')
+    frozen_roles = frozenset(roles)
+    _roles_by_component_type[component_type] = frozen_roles
+    return frozen_roles
+
+
+class TopologyRow:
+    """One row of an HVACTopology arrangement table with the roles of its three component levels"""
+
+    __slots__ = ('levels', 'roles')
+
+    def __init__(self, row: Mapping[str, Any]):
+        self.levels: List[Tuple[str, str]] = [(row.get(type_col, ''), row.get(name_col, ''))
+                                              for type_col, name_col in COMPONENT_LEVELS]
+        self.roles: List[FrozenSet[str]] = [component_roles(component_type) for component_type, _ in self.levels]
+
+    def first_name_with_role(self, role: str, first_level: int = 0) -> Optional[str]:
+        for level in range(first_level, len(self.levels)):
+            if role in self.roles[level]:
+                return self.levels[level][1]
+        return None
+
+    def has_role(self, role: str, first_level: int = 0) -> bool:
+        return any(role in roles for roles in self.roles[first_level:])
+
+
+class HvacTopology:
+    """Graph of the air side HVAC topology built in one pass over the HVACTopology tables
+
+    The nodes are airloops, outdoor air systems, components, terminals and zones keyed by (kind, name). The typed
+    edges connect an airloop to its supply components and outdoor air system, components to their sub-components,
+    an airloop to the terminals it serves, terminals to their zones and zones to their zone equipment. The
+    per-airloop and per-zone summaries used by the translator are derived while the graph is built.
+    """
+
+    def __init__(self, airloop_supplies: List[Mapping[str, Any]], airloop_demands: List[Mapping[str, Any]],
+                 zone_equipments: List[Mapping[str, Any]]):
+        self.nodes: Dict[NodeKey, JsonDict] = {}
+        self.edges: Dict[NodeKey, List[Tuple[str, NodeKey]]] = {}
+        # every (from, type, to) edge, so a repeated edge is found without scanning the edges of a node
+        self.edge_set: Set[Tuple[NodeKey, str, NodeKey]] = set()
+        self.edge_count = 0
+
+        self.supply_topology_by_airloop: Dict[str, JsonDict] = {}
+        self.return_fans_by_airloop: Dict[str, str] = {}
+        self.airloop_by_oa_system: Dict[str, str] = {}
+        self.dehumid_option_by_airloop: Dict[str, str] = {}
+        self.humid_option_by_airloop: Dict[str, str] = {}
+        self.zones_by_airloop: Dict[str, List[str]] = {}
+        self.zone_by_terminal: Dict[str, str] = {}
+        self.airloop_by_zone: Dict[str, str] = {}
+        self.airloop_by_zone_any_terminal: Dict[str, str] = {}
+        self.zone_equipment_by_zone: Dict[str, List[JsonDict]] = {}
+        self.exhaust_fan_by_zone: Dict[str, str] = {}
+        self.exhaust_fans_by_airloop: Dict[str, List[str]] = {}
+
+        self._add_supply_side(airloop_supplies)
+        self._add_demand_side(airloop_demands)
+        self._add_zone_equipment(zone_equipments)
+
+    def add_node(self, kind: str, name: str, component_type: str = '') -> NodeKey:
+        key = (kind, name)
+        if key not in self.nodes:
+            self.nodes[key] = {'kind': kind, 'name': name, 'type': component_type}
+            self.edges[key] = []
+        return key
+
+    def add_edge(self, edge_type: str, from_key: NodeKey, to_key: NodeKey):
+        edge = (from_key, edge_type, to_key)
+        if edge not in self.edge_set:
+            self.edge_set.add(edge)
+            self.edges[from_key].append((edge_type, to_key))
+            self.edge_count += 1
+
+    def neighbors(self, key: NodeKey, edge_type: Optional[str] = None) -> List[NodeKey]:
+        return [to_key for current_type, to_key in self.edges.get(key, []) if edge_type in (None, current_type)]
+
+    def _add_component_chain(self, parent_key: NodeKey, edge_type: str, topology_row: TopologyRow):
+        # link each non-blank component level to the level above it
+        for level, (component_type, name) in enumerate(topology_row.levels):
+            if not name:
+                continue
+            kind = 'oa_system' if 'oa_system' in topology_row.roles[level] else 'component'
+            key = self.add_node(kind, name, component_type)
+            self.add_edge(edge_type if level == 0 else 'contains', parent_key, key)
+            parent_key = key
+
+    def _add_supply_side(self, airloop_supplies: List[Mapping[str, Any]]):
+        top: JsonDict = {}
+        oa_found = False
+        heat_coil_found = False
+        blank_row = False
+        row_total = len(airloop_supplies)
+        for row_count, airloop_supply in enumerate(airloop_supplies):
+            current_airloop_name = airloop_supply.get('Airloop Name', '')
+            topology_row = TopologyRow(airloop_supply)
+            airloop_key = self.add_node('airloop', current_airloop_name)
+            self._add_component_chain(airloop_key, 'supplies', topology_row)
+            component_type, component_name = topology_row.levels[0]
+
+            # outside air systems used by the economizers
+            if component_type == OA_SYSTEM_TYPE and topology_row.levels[1][0] == '':
+                self.airloop_by_oa_system[component_name] = current_airloop_name
+                self.add_edge('has_oa_system', airloop_key, self.add_node('oa_system', component_name, component_type))
+
+            if topology_row.has_role('desiccant'):
+                self.dehumid_option_by_airloop[current_airloop_name] = 'DESICCANT'
+            elif 'heat_exchanger_assisted_cooling' in topology_row.roles[0]:
+                self.dehumid_option_by_airloop[current_airloop_name] = 'SERIES_HEAT_RECOVERY'
+            if topology_row.has_role('steam_humidifier'):
+                self.humid_option_by_airloop[current_airloop_name] = 'OTHER'
+
+            # a fan on the first row after a blank row could be a return fan
+            if airloop_supply.get('Supply Branch Name', ''):
+                if blank_row:
+                    if 'fan' in topology_row.roles[0]:
+                        self.return_fans_by_airloop[current_airloop_name] = component_name
+                    elif 'fan' in topology_row.roles[1]:
+                        self.return_fans_by_airloop[current_airloop_name] = topology_row.levels[1][1]
+                blank_row = False
+            else:
+                # if empty string then the row is blank except for airloop name
+                blank_row = True
+
+            # find outside air system
+            if any(level_type == OA_SYSTEM_TYPE for level_type, _ in topology_row.levels):
+                oa_found = True
+
+            # find fan(s)
+            name = topology_row.first_name_with_role('fan')
+            if name is not None:
+                if oa_found:
+                    top['supply_fan'] = name
+                else:
+                    top['return_fan'] = name
+
+            # find cooling coils
+            name = topology_row.first_name_with_role('cooling_coil')
+            if name is not None:
+                top['cooling_coil'] = name
+
+            # find heating coil(s)
+            name = topology_row.first_name_with_role('heating_coil')
+            if name is not None:
+                if heat_coil_found:
+                    top['backup_heating_coil'] = name
+                else:
+                    top['main_heating_coil'] = name
+                heat_coil_found = True
+
+            if (row_count == row_total - 1) or (
+                    current_airloop_name != airloop_supplies[row_count + 1].get('Airloop Name', '')):
+                oa_found = False
+                heat_coil_found = False
+                if top:  # add the current airloop topology unless empty (first iteration)
+
+                    # if no supply fan ever found but return fan was, assume classified wrong
+                    if 'supply_fan' not in top and 'return_fan' in top:
+                        top['supply_fan'] = top['return_fan']
+                        del top['return_fan']
+
+                    # add to dictionary across all airloops
+                    self.supply_topology_by_airloop[current_airloop_name] = top
+                    top = {}
+
+    def _add_demand_side(self, airloop_demands: List[Mapping[str, Any]]):
+        has_rows = bool(airloop_demands) and airloop_demands[0].get('first column') != 'None'
+        for airloop_demand in airloop_demands:
+            current_air_loop = airloop_demand.get('Airloop Name', '')
+            zone_name = airloop_demand.get('Zone Name', '')
+            terminal_name = airloop_demand.get('Terminal Unit Name', '')
+            if has_rows and zone_name:
+                self.airloop_by_zone_any_terminal[zone_name] = current_air_loop
+            if zone_name and terminal_name:
+                airloop_key = self.add_node('airloop', current_air_loop)
+                terminal_key = self.add_node('terminal', terminal_name, airloop_demand.get('Terminal Unit Type', ''))
+                zone_key = self.add_node('zone', zone_name)
+                self.add_edge('serves', airloop_key, terminal_key)
+                self.add_edge('terminal_for', terminal_key, zone_key)
+                self.zone_by_terminal[terminal_name] = zone_name
+                self.airloop_by_zone[zone_name] = current_air_loop
+                if current_air_loop in self.zones_by_airloop:
+                    self.zones_by_airloop[current_air_loop].append(zone_name)
+                else:
+                    self.zones_by_airloop[current_air_loop] = [zone_name, ]
+
+    def _add_zone_equipment(self, zone_equipments: List[Mapping[str, Any]]):
+        ze: JsonDict = {}
+        heat_coil_found = False
+        component_group_list: List[Tuple[str, str]] = []
+        exhaust_fans_by_zone: List[Tuple[str, str]] = []
+        row_total = len(zone_equipments)
+        for row_count, zone_equipment in enumerate(zone_equipments):
+            zone_name = zone_equipment.get('Zone Name', '')
+            topology_row = TopologyRow(zone_equipment)
+            component_type, component_name = topology_row.levels[0]
+            zone_key = self.add_node('zone', zone_name)
+            self._add_component_chain(zone_key, 'zone_equipment', topology_row)
+
+            if component_type == ZONE_EXHAUST_FAN_TYPE:
+                self.exhaust_fan_by_zone[zone_name] = component_name
+            # only look in nested sub and sub-sub components for the exhaust fans connected to airloops
+            if topology_row.levels[1][0] == ZONE_EXHAUST_FAN_TYPE:
+                exhaust_fans_by_zone.append((zone_name, topology_row.levels[1][1]))
+            elif topology_row.levels[2][0] == ZONE_EXHAUST_FAN_TYPE:
+                exhaust_fans_by_zone.append((zone_name, topology_row.levels[2][1]))
+
+            if 'air_distribution_unit' in topology_row.roles[0]:
+                ze['has_ADU'] = True
+
+            name = topology_row.first_name_with_role('fan', 1)
+            if name is not None:
+                ze['fan'] = name
+
+            name = topology_row.first_name_with_role('heating_coil', 1)
+            if name is not None:
+                if heat_coil_found:
+                    ze['backup_heating_coil'] = name
+                else:
+                    ze['main_heating_coil'] = name
+                heat_coil_found = True
+
+            name = topology_row.first_name_with_role('cooling_coil', 1)
+            if name is not None:
+                ze['cooling_coil'] = name
+
+            if topology_row.has_role('vav', 1):
+                ze['has_vav'] = True
+
+            if topology_row.has_role('baseboard'):
+                ze['has_baseboard'] = True
+            # use elif here since some baseboards also use term radiant
+            elif topology_row.has_role('radiant'):
+                ze['has_radiant'] = True
+
+            if topology_row.has_role('vrf'):
+                ze['has_vrf'] = True
+
+            for component_group in topology_row.levels:
+                if component_group not in component_group_list and component_group != ('', ''):
+                    component_group_list.append(component_group)
+
+            #  when new zone equipment component name or end of list
+            if (row_count == row_total - 1) or (
+                    component_name != zone_equipments[row_count + 1].get('Component Name', '')):
+                heat_coil_found = False
+                if component_group_list:
+                    ze['component_group_list'] = component_group_list
+                    component_group_list = []
+                    if zone_name in self.zone_equipment_by_zone:
+                        self.zone_equipment_by_zone[zone_name].append(ze)
+                    else:
+                        self.zone_equipment_by_zone[zone_name] = [ze, ]
+                ze = {}
+
+        for zone_name, fan_name in exhaust_fans_by_zone:
+            if zone_name in self.airloop_by_zone_any_terminal:
+                airloop = self.airloop_by_zone_any_terminal[zone_name]
+                self.add_edge('exhausts', ('zone', zone_name), self.add_node('component', fan_name))
+                if airloop not in self.exhaust_fans_by_airloop:
+                    self.exhaust_fans_by_airloop[airloop] = [fan_name, ]
+                else:
+                    self.exhaust_fans_by_airloop[airloop].append(fan_name)
+
+    def summary(self) -> str:
+        return f'hvac topology: {len(self.nodes)} nodes, {self.edge_count} edges'
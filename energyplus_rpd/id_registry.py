@@ -0,0 +1,67 @@
+from typing import Any, Dict, FrozenSet, Iterable, List, Set
+
+SERIAL_NUMBER_SEPARATOR = '~~~'
+SERIAL_NUMBER_DIGITS = 8
+
+
+class IdRegistry:
+    """Keeps every id used in a model description and makes repeated ids unique with a serial number suffix
+
+    The first use of an id keeps it as is. A repeated id, or one that already has a '~~~' suffix, gets the next
+    serial number as an eight digit '~~~NNNNNNNN' suffix. Values under the keys in skipped_keys, which the schema
+    defines as arrays of numbers such as hourly_values, cannot hold ids and are not visited by assign_nested.
+    """
+
+    def __init__(self, skipped_keys: Iterable[str] = ()):
+        self.skipped_keys: FrozenSet[str] = frozenset(skipped_keys)
+        self.id_used: Set[str] = set()
+        self.serial_number = 0
+
+    def assign(self, original_id: str) -> str:
+        index = original_id.rfind(SERIAL_NUMBER_SEPARATOR)
+        if index == -1:
+            if original_id not in self.id_used:
+                self.id_used.add(original_id)
+                return original_id
+            root_id = original_id
+        else:
+            root_id = original_id[:index]
+        self.serial_number += 1
+        new_id = root_id + SERIAL_NUMBER_SEPARATOR + str(self.serial_number).zfill(SERIAL_NUMBER_DIGITS)
+        self.id_used.add(new_id)
+        return new_id
+
+    def assign_nested(self, in_dict: Dict[str, Any], key: str = 'id'):
+        # ids are assigned in the order of a depth first walk so the same model always gets the same ids
+        skipped_keys = self.skipped_keys
+        for k, v in in_dict.items():
+            if key == k:
+                in_dict[k] = self.assign(v)
+            elif k in skipped_keys:
+                continue
+            elif isinstance(v, dict):
+                self.assign_nested(v, key)
+            elif isinstance(v, list):
+                for o in v:
+                    if isinstance(o, dict):
+                        self.assign_nested(o, key)
+
+
+def find_duplicate_ids(in_dict: Dict[str, Any], key: str = 'id') -> List[str]:
+    """Walks every dictionary and list, without skipping any, and returns the ids that are used more than once"""
+    seen: Set[str] = set()
+    duplicates: List[str] = []
+    pending: List[Any] = [in_dict]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, dict):
+            for k, v in value.items():
+                if k == key and isinstance(v, str):
+                    if v in seen:
+                        duplicates.append(v)
+                    seen.add(v)
+                elif isinstance(v, (dict, list)):
+                    pending.append(v)
+        elif isinstance(value, list):
+            pending.extend(o for o in value if isinstance(o, (dict, list)))
+    return duplicates
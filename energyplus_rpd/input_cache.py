@@ -0,0 +1,153 @@
+import hashlib
+import os
+import pickle
+import struct
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from energyplus_rpd.hourly_store import HourlyStore
+
+CACHE_FORMAT = b'EPRPDIN1'
+ENTRY_SUFFIX = '.pickle'
+HASH_CHUNK_SIZE = 1 << 20
+ALIGNMENT = 8
+# the format name, then the sizes of the sources, the pickled body and the number of out-of-band buffers
+HEADER = struct.Struct('<8sQQQ')
+BUFFER_SIZE = struct.Struct('<Q')
+
+JsonDict = Dict[str, Any]
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as input_file:
+        for chunk in iter(lambda: input_file.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def describe_source(path: Path) -> JsonDict:
+    status = path.stat()
+    return {'path': str(path.absolute()), 'size': status.st_size, 'mtime': status.st_mtime_ns,
+            'sha256': file_digest(path)}
+
+
+def is_source_unchanged(source: JsonDict) -> bool:
+    # the hash is only computed when the size matches but the modification time does not, as after a copy
+    try:
+        status = os.stat(source['path'])
+    except FileNotFoundError:
+        return False
+    if status.st_size != source['size']:
+        return False
+    if status.st_mtime_ns == source['mtime']:
+        return True
+    return file_digest(Path(source['path'])) == source['sha256']
+
+
+def padding(size: int) -> bytes:
+    return b'\0' * (-size % ALIGNMENT)
+
+
+class InputCache:
+    """Keeps the parsed input files of each model in a directory so they are not parsed again until they change
+
+    Each entry is a pickle, protocol 5, of the epJSON object, the results object and the columns of the hourly store,
+    under the absolute path of the epJSON file. The columns are written as out-of-band buffers after the pickle, so
+    loading an entry reads the file once and each column is a memoryview of its doubles in that data with no further
+    copy. An entry is used only when the size and modification time, or else the sha256, of each source file still
+    match.
+    """
+
+    def __init__(self, cache_dir: Path):
+        if not hasattr(pickle, 'PickleBuffer'):
+            raise Exception("The input cache needs pickle protocol 5, which is available from Python 3.8")
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def entry_path(self, epjson_file_path: Path) -> Path:
+        name = hashlib.sha256(str(epjson_file_path.absolute()).encode()).hexdigest()
+        return self.cache_dir / (name + ENTRY_SUFFIX)
+
+    def load(self, source_paths: List[Path], with_hourly_store: bool) -> Optional[JsonDict]:
+        """Returns the entry for the source files, the epJSON file first, or None when there is no current entry
+
+        The hourly_store of the entry is None when it was saved while streaming the hourly results.
+        """
+        entry = self._read(self.entry_path(source_paths[0]), source_paths, with_hourly_store)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    @staticmethod
+    def _read(entry_path: Path, source_paths: List[Path], with_hourly_store: bool) -> Optional[JsonDict]:
+        if not entry_path.exists():
+            return None
+        try:
+            with open(entry_path, 'rb') as entry_file:
+                cache_format, sources_size, body_size, buffer_count = HEADER.unpack(entry_file.read(HEADER.size))
+                if cache_format != CACHE_FORMAT:
+                    return None
+                sources = pickle.loads(entry_file.read(sources_size))
+                if [source['path'] for source in sources] != [str(path.absolute()) for path in source_paths]:
+                    return None
+                if not all(is_source_unchanged(source) for source in sources):
+                    return None
+                buffer_sizes = [BUFFER_SIZE.unpack(entry_file.read(BUFFER_SIZE.size))[0] for _ in range(buffer_count)]
+                data = memoryview(entry_file.read())
+            buffers = []
+            offset = body_size + len(padding(body_size))
+            for buffer_size in buffer_sizes:
+                buffers.append(data[offset:offset + buffer_size])
+                offset += buffer_size + len(padding(buffer_size))
+            if offset != len(data):
+                raise Exception(f"expected {offset} bytes after the header but found {len(data)}")
+            entry = pickle.loads(data[:body_size], buffers=buffers)
+        except Exception as e:
+            # a damaged entry is parsed again from the source files and replaced
+            print(f"Could not read input cache entry {entry_path}; error: {e}")
+            return None
+        hourly_columns = entry.pop('hourly_columns')
+        entry['hourly_store'] = None
+        if hourly_columns is None:
+            if with_hourly_store:
+                return None
+        else:
+            entry['hourly_store'] = HourlyStore(hourly_columns['Cols'], hourly_columns['Timestamps'],
+                                                [column.cast('d') for column in hourly_columns['Columns']])
+        return entry
+
+    def save(self, source_paths: List[Path], epjson_object: JsonDict, json_results_object: JsonDict,
+             hourly_store: Optional[HourlyStore]):
+        # the columns of the hourly store have to be arrays of doubles, see HourlyStore.is_numeric
+        entry = {'epjson': epjson_object, 'results': json_results_object, 'hourly_columns': None}
+        if hourly_store is not None:
+            out_of_band_columns = [pickle.PickleBuffer(column) for column in hourly_store.columns]
+            entry['hourly_columns'] = {'Cols': hourly_store.cols, 'Timestamps': hourly_store.timestamps,
+                                       'Columns': out_of_band_columns}
+        buffers: List[pickle.PickleBuffer] = []
+        body = pickle.dumps(entry, protocol=5, buffer_callback=buffers.append)
+        sources = pickle.dumps([describe_source(path) for path in source_paths], protocol=5)
+        entry_path = self.entry_path(source_paths[0])
+        # written to a temporary file and renamed so other processes and threads never read part of an entry
+        temporary_path = entry_path.with_name(f'{entry_path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        with open(temporary_path, 'wb') as entry_file:
+            entry_file.write(HEADER.pack(CACHE_FORMAT, len(sources), len(body), len(buffers)))
+            entry_file.write(sources)
+            for buffer in buffers:
+                entry_file.write(BUFFER_SIZE.pack(buffer.raw().nbytes))
+            entry_file.write(body)
+            entry_file.write(padding(len(body)))
+            for buffer in buffers:
+                raw = buffer.raw()
+                entry_file.write(raw)
+                entry_file.write(padding(raw.nbytes))
+        os.replace(temporary_path, entry_path)
+
+    def summary(self) -> str:
+        return f'input cache: {self.hits} hits, {self.misses} misses in {self.cache_dir}'
@@ -1,63 +1,192 @@
-from json import loads
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+from energyplus_rpd.compression import find_plain_or_compressed, read_text, without_compression_suffix
+from energyplus_rpd.hourly_store import HourlyStore
+from energyplus_rpd.input_cache import InputCache
+from energyplus_rpd.json_codec import loads
+
+# the names of the load times, in the order they are reported
+LOAD_TIME_NAMES = ('cache', 'epjson', 'results', 'hourly')
+
+
+def parse_json_file(path: Path) -> Any:
+    return loads(read_text(path))
+
+
+def parse_json_object(value: Any) -> Any:
+    # an open file, in text or binary mode, is parsed and anything else is taken to be parsed already
+    if hasattr(value, 'read'):
+        return loads(value.read())
+    return value
+
+
+def find_results_json_path(epjson_file_path: Path) -> Path:
+    epjson_file_path = without_compression_suffix(epjson_file_path)
+    json_results_input_path = epjson_file_path.with_suffix(".json")
+    found_path = find_plain_or_compressed(json_results_input_path)
+
+    if found_path is None:
+        # Try with the "out.json" suffix
+        json_results_input_path = epjson_file_path.with_name(epjson_file_path.stem + "out.json")
+        found_path = find_plain_or_compressed(json_results_input_path)
+        if found_path is None:
+            # Finally, check for the "eplusout.json" file
+            found_path = find_plain_or_compressed(epjson_file_path.parent / "eplusout.json")
+            if found_path is None:
+                raise Exception(
+                    f"Could not find EnergyPlus results JSON file at path: {json_results_input_path}"
+                )
+    return found_path
+
+
+def find_hourly_results_json_path(epjson_file_path: Path) -> Path:
+    epjson_file_path = without_compression_suffix(epjson_file_path)
+    json_hourly_results_input_path = epjson_file_path.with_name(epjson_file_path.stem + "_hourly.json")
+    found_path = find_plain_or_compressed(json_hourly_results_input_path)
+    if found_path is None:
+        json_hourly_results_input_path = epjson_file_path.with_name(epjson_file_path.stem + "out_hourly.json")
+        found_path = find_plain_or_compressed(json_hourly_results_input_path)
+        if found_path is None:
+            found_path = find_plain_or_compressed(epjson_file_path.parent / "eplusout_hourly.json")
+            if found_path is None:
+                raise Exception(
+                    f"Could not find EnergyPlus hourly results json file at path: "
+                    f"{json_hourly_results_input_path}")
+    return found_path
 
 
 class InputFile:
 
-    def __init__(self, epjson_file_path: Path):
-        self._load_epjson(epjson_file_path)
-        self._load_output_json(epjson_file_path)
-        self._load_hourly_output_json(epjson_file_path)
+    def __init__(self, epjson_file_path: Path, stream_hourly: bool = False, cache: Optional[InputCache] = None,
+                 concurrent: bool = False, process_min_bytes: Optional[int] = None):
+        # when streaming, the hourly results file is only located here and is read later by HourlyStore.from_stream
+        # each file may also be compressed with gzip, bzip2 or xz, as in eplusout.json.gz
+        # with a cache, the hourly results are kept as columns in hourly_store instead of as rows
+        # the three files are loaded at the same time on threads when concurrent is True, and files of at least
+        # process_min_bytes are parsed in a process of their own so they do not wait on each other for the GIL
+        self.stream_hourly = stream_hourly
+        self.process_min_bytes = process_min_bytes
+        self.hourly_store: Optional[HourlyStore] = None
+        # the seconds taken to load each file, or to read the cache entry, and in total
+        self.load_times: Dict[str, float] = {}
+        self.load_time = 0.
+        start = perf_counter()
+        if cache is not None and self._load_from_cache(epjson_file_path, cache):
+            self.load_times['cache'] = perf_counter() - start
+            self.load_time = self.load_times['cache']
+            return
+        loaders = [self._load_epjson, self._load_output_json, self._load_hourly_output_json]
+        if concurrent:
+            with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+                futures = [executor.submit(loader, epjson_file_path) for loader in loaders]
+            # the first error, in the order the files are listed, is raised as if they were loaded one by one
+            for future in futures:
+                future.result()
+        else:
+            for loader in loaders:
+                loader(epjson_file_path)
+        if cache is not None:
+            if not self.stream_hourly:
+                self.hourly_store = HourlyStore.from_object(self.json_hourly_results_object)
+                self.json_hourly_results_object = {'Cols': self.hourly_store.cols}
+            # columns with values that are not numbers cannot be kept as arrays of doubles
+            if self.stream_hourly or self.hourly_store.is_numeric():
+                cache.save(self.source_paths(epjson_file_path), self.epjson_object, self.json_results_object,
+                           self.hourly_store)
+        self.load_time = perf_counter() - start
+
+    @classmethod
+    def from_objects(cls, epjson: Any, json_results: Any, json_hourly_results: Any) -> 'InputFile':
+        """Returns the inputs of a model that are already in memory, without reading or writing any file
+
+        Each input is either the parsed JSON object or an open file, in text or binary mode, to parse it from.
+        """
+        input_file = cls.__new__(cls)
+        input_file.stream_hourly = False
+        input_file.process_min_bytes = None
+        input_file.hourly_store = None
+        input_file.json_results_input_path = None
+        input_file.json_hourly_results_input_path = None
+        input_file.load_times = {}
+        start = perf_counter()
+        input_file.epjson_object = parse_json_object(epjson)
+        input_file.json_results_object = parse_json_object(json_results)
+        input_file.json_hourly_results_object = parse_json_object(json_hourly_results)
+        input_file.load_time = perf_counter() - start
+        return input_file
+
+    def source_paths(self, epjson_file_path: Path) -> List[Path]:
+        return [epjson_file_path, self.json_results_input_path, self.json_hourly_results_input_path]
+
+    def timing_summary(self) -> str:
+        file_times = ', '.join(f'{name} {self.load_times[name]:.3f} s' for name in LOAD_TIME_NAMES
+                               if name in self.load_times)
+        return f'input files: loaded in {self.load_time:.3f} s ({file_times})'
+
+    def _parse_json_file(self, path: Path) -> Any:
+        if self.process_min_bytes is not None and path.stat().st_size >= self.process_min_bytes:
+            # multiprocessing is only imported when it is used since it slows down the start up
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                return executor.submit(parse_json_file, path).result()
+        return parse_json_file(path)
+
+    def _load_from_cache(self, epjson_file_path: Path, cache: InputCache) -> bool:
+        # any file that is missing is reported by the loaders below
+        if not epjson_file_path.exists():
+            return False
+        try:
+            self.json_results_input_path = find_results_json_path(epjson_file_path)
+            self.json_hourly_results_input_path = find_hourly_results_json_path(epjson_file_path)
+        except Exception:
+            return False
+        entry = cache.load(self.source_paths(epjson_file_path), not self.stream_hourly)
+        if entry is None:
+            return False
+        self.epjson_object = entry['epjson']
+        self.json_results_object = entry['results']
+        self.json_hourly_results_object = {}
+        if not self.stream_hourly:
+            self.hourly_store = entry['hourly_store']
+            self.json_hourly_results_object = {'Cols': self.hourly_store.cols}
+        return True
 
     def _load_epjson(self, epjson_file_path: Path):
+        start = perf_counter()
         if not epjson_file_path.exists():
             raise Exception(f"Could not find input file at path: {epjson_file_path}")
         try:
-            epjson_contents = epjson_file_path.read_text()
-            self.epjson_object = loads(epjson_contents)
+            self.epjson_object = self._parse_json_file(epjson_file_path)
         except Exception as e:
             print(f"Could not process input file into JSON object; error: {e}")
             raise
+        self.load_times['epjson'] = perf_counter() - start
 
     def _load_output_json(self, epjson_file_path: Path):
-        self.json_results_input_path = epjson_file_path.with_suffix(".json")
-
-        if not self.json_results_input_path.exists():
-            # Try with the "out.json" suffix
-            self.json_results_input_path = epjson_file_path.with_name(epjson_file_path.stem + "out.json")
-            if not self.json_results_input_path.exists():
-                # Finally, check for the "eplusout.json" file
-                eplusout_path = epjson_file_path.parent / "eplusout.json"
-                if eplusout_path.exists():
-                    self.json_results_input_path = eplusout_path
-                else:
-                    raise Exception(
-                        f"Could not find EnergyPlus results JSON file at path: {self.json_results_input_path}"
-                    )
+        start = perf_counter()
+        self.json_results_input_path = find_results_json_path(epjson_file_path)
 
         # Try to read and parse the JSON file
         try:
-            self.json_result_file_contents = self.json_results_input_path.read_text()
-            self.json_results_object = loads(self.json_result_file_contents)
+            self.json_results_object = self._parse_json_file(self.json_results_input_path)
         except Exception as e:
             print(f"Could not process results file into JSON object; error: {e}")
             raise
+        self.load_times['results'] = perf_counter() - start
 
     def _load_hourly_output_json(self, epjson_file_path):
-        self.json_hourly_results_input_path = epjson_file_path.with_name(epjson_file_path.stem + "_hourly.json")
-        if not self.json_hourly_results_input_path.exists():
-            self.json_hourly_results_input_path = epjson_file_path.with_name(epjson_file_path.stem + "out_hourly.json")
-            if not self.json_hourly_results_input_path.exists():
-                eplusout_path = epjson_file_path.parent / "eplusout_hourly.json"
-                if eplusout_path.exists():
-                    self.json_hourly_results_input_path = eplusout_path
-                else:
-                    raise Exception(
-                        f"Could not find EnergyPlus hourly results json file at path: "
-                        f"{self.json_hourly_results_input_path}")
+        start = perf_counter()
+        self.json_hourly_results_input_path = find_hourly_results_json_path(epjson_file_path)
+        if self.stream_hourly:
+            self.json_hourly_results_object = {}
+            return
         try:
-            self.json_hourly_result_file_contents = self.json_hourly_results_input_path.read_text()
-            self.json_hourly_results_object = loads(self.json_hourly_result_file_contents)
+            # the file contents are not kept since the hourly file can be very large
+            self.json_hourly_results_object = self._parse_json_file(self.json_hourly_results_input_path)
         except Exception as e:
             print(f"Could not process hourly results file into JSON object; error: {e}")
             raise
+        self.load_times['hourly'] = perf_counter() - start
@@ -0,0 +1,111 @@
+import json
+from os import environ
+from typing import Any, Callable, List, Optional
+
+# the backends in the order they are tried, the standard library json module is always available
+BACKEND_NAMES = ['orjson', 'ujson', 'stdlib']
+BACKEND_ENVIRONMENT_VARIABLE = 'ENERGYPLUS_RPD_JSON_BACKEND'
+CONTAINER_TYPES = (dict, list, tuple)
+
+_default_codec: Optional['JsonCodec'] = None
+
+
+def stdlib_dumps(value: Any) -> str:
+    return json.dumps(value, separators=(',', ':'))
+
+
+def stdlib_dumps_indented(value: Any) -> str:
+    # a container of scalars is encoded by the C encoder, with the newline and indent as its item separator
+    if isinstance(value, CONTAINER_TYPES) and value:
+        children = value.values() if isinstance(value, dict) else value
+        if not any(isinstance(child, CONTAINER_TYPES) for child in children):
+            text = json.dumps(value, separators=(',\n  ', ': '))
+            return text[0] + '\n  ' + text[1:-1] + '\n' + text[-1]
+    return json.dumps(value, indent=2)
+
+
+class JsonCodec:
+    """Parses and encodes JSON with orjson or ujson when one of them is installed, or with the json module
+
+    Encoding is compact, with no whitespace, or indented by two spaces like json.dumps(value, indent=2). The fast
+    backends write numbers in their own way, for example 1e16 instead of 1e+16, and write text as UTF-8 instead of
+    escaping it. Whatever a fast backend cannot handle, such as an integer too large for 64 bits, is handed to the
+    json module.
+    """
+
+    def __init__(self, backend_name: str):
+        self.name = backend_name
+        self._loads: Callable[[Any], Any] = json.loads
+        self._dumps: Callable[[Any], str] = stdlib_dumps
+        self._dumps_indented: Callable[[Any], str] = stdlib_dumps_indented
+        if backend_name == 'orjson':
+            import orjson
+            self._loads = orjson.loads
+            self._dumps = lambda value: orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+            self._dumps_indented = lambda value: orjson.dumps(
+                value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2).decode()
+        elif backend_name == 'ujson':
+            import ujson
+            self._loads = ujson.loads
+            self._dumps = lambda value: ujson.dumps(value, ensure_ascii=False, escape_forward_slashes=False)
+            self._dumps_indented = lambda value: ujson.dumps(value, ensure_ascii=False, escape_forward_slashes=False,
+                                                             indent=2)
+        elif backend_name != 'stdlib':
+            raise Exception(f"Unknown JSON backend: {backend_name}, expected one of {BACKEND_NAMES}")
+
+    def loads(self, text: Any) -> Any:
+        try:
+            return self._loads(text)
+        except ValueError:
+            if self._loads is json.loads:
+                raise
+            # for example NaN, which the json module accepts, the error message comes from the json module too
+            return json.loads(text)
+
+    def dumps(self, value: Any) -> str:
+        try:
+            return self._dumps(value)
+        except (TypeError, ValueError, OverflowError):
+            return stdlib_dumps(value)
+
+    def dumps_indented(self, value: Any) -> str:
+        try:
+            return self._dumps_indented(value)
+        except (TypeError, ValueError, OverflowError):
+            return stdlib_dumps_indented(value)
+
+
+def available_backend_names() -> List[str]:
+    names = []
+    for name in BACKEND_NAMES:
+        try:
+            JsonCodec(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_codec() -> JsonCodec:
+    """Returns the codec used by the whole process
+
+    The backend named in the ENERGYPLUS_RPD_JSON_BACKEND environment variable is used if it is set, otherwise the
+    first backend that is installed.
+    """
+    global _default_codec
+    if _default_codec is None:
+        backend_name = environ.get(BACKEND_ENVIRONMENT_VARIABLE) or available_backend_names()[0]
+        _default_codec = JsonCodec(backend_name)
+    return _default_codec
+
+
+def loads(text: Any) -> Any:
+    return get_codec().loads(text)
+
+
+def dumps(value: Any) -> str:
+    return get_codec().dumps(value)
+
+
+def dumps_indented(value: Any) -> str:
+    return get_codec().dumps_indented(value)
@@ -1,11 +1,96 @@
-from json import dumps
 from pathlib import Path
-from typing import Dict
+from time import perf_counter
+from typing import Any, Dict, Iterator, Optional
+
+from energyplus_rpd.compression import GZIP_SUFFIX, open_text, without_compression_suffix
+from energyplus_rpd.json_codec import JsonCodec, get_codec
+
+CHUNK_SIZE = 1 << 20
+INDENT = '  '
+CONTAINER_TYPES = (dict, list, tuple)
+
+
+def encode_key(key: Any, codec: JsonCodec) -> str:
+    # keys that are not strings are converted the way json.dumps converts them
+    if not isinstance(key, str):
+        key = codec.dumps(key)
+    return codec.dumps(key)
+
+
+def iterencode(value: Any, compact: bool = False, level: int = 0, codec: Optional[JsonCodec] = None) -> Iterator[str]:
+    """Yields the JSON text of value in pieces
+
+    With the json module as the codec, pretty text is the same as json.dumps(value, indent=2) and compact text the
+    same as json.dumps(value, separators=(',', ':')). Dictionaries and lists that hold no other dictionaries or
+    lists, such as the hourly values of a schedule, are encoded by a single call to the codec so they are written at
+    the speed of its encoder, while the containers above them are walked here so the whole text is never built in
+    memory.
+    """
+    if codec is None:
+        codec = get_codec()
+    if isinstance(value, dict):
+        children = value.values()
+    elif isinstance(value, (list, tuple)):
+        children = value
+    else:
+        yield codec.dumps(value)
+        return
+    if not children:
+        yield '{}' if isinstance(value, dict) else '[]'
+        return
+    outer_pad = '\n' + INDENT * level
+    inner_pad = outer_pad + INDENT
+    if not any(isinstance(child, CONTAINER_TYPES) for child in children):
+        if compact:
+            yield codec.dumps(value)
+        else:
+            # newlines in JSON text can only be the ones of the indentation, strings escape theirs
+            yield codec.dumps_indented(value).replace('\n', outer_pad)
+        return
+    open_bracket, close_bracket = ('{', '}') if isinstance(value, dict) else ('[', ']')
+    item_separator = ',' if compact else ',' + inner_pad
+    key_separator = ':' if compact else ': '
+    yield open_bracket if compact else open_bracket + inner_pad
+    if isinstance(value, dict):
+        for index, (key, child) in enumerate(value.items()):
+            yield (item_separator if index else '') + encode_key(key, codec) + key_separator
+            yield from iterencode(child, compact, level + 1, codec)
+    else:
+        for index, child in enumerate(value):
+            if index:
+                yield item_separator
+            yield from iterencode(child, compact, level + 1, codec)
+    yield close_bracket if compact else outer_pad + close_bracket
 
 
 class OutputFile:
-    def __init__(self, epjson_file_path: Path):
-        self.rpd_file_path = epjson_file_path.with_suffix('.rpd')
+    def __init__(self, epjson_file_path: Path, compact=False, compress=False, codec: Optional[JsonCodec] = None):
+        self.rpd_file_path = without_compression_suffix(epjson_file_path).with_suffix('.rpd')
+        if compress:
+            self.rpd_file_path = self.rpd_file_path.with_name(self.rpd_file_path.name + GZIP_SUFFIX)
+        # compact output has no whitespace, pretty output is indented for people to read
+        self.compact = compact
+        self.codec = codec
+        self.bytes_written = 0
+        self.encode_time = 0.
 
     def write(self, json_data: Dict):
-        self.rpd_file_path.write_text(dumps(json_data, indent=2))
+        # the text is written in chunks as it is encoded instead of being built as one string first
+        start = perf_counter()
+        with open_text(self.rpd_file_path, 'w', encoding='utf-8') as rpd_file:
+            pieces = []
+            pending_size = 0
+            for piece in iterencode(json_data, self.compact, codec=self.codec):
+                pieces.append(piece)
+                pending_size += len(piece)
+                if pending_size >= CHUNK_SIZE:
+                    rpd_file.write(''.join(pieces))
+                    pieces = []
+                    pending_size = 0
+            rpd_file.write(''.join(pieces))
+        self.bytes_written = self.rpd_file_path.stat().st_size
+        self.encode_time = perf_counter() - start
+
+    def summary(self) -> str:
+        mode = 'compact' if self.compact else 'pretty'
+        return f'output file: {self.bytes_written} bytes written in {self.encode_time:.3f} s ({mode})'
@@ -0,0 +1,104 @@
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+PlantRow = Mapping[str, Any]
+BranchKey = Tuple[str, str, str]
+
+LIKELY_LOOP_TYPE_BY_SUPPLY_COMPONENT = (
+    ('CHILLER', 'COOLING'),
+    ('BOILER', 'HEATING'),
+    ('TOWER', 'CONDENSER'),
+    ('FLUIDCOOLER', 'CONDENSER'),
+)
+
+
+class PlantTopology:
+    """Graph of the plant and condenser loops built in one pass over the 'Plant Loop Component Arrangement' table
+
+    Rows are grouped by (loop name, side, branch name) and indexed by loop, by branch name and by component type
+    so the fluid loop, chiller, boiler, heat rejection and pump emitters do not have to rescan the table.
+    """
+
+    def __init__(self, plant_loop_arrangements: List[PlantRow]):
+        self.rows = plant_loop_arrangements
+        self.branches: Dict[BranchKey, List[PlantRow]] = {}
+        self.rows_by_loop: Dict[str, List[PlantRow]] = {}
+        self.rows_by_branch_name: Dict[str, List[PlantRow]] = {}
+        self.rows_by_component_type: Dict[str, List[PlantRow]] = {}
+        self.branch_name_by_side_and_component: Dict[Tuple[str, str], str] = {}
+        self.pump_names_by_loop: Dict[str, List[str]] = {}
+        self._shared_branch_answers: Dict[Tuple[str, str], bool] = {}
+        for row in plant_loop_arrangements:
+            loop_name = row.get('Loop Name', '')
+            side = row.get('Side', '')
+            branch_name = row.get('Branch Name', '')
+            component_type = row.get('Component Type', '')
+            component_name = row.get('Component Name', '')
+            self.branches.setdefault((loop_name, side, branch_name), []).append(row)
+            self.rows_by_loop.setdefault(loop_name, []).append(row)
+            self.rows_by_branch_name.setdefault(branch_name, []).append(row)
+            self.rows_by_component_type.setdefault(component_type, []).append(row)
+            # keep the first branch of a component, which is what the linear search used to return
+            self.branch_name_by_side_and_component.setdefault((side.lower(), component_name.lower()), branch_name)
+            if 'PUMP' in component_type:
+                self.pump_names_by_loop.setdefault(loop_name, []).append(component_name)
+
+    @property
+    def reports_no_loops(self) -> bool:
+        # EnergyPlus writes a single row named 'None' when there are no plant loops
+        return bool(self.rows) and self.rows[0].get('first column') == 'None'
+
+    def rows_of_type(self, component_type: str) -> List[PlantRow]:
+        return self.rows_by_component_type.get(component_type, [])
+
+    def branch_of_component(self, component_name: str, side_of_loop: str) -> Optional[str]:
+        return self.branch_name_by_side_and_component.get((side_of_loop.lower(), component_name.lower()))
+
+    def is_pump_on_component_branch(self, component_name: str, side_of_loop: str) -> bool:
+        branch_name = self.branch_of_component(component_name, side_of_loop)
+        if not branch_name:
+            return False
+        return any('pump' in row.get('Component Type', '').lower() for row in self.rows_by_branch_name[branch_name])
+
+    def do_component_types_share_branch(self, comp_a: str, comp_b: str) -> bool:
+        # comp_a is matched without regard to case and comp_b against the lower case component type
+        key = (comp_a, comp_b)
+        if key not in self._shared_branch_answers:
+            comp_a_branch_names = set()
+            for component_type, rows in self.rows_by_component_type.items():
+                if comp_a.lower() in component_type.lower():
+                    comp_a_branch_names.update(row.get('Branch Name', '') for row in rows)
+            answer = False
+            for branch_name in comp_a_branch_names:
+                branch_rows = self.rows_by_branch_name[branch_name]
+                if any(comp_b in row.get('Component Type', '').lower() for row in branch_rows):
+                    answer = True
+                    break
+            self._shared_branch_answers[key] = answer
+        return self._shared_branch_answers[key]
+
+    def likely_loop_types(self) -> Dict[str, str]:
+        # the type of each loop is guessed from the equipment on the supply side
+        loop_types: Dict[str, str] = {}
+        for row in self.rows:
+            name = row.get('Loop Name', '')
+            likely_type = ''
+            if row.get('Side', '') == 'Supply':
+                component_type = row.get('Component Type', '')
+                for type_fragment, loop_type in LIKELY_LOOP_TYPE_BY_SUPPLY_COMPONENT:
+                    if type_fragment in component_type:
+                        likely_type = loop_type
+                        break
+            if likely_type:
+                if name in loop_types:
+                    prev_type = loop_types[name]
+                    type_tuple = (likely_type, prev_type)
+                    if type_tuple == ('COOLING', 'HEATING') or type_tuple == ('HEATING', 'COOLING'):
+                        loop_types[name] = 'HEATING_AND_COOLING'
+                    elif type_tuple == ('CONDENSER', 'HEATING') or type_tuple == ('HEATING', 'CONDENSER'):
+                        loop_types[name] = 'HEATING_AND_COOLING'
+                else:
+                    loop_types[name] = likely_type
+        return loop_types
+
+    def summary(self) -> str:
+        return f'plant topology: {len(self.rows_by_loop)} loops, {len(self.branches)} branches, {len(self.rows)} rows'
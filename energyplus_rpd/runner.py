@@ -1,15 +1,57 @@
 from pathlib import Path
 from sys import exit
-from energyplus_rpd.translator import Translator
+from time import perf_counter
+from typing import Optional
+from energyplus_rpd.input_cache import InputCache
+from energyplus_rpd.translation_cache import DEFAULT_MAX_MEGABYTES, MEGABYTE, TranslationCache, translate_with_cache
 import argparse
 
 
-def run_with_path(p: Path, add_cp=False, empty_cp=False) -> int:
-    t = Translator(p, add_cp=add_cp, empty_cp=empty_cp)
-    t.process()
+def run_with_path(p: Path, add_cp=False, empty_cp=False, stream_hourly=False, timings=False,
+                  timings_file: Optional[Path] = None, verify_ids=False, compact=False,
+                  compress=False, cache: Optional[TranslationCache] = None,
+                  input_cache: Optional[InputCache] = None, load_process_min_bytes: Optional[int] = None,
+                  jobs=1, concurrent_load=False) -> int:
+    def translate():
+        # the translator and the schema validator are imported here so that --help and a cache hit start quickly
+        from energyplus_rpd.translator import Translator
+        t = Translator(p, add_cp=add_cp, empty_cp=empty_cp, stream_hourly=stream_hourly,
+                       timings=timings or timings_file is not None, verify_ids=verify_ids, compact_output=compact,
+                       compress_output=compress, input_cache=input_cache,
+                       input_process_min_bytes=load_process_min_bytes, jobs=jobs, concurrent_load=concurrent_load)
+        t.process()
+        if t.stage_timer is not None:
+            print(t.stage_timer.report())
+            print(t.fact_cache.summary())
+            print(t.tabular_catalog.summary())
+            if timings_file is not None:
+                t.stage_timer.write_json(timings_file)
+                print(f"Stage timings written to {timings_file}")
+
+    # the empty compliance parameter file is written while translating, so that option always translates
+    if cache is None or empty_cp:
+        translate()
+    elif translate_with_cache(cache, p, translate, add_cp, compact, compress):
+        print(f"Found the RPD file for {p} in the {cache.summary()}")
     return 0
 
 
+def write_implementation_report() -> bool:
+    # the report does not depend on the model so it is written once per run, not for each model translated
+    from energyplus_rpd.status_reporter import StatusReporter
+    status_reporter = StatusReporter()
+    if not status_reporter.extra_schema_path.exists():
+        print(f"No implementation report is written without {status_reporter.extra_schema_path}")
+        return False
+    start = perf_counter()
+    if not status_reporter.generate_if_needed():
+        print(f"The implementation report at {status_reporter.report_file_path} is current")
+        return False
+    print(f"Implementation report written to {status_reporter.report_file_path} in {perf_counter() - start:.2f} s "
+          f"from the extra schema {status_reporter.extra_schema_source}")
+    return True
+
+
 def build_argument_parser():
     parser = argparse.ArgumentParser(
         prog='createRulesetProjectDescription',
@@ -18,7 +60,8 @@ def build_argument_parser():
     )
     parser.add_argument(
         'filename',
-        help='the name of the epJSON file name with path'
+        nargs='?',
+        help='the name of the epJSON file name with path or, with --batch, a directory, manifest file or glob pattern'
     )
     parser.add_argument(
         '--add_cp',
@@ -32,15 +75,123 @@ def build_argument_parser():
         action="store_true",
         help='Create an empty compliance parameter file using the name <filename>.comp-param-empty.json'
     )
+    parser.add_argument(
+        '--stream_hourly',
+        '-s',
+        action="store_true",
+        help='Stream the hourly results file and keep only the columns of the schedules that are used'
+    )
+    parser.add_argument(
+        '--batch',
+        '-b',
+        action="store_true",
+        help='Translate every epJSON file in a directory, listed in a manifest file or matching a glob pattern'
+    )
+    parser.add_argument(
+        '--workers',
+        '-w',
+        type=int,
+        default=None,
+        help='Number of worker processes used with --batch, defaults to the number of CPUs'
+    )
+    parser.add_argument(
+        '--timings',
+        '-t',
+        action="store_true",
+        help='Print the wall time, CPU time and peak memory of each translation stage'
+    )
+    parser.add_argument(
+        '--timings_file',
+        type=Path,
+        default=None,
+        help='Also write the stage timings to this JSON file, implies --timings; with --batch the file holds the '
+             'timings of every model by its epJSON path'
+    )
+    parser.add_argument(
+        '--verify_ids',
+        action="store_true",
+        help='Walk the finished model description to check that every id is unique, for debugging'
+    )
+    parser.add_argument(
+        '--compact',
+        action="store_true",
+        help='Write the RPD file without whitespace, with each list of numbers on one line'
+    )
+    parser.add_argument(
+        '--gzip',
+        '-z',
+        action="store_true",
+        help='Write the RPD file compressed with gzip as <filename>.rpd.gz'
+    )
+    parser.add_argument(
+        '--cache_dir',
+        type=Path,
+        default=None,
+        help='Reuse the RPD file kept in this directory when the input files are unchanged, and keep new ones there'
+    )
+    parser.add_argument(
+        '--cache_max_mb',
+        type=int,
+        default=DEFAULT_MAX_MEGABYTES,
+        help=f'Remove the least recently used RPD files from --cache_dir above this size, defaults to '
+             f'{DEFAULT_MAX_MEGABYTES} MB'
+    )
+    parser.add_argument(
+        '--input_cache_dir',
+        type=Path,
+        default=None,
+        help='Keep the parsed input files in this directory and reuse them until the input files change'
+    )
+    parser.add_argument(
+        '--concurrent_load',
+        action="store_true",
+        help='Load the epJSON file and the two results files at the same time on threads'
+    )
+    parser.add_argument(
+        '--load_processes_mb',
+        type=int,
+        default=None,
+        help='Parse each input file of at least this many MB in a separate process instead of on a thread'
+    )
+    parser.add_argument(
+        '--jobs',
+        '-j',
+        type=int,
+        default=1,
+        help='Number of threads that run the translation stages that do not depend on each other, defaults to 1'
+    )
+    parser.add_argument(
+        '--implementation_report',
+        action="store_true",
+        help='Write energyplus_implementation_report.txt on the status of each data element, for developers, '
+             'unless it is newer than ASHRAE229_extra.schema.yaml; a filename is then optional'
+    )
     return parser
 
 
 def run() -> int:
     cli = build_argument_parser()
     args = cli.parse_args()
-    if args.filename:
+    cache = TranslationCache(args.cache_dir, args.cache_max_mb * MEGABYTE) if args.cache_dir is not None else None
+    input_cache = InputCache(args.input_cache_dir) if args.input_cache_dir is not None else None
+    load_process_min_bytes = args.load_processes_mb * MEGABYTE if args.load_processes_mb is not None else None
+    if args.implementation_report:
+        write_implementation_report()
+        if not args.filename:
+            return 0
+    if args.filename and args.batch:
+        from energyplus_rpd.batch import run_batch_with_source
+        return run_batch_with_source(args.filename, args.workers, args.add_cp, args.create_empty_cp,
+                                     args.stream_hourly, cache, input_cache, timings=args.timings,
+                                     timings_file=args.timings_file, verify_ids=args.verify_ids,
+                                     compact=args.compact, compress=args.gzip,
+                                     load_process_min_bytes=load_process_min_bytes,
+                                     concurrent_load=args.concurrent_load, jobs=args.jobs)
+    elif args.filename:
         epjson_input_file_path = Path(args.filename)
-        return run_with_path(epjson_input_file_path, args.add_cp, args.create_empty_cp)
+        return run_with_path(epjson_input_file_path, args.add_cp, args.create_empty_cp, args.stream_hourly,
+                             args.timings, args.timings_file, args.verify_ids, args.compact, args.gzip, cache,
+                             input_cache, load_process_min_bytes, args.jobs, args.concurrent_load)
     else:
         print('An epJSON file name must be specified.')
         return 1
@@ -0,0 +1,260 @@
+import argparse
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from socketserver import ThreadingMixIn, UnixStreamServer
+from threading import Lock
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from energyplus_rpd import VERSION
+from energyplus_rpd.input_cache import InputCache
+from energyplus_rpd.json_codec import dumps, get_codec, loads
+from energyplus_rpd.output_file import OutputFile
+from energyplus_rpd.translation_cache import TranslationCache, translate_with_cache
+from energyplus_rpd.translator import Translator
+from energyplus_rpd.validator import get_shared_validator
+
+JsonDict = Dict[str, Any]
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8229
+CHUNK_SIZE = 1 << 20
+# the options of a translate request and the value used when one is left out
+REQUEST_OPTIONS = {'add_cp': False, 'stream_hourly': False, 'compact': False}
+
+
+class TranslationService:
+    """Translates models for the requests of a server, with the schemas, enumerations and JSON codec loaded once
+
+    Translations run on a pool of workers threads. Requests that arrive while every worker is busy wait in a queue
+    of up to max_queued requests, and further requests are turned away so a burst cannot pile up without bound.
+    """
+
+    def __init__(self, workers: int = 1, max_queued: int = 8, cache: Optional[TranslationCache] = None,
+                 input_cache: Optional[InputCache] = None):
+        start = perf_counter()
+        self.validator = get_shared_validator()
+        self.codec = get_codec()
+        self.startup_time = perf_counter() - start
+        self.workers = workers
+        self.max_queued = max_queued
+        self.cache = cache
+        self.input_cache = input_cache
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='translation')
+        self.lock = Lock()
+        # the lock of each RPD file being written or sent and the number of requests holding or waiting for it
+        self.output_locks: Dict[Path, Tuple[Lock, int]] = {}
+        self.pending = 0
+        self.translations = 0
+        self.failures = 0
+
+    def status(self) -> JsonDict:
+        return {'status': 'ok', 'version': VERSION, 'json_backend': self.codec.name, 'workers': self.workers,
+                'max_queued': self.max_queued, 'pending': self.pending, 'translations': self.translations,
+                'failures': self.failures, 'startup_time': self.startup_time}
+
+    def try_reserve(self) -> bool:
+        with self.lock:
+            if self.pending >= self.workers + self.max_queued:
+                return False
+            self.pending += 1
+            return True
+
+    @contextmanager
+    def output_lock(self, epjson_file_path: Path) -> Iterator[None]:
+        """Lets one request at a time write and send the RPD file of a model, which is the same file in every mode"""
+        key = epjson_file_path.resolve()
+        with self.lock:
+            path_lock, users = self.output_locks.get(key, (Lock(), 0))
+            self.output_locks[key] = (path_lock, users + 1)
+        try:
+            with path_lock:
+                yield
+        finally:
+            with self.lock:
+                path_lock, users = self.output_locks[key]
+                if users == 1:
+                    del self.output_locks[key]
+                else:
+                    self.output_locks[key] = (path_lock, users - 1)
+
+    def translate(self, epjson_file_path: Path, add_cp=False, stream_hourly=False, compact=False) -> Path:
+        """Translates the model on a worker, once try_reserve has returned True, and returns the RPD file path"""
+        try:
+            return self.executor.submit(self._translate, epjson_file_path, add_cp, stream_hourly, compact).result()
+        finally:
+            with self.lock:
+                self.pending -= 1
+
+    def _translate(self, epjson_file_path: Path, add_cp: bool, stream_hourly: bool, compact: bool) -> Path:
+        def translate():
+            t = Translator(epjson_file_path, add_cp=add_cp, stream_hourly=stream_hourly, validator=self.validator,
+                           compact_output=compact, input_cache=self.input_cache)
+            t.process()
+
+        try:
+            if self.cache is None:
+                translate()
+            else:
+                translate_with_cache(self.cache, epjson_file_path, translate, add_cp, compact)
+        except Exception:
+            with self.lock:
+                self.failures += 1
+            raise
+        with self.lock:
+            self.translations += 1
+        return OutputFile(epjson_file_path, compact).rpd_file_path
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+
+
+class TranslationRequestHandler(BaseHTTPRequestHandler):
+    """GET /health reports the state of the service and POST /translate translates a model
+
+    The body of a translate request is a JSON object with the epjson_path of the model, which the server reads from
+    its own file system, and optionally add_cp, stream_hourly and compact. The RPD file is written next to the
+    epJSON file as it is by the command line and is sent back in chunks as it is read. Requests for the same model
+    wait for each other, since each one rewrites that file.
+    """
+    protocol_version = 'HTTP/1.1'
+    server_version = f'energyplus_rpd/{VERSION}'
+
+    @property
+    def service(self) -> TranslationService:
+        return self.server.service
+
+    def address_string(self) -> str:
+        # the client of a Unix socket has no address
+        return self.client_address[0] if self.client_address else self.server.server_address
+
+    def send_json(self, status: HTTPStatus, value: JsonDict):
+        body = dumps(value).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, status: HTTPStatus, message: str):
+        self.send_json(status, {'error': message})
+
+    def do_GET(self):
+        if self.path == '/health':
+            self.send_json(HTTPStatus.OK, self.service.status())
+        else:
+            self.send_error_json(HTTPStatus.NOT_FOUND, f'Unknown path: {self.path}')
+
+    def read_request(self) -> JsonDict:
+        length = int(self.headers.get('Content-Length') or 0)
+        request = loads(self.rfile.read(length)) if length else {}
+        if not isinstance(request, dict) or not isinstance(request.get('epjson_path'), str):
+            raise ValueError('The request body must be a JSON object with an epjson_path string')
+        unknown = set(request) - set(REQUEST_OPTIONS) - {'epjson_path'}
+        if unknown:
+            raise ValueError(f'Unknown request options: {sorted(unknown)}')
+        return request
+
+    def do_POST(self):
+        if self.path != '/translate':
+            self.send_error_json(HTTPStatus.NOT_FOUND, f'Unknown path: {self.path}')
+            return
+        try:
+            request = self.read_request()
+        except ValueError as e:
+            self.send_error_json(HTTPStatus.BAD_REQUEST, str(e))
+            return
+        if not self.service.try_reserve():
+            self.send_error_json(HTTPStatus.SERVICE_UNAVAILABLE, 'Every worker is busy and the queue is full')
+            return
+        options = {name: bool(request.get(name, default)) for name, default in REQUEST_OPTIONS.items()}
+        epjson_file_path = Path(request['epjson_path'])
+        start = perf_counter()
+        # the file is held until it is sent so another request for the model cannot rewrite it halfway through
+        with self.service.output_lock(epjson_file_path):
+            try:
+                rpd_file_path = self.service.translate(epjson_file_path, **options)
+            except Exception as e:
+                self.send_error_json(HTTPStatus.INTERNAL_SERVER_ERROR, f'{type(e).__name__}: {e}')
+                return
+            self.send_rpd(rpd_file_path, perf_counter() - start)
+
+    def send_rpd(self, rpd_file_path: Path, translation_time: float):
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.send_header('X-RPD-Path', str(rpd_file_path))
+        self.send_header('X-Translation-Time', f'{translation_time:.3f}')
+        self.end_headers()
+        with open(rpd_file_path, 'rb') as rpd_file:
+            for chunk in iter(lambda: rpd_file.read(CHUNK_SIZE), b''):
+                self.wfile.write(f'{len(chunk):x}\r\n'.encode() + chunk + b'\r\n')
+        self.wfile.write(b'0\r\n\r\n')
+
+
+class TranslationHTTPServer(ThreadingHTTPServer):
+    def __init__(self, server_address, service: TranslationService):
+        self.service = service
+        super().__init__(server_address, TranslationRequestHandler)
+
+
+class UnixTranslationHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, service: TranslationService):
+        self.service = service
+        super().__init__(str(socket_path), TranslationRequestHandler)
+
+
+def make_server(service: TranslationService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                socket_path: Optional[Path] = None):
+    """Returns a server listening on the Unix socket at socket_path if it is given, otherwise on host and port"""
+    if socket_path is not None:
+        if not hasattr(socket, 'AF_UNIX'):
+            raise Exception('Unix sockets are not available on this platform, use --host and --port instead')
+        if socket_path.exists():
+            socket_path.unlink()
+        return UnixTranslationHTTPServer(socket_path, service)
+    return TranslationHTTPServer((host, port), service)
+
+
+def build_argument_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m energyplus_rpd serve',
+        description='Serve translations of EnergyPlus models into Ruleset Project Description (RPD) files over HTTP, '
+                    'keeping the schemas loaded between requests.'
+    )
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f'Address to listen on, defaults to {DEFAULT_HOST}')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port to listen on, defaults to {DEFAULT_PORT}')
+    parser.add_argument('--socket', type=Path, default=None, help='Listen on this Unix socket instead of a port')
+    parser.add_argument('--workers', '-w', type=int, default=1, help='Number of translations run at the same time')
+    parser.add_argument('--max_queued', type=int, default=8,
+                        help='Number of requests that may wait for a worker before requests are turned away')
+    parser.add_argument('--cache_dir', type=Path, default=None,
+                        help='Reuse the RPD file kept in this directory when the input files are unchanged')
+    parser.add_argument('--input_cache_dir', type=Path, default=None,
+                        help='Keep the parsed input files in this directory and reuse them until they change')
+    return parser
+
+
+def run_service(argv: Optional[List[str]] = None) -> int:
+    args = build_argument_parser().parse_args(argv)
+    cache = TranslationCache(args.cache_dir) if args.cache_dir is not None else None
+    input_cache = InputCache(args.input_cache_dir) if args.input_cache_dir is not None else None
+    service = TranslationService(args.workers, args.max_queued, cache, input_cache)
+    server = make_server(service, args.host, args.port, args.socket)
+    where = args.socket if args.socket is not None else f'http://{args.host}:{server.server_address[1]}'
+    print(f'Serving RPD translations on {where} with {args.workers} workers, '
+          f'ready in {service.startup_time:.2f} s')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+    return 0
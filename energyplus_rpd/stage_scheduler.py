@@ -0,0 +1,67 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Sequence, Set
+
+
+class StageSpec(NamedTuple):
+    """A stage of the translation with the state it reads and the state it writes
+
+    State is named by dotted paths, such as model_description.weather for one section of the model description or
+    fact.gather_equipment_fans for one fact of the fact cache. A path overlaps the paths below it, so a stage that
+    writes model_description conflicts with every stage that reads or writes one of its sections.
+    """
+    name: str
+    reads: FrozenSet[str] = frozenset()
+    writes: FrozenSet[str] = frozenset()
+
+
+def stage_spec(name: str, reads: Iterable[str] = (), writes: Iterable[str] = ()) -> StageSpec:
+    return StageSpec(name, frozenset(reads), frozenset(writes))
+
+
+def paths_overlap(first: str, second: str) -> bool:
+    return first == second or first.startswith(second + '.') or second.startswith(first + '.')
+
+
+def any_paths_overlap(first: Iterable[str], second: Iterable[str]) -> bool:
+    return any(paths_overlap(a, b) for a in first for b in second)
+
+
+def stages_conflict(earlier: StageSpec, later: StageSpec) -> bool:
+    # a later stage has to wait when it reads what the earlier one writes, or writes what the earlier one reads or
+    # writes, so that it sees the same state it would see if the stages ran one after the other
+    return (any_paths_overlap(earlier.writes, later.reads | later.writes)
+            or any_paths_overlap(earlier.reads, later.writes))
+
+
+def find_stage_dependencies(stages: Sequence[StageSpec]) -> Dict[str, List[str]]:
+    """Returns the earlier stages that each stage has to wait for, by stage name"""
+    return {later.name: [earlier.name for earlier in stages[:index] if stages_conflict(earlier, later)]
+            for index, later in enumerate(stages)}
+
+
+def run_stages(stages: Sequence[StageSpec], run_stage: Callable[[str], Any], jobs: int = 1):
+    """Calls run_stage with the name of each stage, on up to jobs threads at a time
+
+    A stage starts once the earlier stages it conflicts with have finished, and stages that are ready start in the
+    order they are listed, so the state after all stages is the same as when they are run one after the other. With
+    jobs of 1 the stages are simply run in order on this thread. The first error raised by a stage is raised again
+    once the stages already running have finished.
+    """
+    if jobs <= 1:
+        for stage in stages:
+            run_stage(stage.name)
+        return
+    waiting_for = {name: set(dependencies) for name, dependencies in find_stage_dependencies(stages).items()}
+    finished: Set[str] = set()
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        running: Dict[Future, str] = {}
+        while waiting_for or running:
+            for stage in stages:
+                if stage.name in waiting_for and waiting_for[stage.name] <= finished:
+                    del waiting_for[stage.name]
+                    running[executor.submit(run_stage, stage.name)] = stage.name
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                future.result()
+                finished.add(name)
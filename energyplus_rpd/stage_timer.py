@@ -0,0 +1,104 @@
+import tracemalloc
+from contextlib import contextmanager
+from json import dumps
+from pathlib import Path
+from threading import Lock
+from time import perf_counter, process_time
+from typing import Any, Dict, Iterator, List
+
+from energyplus_rpd import VERSION
+
+JsonDict = Dict[str, Any]
+
+
+class StageTimer:
+    """Records the wall time, CPU time and peak traced memory of each stage of a translation
+
+    Memory is traced with tracemalloc, which slows Python down, so it can be turned off with trace_memory. The peak
+    of a stage is the most memory the stage had allocated at any one time on top of what was traced when it started.
+    tracemalloc has a single peak for the whole process, so a stage that runs at the same time as another one has no
+    peak of its own and its peak_memory is None.
+    """
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.stages: List[JsonDict] = []
+        # the stages that are running, each marked once another stage has run at the same time
+        self.running: List[JsonDict] = []
+        self.lock = Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started_tracing = False
+        memory_at_start = 0
+        state = {'overlapped': False}
+        with self.lock:
+            if self.running:
+                state['overlapped'] = True
+                for other_state in self.running:
+                    other_state['overlapped'] = True
+            self.running.append(state)
+            # the peak is only reset when no other stage is running, since that would reset its peak as well
+            if self.trace_memory and not state['overlapped']:
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    started_tracing = True
+                elif hasattr(tracemalloc, 'reset_peak'):
+                    tracemalloc.reset_peak()
+                else:  # before Python 3.9 the peak can only be reset together with the traces
+                    tracemalloc.clear_traces()
+                memory_at_start = tracemalloc.get_traced_memory()[0]
+        wall_start = perf_counter()
+        cpu_start = process_time()
+        try:
+            yield
+        finally:
+            record = {'stage': name,
+                      'wall_time': perf_counter() - wall_start,
+                      'cpu_time': process_time() - cpu_start,
+                      'peak_memory': None}
+            with self.lock:
+                self.running.remove(state)
+                if self.trace_memory and not state['overlapped']:
+                    record['peak_memory'] = tracemalloc.get_traced_memory()[1] - memory_at_start
+                if started_tracing:
+                    tracemalloc.stop()
+                self.stages.append(record)
+
+    @contextmanager
+    def tracing(self) -> Iterator[None]:
+        # keeps memory traced across stages that run at the same time, so that no stage stops tracing while another
+        # is still running; their CPU times then overlap and they have no peak memory
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            yield
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+    def total_wall_time(self) -> float:
+        return sum(record['wall_time'] for record in self.stages)
+
+    def report(self) -> str:
+        # the stages are listed from the slowest to the fastest
+        total = self.total_wall_time()
+        name_width = max([len('stage')] + [len(record['stage']) for record in self.stages])
+        lines = [f"{'stage':<{name_width}}  {'wall [s]':>10}  {'cpu [s]':>10}  {'share':>6}  {'peak [MB]':>10}"]
+        for record in sorted(self.stages, key=lambda r: r['wall_time'], reverse=True):
+            share = record['wall_time'] / total * 100. if total > 0 else 0.
+            peak = f"{record['peak_memory'] / 1e6:10.1f}" if record['peak_memory'] is not None else f"{'-':>10}"
+            lines.append(f"{record['stage']:<{name_width}}  {record['wall_time']:10.3f}  {record['cpu_time']:10.3f}  "
+                         f"{share:5.1f}%  {peak}")
+        lines.append(f"{'total':<{name_width}}  {total:10.3f}")
+        return '\n'.join(lines)
+
+    def to_dict(self) -> JsonDict:
+        return {'version': VERSION,
+                'trace_memory': self.trace_memory,
+                'total_wall_time': self.total_wall_time(),
+                'stages': self.stages}
+
+    def write_json(self, json_path: Path):
+        json_path.write_text(dumps(self.to_dict(), indent=2))
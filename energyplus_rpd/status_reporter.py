@@ -1,10 +1,19 @@
-from yaml import safe_load
+import os
+import threading
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, Optional
+
+from energyplus_rpd.json_codec import dumps, loads
+
+EXTRA_SCHEMA_FILE_NAME = 'ASHRAE229_extra.schema.yaml'
+REPORT_FILE_NAME = 'energyplus_implementation_report.txt'
+# the parsed extra schema is kept in this file next to the report, under the modification time and size of the YAML
+EXTRA_SCHEMA_CACHE_FILE_NAME = 'ASHRAE229_extra.schema.cache.json'
 
 
 class StatusReporter:
-    def __init__(self):
+    def __init__(self, extra_schema_path: Optional[Path] = None, report_file_path: Optional[Path] = None):
         self.extra_schema = {}
         parent_dir = Path(__file__).parent
         grand_parent_dir = Path(__file__).parent.parent
@@ -12,22 +21,67 @@ class StatusReporter:
         # the extra schema file includes extra tags on fields related to appendix G and energyplus
         # these extra tags are just for internal tracking of what has been fully or partially
         # implemented and is unlikely to be useful to end users.
-        extra_schema_file = 'ASHRAE229_extra.schema.yaml'
-        extra_schema_path = parent_dir / extra_schema_file
-        if extra_schema_path.exists():
-            with open(extra_schema_path) as schema_f:
-                self.extra_schema = safe_load(schema_f)
-        report_file = 'energyplus_implementation_report.txt'
-        self.report_file_path = grand_parent_dir / report_file
+        self.extra_schema_path = extra_schema_path if extra_schema_path is not None else \
+            parent_dir / EXTRA_SCHEMA_FILE_NAME
+        self.report_file_path = report_file_path if report_file_path is not None else \
+            grand_parent_dir / REPORT_FILE_NAME
+        self.cache_file_path = self.report_file_path.with_name(EXTRA_SCHEMA_CACHE_FILE_NAME)
+        # where the extra schema was last loaded from, 'cache' or 'yaml'
+        self.extra_schema_source = ''
+
+    def is_report_current(self) -> bool:
+        # like make, the report is current when it is newer than the extra schema and this module
+        try:
+            report_time = self.report_file_path.stat().st_mtime_ns
+            return report_time >= max(self.extra_schema_path.stat().st_mtime_ns, Path(__file__).stat().st_mtime_ns)
+        except FileNotFoundError:
+            return False
+
+    def load_extra_schema(self) -> Dict:
+        # parsing the YAML takes about a second, so the parsed schema is kept as JSON until the YAML changes
+        if not self.extra_schema_path.exists():
+            return {}
+        status = self.extra_schema_path.stat()
+        key = {'mtime': status.st_mtime_ns, 'size': status.st_size}
+        try:
+            cached = loads(self.cache_file_path.read_text(encoding='utf-8'))
+            if cached.get('key') == key:
+                self.extra_schema_source = 'cache'
+                return cached['extra_schema']
+        except (OSError, ValueError):
+            pass
+        from yaml import safe_load
+        with open(self.extra_schema_path) as schema_f:
+            extra_schema = safe_load(schema_f)
+        self.extra_schema_source = 'yaml'
+        try:
+            write_replacing(self.cache_file_path, dumps({'key': key, 'extra_schema': extra_schema}))
+        except OSError as e:
+            print(f"Could not write the extra schema cache at {self.cache_file_path}; error: {e}")
+        return extra_schema
+
+    def generate_if_needed(self, force=False) -> bool:
+        """Writes the report unless it is already current, and returns whether it was written"""
+        if not force and self.is_report_current():
+            return False
+        self.extra_schema = self.load_extra_schema()
+        if not self.extra_schema:
+            return False
+        self.generate()
+        return True
 
     def generate(self):  # , rpd_dict):
+        if not self.extra_schema:
+            self.extra_schema = self.load_extra_schema()
         if self.extra_schema:
             # if the YAML schema file is not present then don't generate report
             # since the report is just for internal tracking of development
             # it fails gracefully when the file is not present which would only
             # be present for the developer.
             still_to_do = []
-            with open(self.report_file_path, 'w') as f:
+            # written to a temporary file and renamed so runs at the same time never see part of a report
+            temporary_path = temporary_path_for(self.report_file_path)
+            with open(temporary_path, 'w') as f:
                 print('============= Generated Report ==============', file=f)
                 print(f'Updated at: {datetime.now()} \n', file=f)
                 for data_group_name, node in self.extra_schema.items():
@@ -65,6 +119,7 @@ class StatusReporter:
                 print('============== To Do ==============', file=f)
                 for item in still_to_do:
                     print(item, file=f)
+            os.replace(temporary_path, self.report_file_path)
 
     @staticmethod
     def type_of_ep_field(fields):
@@ -102,3 +157,13 @@ class StatusReporter:
             return 'note  '
         else:
             return 'null  '
+
+
+def temporary_path_for(path: Path) -> Path:
+    return path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+
+
+def write_replacing(path: Path, text: str):
+    temporary_path = temporary_path_for(path)
+    temporary_path.write_text(text, encoding='utf-8')
+    os.replace(temporary_path, path)
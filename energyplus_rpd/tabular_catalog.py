@@ -0,0 +1,135 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+JsonDict = Dict[str, Any]
+
+FIRST_COLUMN = 'first column'
+
+
+def build_column_index(cols: List[str]) -> Dict[str, int]:
+    # the first occurrence of a repeated column name wins, which matches cols.index()
+    column_index: Dict[str, int] = {}
+    for index, col in enumerate(cols):
+        column_index.setdefault(col, index)
+    return column_index
+
+
+class RowView(Mapping):
+    """Read-only mapping of column name to value over one of the row lists of a table
+
+    The values are read from the original row list so nothing is copied. When first_column is given it is
+    exposed under the 'first column' key after the regular columns.
+    """
+
+    __slots__ = ('_values', '_column_index', '_first_column')
+
+    def __init__(self, values: List[Any], column_index: Dict[str, int], first_column: Optional[str] = None):
+        self._values = values
+        self._column_index = column_index
+        self._first_column = first_column
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._column_index:
+            return self._values[self._column_index[key]]
+        if key == FIRST_COLUMN and self._first_column is not None:
+            return self._first_column
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._column_index
+        if self._first_column is not None and FIRST_COLUMN not in self._column_index:
+            yield FIRST_COLUMN
+
+    def __len__(self) -> int:
+        extra = 1 if self._first_column is not None and FIRST_COLUMN not in self._column_index else 0
+        return len(self._column_index) + extra
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class TabularCatalog:
+    """Index of the EnergyPlus tabular reports keyed by (report name, table name)
+
+    The TabularReports list of the results JSON is walked once when the catalog is built so each later lookup
+    is a single dictionary access instead of a scan of every report and every table. The row views handed out by
+    get_table_list and get_table_dictionary are memoized so each table is only transformed once.
+    """
+
+    def __init__(self, tabular_reports: Any):
+        self.tabular_reports = tabular_reports
+        self.tables: Dict[Tuple[str, str], JsonDict] = {}
+        self.lookups_served = 0
+        self.column_indexes: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self.table_lists: Dict[Tuple[str, str], List[RowView]] = {}
+        self.table_dictionaries: Dict[Tuple[str, str, bool], Dict[str, RowView]] = {}
+        if isinstance(tabular_reports, list):
+            for tabular_report in tabular_reports:
+                report_name = tabular_report.get('ReportName', '')
+                for table in tabular_report.get('Tables', []):
+                    key = (report_name, table.get('TableName', ''))
+                    # keep the first occurrence, which is what the linear search used to return
+                    if key not in self.tables:
+                        self.tables[key] = table
+
+    @property
+    def tables_built(self) -> int:
+        return len(self.tables)
+
+    def is_built_from(self, tabular_reports: Any) -> bool:
+        return self.tabular_reports is tabular_reports
+
+    def get_table(self, report_name: str, table_name: str) -> JsonDict:
+        self.lookups_served += 1
+        return self.tables.get((report_name, table_name), {})
+
+    def get_column_index(self, report_name: str, table_name: str) -> Dict[str, int]:
+        key = (report_name, table_name)
+        if key not in self.column_indexes:
+            table = self.tables.get(key, {})
+            self.column_indexes[key] = build_column_index(table.get('Cols', []))
+        return self.column_indexes[key]
+
+    def get_table_list(self, report_name: str, table_name: str) -> List[RowView]:
+        # one view per row with the row name available under the 'first column' key
+        key = (report_name, table_name)
+        if key not in self.table_lists:
+            table = self.get_table(report_name, table_name)
+            list_of_rows: List[RowView] = []
+            if table:
+                column_index = self.get_column_index(report_name, table_name)
+                for row_key, values in table['Rows'].items():
+                    list_of_rows.append(RowView(values, column_index, row_key))
+            self.table_lists[key] = list_of_rows
+        else:
+            self.lookups_served += 1
+        return self.table_lists[key]
+
+    def get_table_dictionary(
+            self,
+            report_name: str,
+            table_name: str,
+            ignore_first_column: bool = False
+    ) -> Dict[str, RowView]:
+        # row views keyed by the row name or, when ignoring the first column, by the value in the first column
+        key = (report_name, table_name, ignore_first_column)
+        if key not in self.table_dictionaries:
+            table = self.get_table(report_name, table_name)
+            dict_of_rows: Dict[str, RowView] = {}
+            if table:
+                column_index = self.get_column_index(report_name, table_name)
+                rows = table['Rows']
+                if not ignore_first_column:
+                    for row_key, values in rows.items():
+                        dict_of_rows[row_key] = RowView(values, column_index)
+                elif table['Cols']:
+                    column_index = {col: column_index[col] for col in table['Cols'][1:]}
+                    for values in rows.values():
+                        dict_of_rows[str(values[0])] = RowView(values, column_index)
+            self.table_dictionaries[key] = dict_of_rows
+        else:
+            self.lookups_served += 1
+        return self.table_dictionaries[key]
+
+    def summary(self) -> str:
+        return f'tabular catalog: {self.tables_built} tables indexed, {self.lookups_served} lookups served'
@@ -0,0 +1,45 @@
+from energyplus_rpd.json_codec import JsonCodec, available_backend_names
+from pathlib import Path
+from time import perf_counter
+
+
+def best_time(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        times.append(perf_counter() - start)
+    return min(times)
+
+
+def benchmark_json_codecs(repeat=3):
+    """
+    Compare the JSON backends on the bundled example and the epJSON and RPD files of the 229P test suite.
+    """
+    base_dir = Path(__file__).parent
+    example_dir = base_dir.parent / "example"
+    file_groups = {
+        'example': sorted(example_dir.glob('*.epJSON')) + sorted(example_dir.glob('*.json')),
+        '229 epJSON': sorted(base_dir.glob('test_files_229_*/**/*.epJSON')),
+        '229 RPD': sorted(base_dir.glob('test_files_229_*/**/*.rpd')),
+    }
+    backend_names = available_backend_names()
+    print(f"Backends installed: {', '.join(backend_names)}")
+    print(f"{'files':<12} {'backend':<8} {'MB':>8} {'parse [s]':>10} {'compact [s]':>12} {'indented [s]':>13}")
+    for group_name, paths in file_groups.items():
+        texts = [path.read_text() for path in paths]
+        if not texts:
+            continue
+        size = sum(len(text) for text in texts) / 1e6
+        for backend_name in backend_names:
+            codec = JsonCodec(backend_name)
+            values = [codec.loads(text) for text in texts]
+            parse_time = best_time(lambda: [codec.loads(text) for text in texts], repeat)
+            compact_time = best_time(lambda: [codec.dumps(value) for value in values], repeat)
+            indented_time = best_time(lambda: [codec.dumps_indented(value) for value in values], repeat)
+            print(f"{group_name:<12} {backend_name:<8} {size:8.1f} {parse_time:10.3f} {compact_time:12.3f} "
+                  f"{indented_time:13.3f}")
+
+
+if __name__ == "__main__":
+    benchmark_json_codecs()
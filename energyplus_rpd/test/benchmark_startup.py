@@ -0,0 +1,72 @@
+import subprocess
+import sys
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+# the modules imported by each way of starting the translator
+ENTRY_MODULES = ['energyplus_rpd.runner', 'energyplus_rpd.batch', 'energyplus_rpd.service', 'energyplus_rpd.translator']
+# dependencies that take a long time to import and are only needed once a model is translated
+HEAVY_MODULES = ['jsonschema', 'yaml', 'multiprocessing', 'energyplus_rpd.translator']
+
+
+def import_times(module: str) -> List[Tuple[str, int, int]]:
+    """Returns the name, self time and cumulative time in microseconds of each import made by importing the module
+
+    The times are read from python -X importtime in a fresh interpreter. Nested imports keep the indentation of
+    their names.
+    """
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], capture_output=True,
+                               text=True, check=True)
+    times = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, cumulative_time, name = line[len('import time:'):].split('|')
+        times.append((name.rstrip()[1:], int(self_time), int(cumulative_time)))
+    return times
+
+
+def import_time_total(times: List[Tuple[str, int, int]]) -> int:
+    # the cumulative times of the imports made directly by the interpreter, such as site and the module itself
+    return sum(cumulative_time for name, _, cumulative_time in times if not name.startswith(' '))
+
+
+def loaded_heavy_modules(times: List[Tuple[str, int, int]], imported_module: str) -> List[str]:
+    names = {name.strip() for name, _, _ in times}
+    return [module for module in HEAVY_MODULES if module in names and module != imported_module]
+
+
+def help_wall_time(repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        subprocess.run([sys.executable, '-m', 'energyplus_rpd', '--help'], capture_output=True, check=True)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def benchmark_startup(repeat=5, slowest=8):
+    """
+    Report the python -X importtime totals of the entry modules, the slowest imports of the runner, which of the
+    heavy dependencies each one loads and the wall time of the --help option.
+    """
+    print(f"{'module':<28} {'import [ms]':>12}  heavy modules loaded")
+    runner_times: List[Tuple[str, int, int]] = []
+    for module in ENTRY_MODULES:
+        # the best of several runs, since the first run also fills the operating system file cache
+        runs = [import_times(module) for _ in range(repeat)]
+        times = min(runs, key=import_time_total)
+        if module == 'energyplus_rpd.runner':
+            runner_times = times
+        print(f"{module:<28} {import_time_total(times) / 1000:12.1f}  {', '.join(loaded_heavy_modules(times, module))}")
+    slowest_imports: Dict[str, int] = {}
+    for name, self_time, _ in runner_times:
+        slowest_imports[name.strip()] = self_time
+    print("\nSlowest imports of energyplus_rpd.runner by their own time:")
+    for name, self_time in sorted(slowest_imports.items(), key=lambda item: -item[1])[:slowest]:
+        print(f"  {name:<40} {self_time / 1000:8.1f} ms")
+    print(f"\npython -m energyplus_rpd --help: {help_wall_time(repeat):.3f} s wall time")
+
+
+if __name__ == "__main__":
+    benchmark_startup()
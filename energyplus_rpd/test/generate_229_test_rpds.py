@@ -1,8 +1,9 @@
-from energyplus_rpd.runner import run_with_path
+from energyplus_rpd.batch import run_batch, summarize_batch
 from pathlib import Path
+from time import perf_counter
 
 
-def generate_rpd_for_all_229_models():
+def generate_rpd_for_all_229_models(workers=None):
     """
     Generate RPD files for FSEC and PSD's EnergyPlus models of the 229P test suite.
     """
@@ -12,21 +13,14 @@ def generate_rpd_for_all_229_models():
     fsec_models_dir = base_dir / "test_files_229_FSEC"
     psd_models_dir = base_dir / "test_files_229_PSD"
 
-    print(f"Processing models in directory: {fsec_models_dir}")
-    # Iterate through each model file in the directory
-    for model_file in fsec_models_dir.rglob('*.epJSON'):
-        print(f'Processing {model_file.name}...')
-        run_with_path(model_file)  # Call the function to process the model file
-        print(f'Finished processing {model_file.name}.')
-
-    print(f"Processing models in directory: {psd_models_dir}")
-    # Iterate through each model file in the directory
-    for model_file in psd_models_dir.rglob('*.epJSON'):
-        print(f'Processing {model_file.name}...')
-        run_with_path(model_file)  # Call the function to process the model file
-        print(f'Finished processing {model_file.name}.')
+    print(f"Processing models in directories: {fsec_models_dir} and {psd_models_dir}")
+    model_files = list(fsec_models_dir.rglob('*.epJSON')) + list(psd_models_dir.rglob('*.epJSON'))
+    start = perf_counter()
+    # each model is processed in a pool of worker processes and a failure does not stop the others
+    results = run_batch(model_files, workers)
+    print(summarize_batch(results, perf_counter() - start))
 
 
 if __name__ == "__main__":
     generate_rpd_for_all_229_models()
-    print("All models processed successfully.")
+    print("All models processed.")
@@ -0,0 +1,24 @@
+from json import dumps
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+JsonDict = Dict[str, Any]
+
+MINIMAL_EPJSON: JsonDict = {"Building": {"OfficeSmall": {"loads_convergence_tolerance_value": 0.04}},
+                            "Version": {"Version 1": {"version_identifier": "22.1"}}}
+EMPTY_HOURLY_RESULTS: JsonDict = {"Cols": [], "Rows": []}
+
+
+def write_minimal_model(model_dir: Path, epjson: Optional[JsonDict] = None,
+                        hourly_results: Optional[JsonDict] = None) -> Path:
+    """Writes the smallest model the translator accepts to in.epJSON, inout.json and inout_hourly.json in model_dir
+
+    The epJSON and hourly results objects may be given to write other contents. Returns the epJSON file path.
+    """
+    model_dir.mkdir(parents=True, exist_ok=True)
+    input_file_path = model_dir / 'in.epJSON'
+    input_file_path.write_text(dumps(MINIMAL_EPJSON if epjson is None else epjson))
+    (model_dir / 'inout.json').write_text(dumps({"TabularReports": []}))
+    (model_dir / 'inout_hourly.json').write_text(dumps(EMPTY_HOURLY_RESULTS if hourly_results is None
+                                                       else hourly_results))
+    return input_file_path
@@ -0,0 +1,97 @@
+import contextlib
+import gzip
+import io
+from json import loads
+from pathlib import Path
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from energyplus_rpd.batch import collect_model_paths
+from energyplus_rpd.batch import run_batch
+from energyplus_rpd.batch import run_batch_with_source
+from energyplus_rpd.batch import summarize_batch
+from energyplus_rpd.batch import translate_model
+from energyplus_rpd.test.model_files import MINIMAL_EPJSON
+from energyplus_rpd.test.model_files import write_minimal_model
+from energyplus_rpd.translation_cache import TranslationCache
+
+
+class TestBatch(TestCase):
+    def setUp(self) -> None:
+        self.run_dir_path = Path(mkdtemp())
+
+    def test_collect_model_paths(self):
+        first = write_minimal_model(self.run_dir_path / 'a')
+        second = write_minimal_model(self.run_dir_path / 'b')
+        self.assertEqual(collect_model_paths(str(self.run_dir_path)), [first, second])
+        self.assertEqual(collect_model_paths(str(first)), [first])
+        self.assertEqual(collect_model_paths(str(self.run_dir_path / '*' / 'in.epJSON')), [first, second])
+        manifest = self.run_dir_path / 'models.txt'
+        manifest.write_text('# models to translate\nb/in.epJSON\n\n' + str(first) + '\n')
+        self.assertEqual(collect_model_paths(str(manifest)), [second, first])
+
+    def test_run_batch_isolates_failures(self):
+        without_version = {"Building": MINIMAL_EPJSON["Building"]}
+        model_paths = [write_minimal_model(self.run_dir_path / 'a'),
+                       write_minimal_model(self.run_dir_path / 'bad', epjson=without_version)]
+        for workers in [1, 2]:
+            results = run_batch(model_paths, workers)
+            self.assertEqual([result['path'] for result in results], [str(path) for path in model_paths])
+            self.assertTrue(results[0]['succeeded'])
+            self.assertTrue((self.run_dir_path / 'a' / 'in.rpd').exists())
+            self.assertFalse(results[1]['succeeded'])
+            self.assertIn('Version', results[1]['error'])
+            summary = summarize_batch(results, 2.0)
+            self.assertIn('2 models in 2.00 s (60.0 models per minute), 1 succeeded, 1 failed', summary)
+
+    def test_run_batch_with_timings(self):
+        model_paths = [write_minimal_model(self.run_dir_path / 'a'), write_minimal_model(self.run_dir_path / 'b')]
+        timings_file = self.run_dir_path / 'timings.json'
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(run_batch_with_source(str(self.run_dir_path), 1, timings_file=timings_file), 0)
+        timings = loads(timings_file.read_text())
+        self.assertEqual(sorted(timings), [str(path) for path in model_paths])
+        self.assertIn('add_zones', [record['stage'] for record in timings[str(model_paths[0])]['stages']])
+        self.assertIn('wall [s]', output.getvalue())
+        self.assertIn('tabular catalog: ', output.getvalue())
+
+    def test_translate_model_with_verified_ids(self):
+        result = translate_model(write_minimal_model(self.run_dir_path / 'a'), verify_ids=True)
+        self.assertTrue(result['succeeded'], result['error'])
+
+    def test_run_batch_compact(self):
+        model_paths = [write_minimal_model(self.run_dir_path / 'a')]
+        cache = TranslationCache(self.run_dir_path / 'cache')
+        results = run_batch(model_paths, 1, cache=cache, compact=True)
+        self.assertTrue(results[0]['succeeded'], results[0]['error'])
+        rpd_text = (self.run_dir_path / 'a' / 'in.rpd').read_text()
+        self.assertEqual(loads(rpd_text)['id'], 'project description root')
+        self.assertNotIn('\n  ', rpd_text)
+        # a pretty RPD file is a different cache entry from the compact one
+        results = run_batch(model_paths, 1, cache=cache)
+        self.assertFalse(results[0]['cached'])
+        self.assertIn('\n  ', (self.run_dir_path / 'a' / 'in.rpd').read_text())
+        self.assertTrue(run_batch(model_paths, 1, cache=cache, compact=True)[0]['cached'])
+
+    def test_run_batch_gzip(self):
+        results = run_batch([write_minimal_model(self.run_dir_path / 'a')], 1, compress=True)
+        self.assertTrue(results[0]['succeeded'], results[0]['error'])
+        with gzip.open(self.run_dir_path / 'a' / 'in.rpd.gz', 'rt') as rpd_file:
+            self.assertEqual(loads(rpd_file.read())['id'], 'project description root')
+        self.assertFalse((self.run_dir_path / 'a' / 'in.rpd').exists())
+
+    def test_run_batch_parses_inputs_in_processes(self):
+        results = run_batch([write_minimal_model(self.run_dir_path / 'a')], 1, load_process_min_bytes=0)
+        self.assertTrue(results[0]['succeeded'], results[0]['error'])
+        self.assertTrue((self.run_dir_path / 'a' / 'in.rpd').exists())
+
+    def test_run_batch_with_jobs(self):
+        model_paths = [write_minimal_model(self.run_dir_path / 'a')]
+        run_batch(model_paths, 1)
+        serial_rpd = loads((self.run_dir_path / 'a' / 'in.rpd').read_text())
+        results = run_batch(model_paths, 1, jobs=3)
+        self.assertTrue(results[0]['succeeded'], results[0]['error'])
+        rpd = loads((self.run_dir_path / 'a' / 'in.rpd').read_text())
+        serial_rpd['metadata'].pop('time_of_creation', None)
+        rpd['metadata'].pop('time_of_creation', None)
+        self.assertEqual(rpd, serial_rpd)
@@ -0,0 +1,34 @@
+from pathlib import Path
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from energyplus_rpd.compression import find_plain_or_compressed
+from energyplus_rpd.compression import open_text
+from energyplus_rpd.compression import read_text
+from energyplus_rpd.compression import without_compression_suffix
+
+
+class TestCompression(TestCase):
+    def setUp(self) -> None:
+        self.run_dir_path = Path(mkdtemp())
+
+    def test_round_trip(self):
+        for suffix in ['', '.gz', '.bz2', '.xz']:
+            path = self.run_dir_path / f'data.json{suffix}'
+            with open_text(path, 'w') as text_file:
+                text_file.write('{"a": 1}')
+            self.assertEqual(read_text(path), '{"a": 1}')
+        self.assertNotEqual((self.run_dir_path / 'data.json.gz').read_bytes(), b'{"a": 1}')
+
+    def test_find_plain_or_compressed(self):
+        plain_path = self.run_dir_path / 'eplusout.json'
+        self.assertIsNone(find_plain_or_compressed(plain_path))
+        with open_text(self.run_dir_path / 'eplusout.json.xz', 'w') as text_file:
+            text_file.write('{}')
+        self.assertEqual(find_plain_or_compressed(plain_path), self.run_dir_path / 'eplusout.json.xz')
+        plain_path.write_text('{}')
+        self.assertEqual(find_plain_or_compressed(plain_path), plain_path)
+
+    def test_without_compression_suffix(self):
+        self.assertEqual(without_compression_suffix(Path('a/in.epJSON.bz2')), Path('a/in.epJSON'))
+        self.assertEqual(without_compression_suffix(Path('a/in.epJSON')), Path('a/in.epJSON'))
@@ -0,0 +1,39 @@
+from unittest import TestCase
+
+from energyplus_rpd.enumeration_index import EnumerationIndex
+from energyplus_rpd.validator import Validator
+
+
+class TestEnumerationIndex(TestCase):
+
+    def test_contains(self):
+        index = EnumerationIndex({'a.schema.json': {'definitions': {
+            'ColorOptions': {'type': 'string', 'enum': ['RED', 'GREEN']},
+            'Other': {'type': 'object'}}}})
+        self.assertTrue(index.contains('ColorOptions', 'RED'))
+        self.assertTrue(index.contains('ColorOptions', 'green'))
+        self.assertFalse(index.contains('ColorOptions', 'BLUE'))
+        self.assertFalse(index.contains('Other', 'RED'))
+        self.assertFalse(index.contains('Missing', 'RED'))
+        self.assertTrue(index.contains_exactly('ColorOptions', 'RED'))
+        self.assertFalse(index.contains_exactly('ColorOptions', 'red'))
+        self.assertEqual(index.canonical('ColorOptions', 'green'), 'GREEN')
+        self.assertIsNone(index.canonical('ColorOptions', 'blue'))
+        self.assertIsNone(index.canonical('Missing', 'red'))
+        self.assertEqual(index.values('ColorOptions'), frozenset(['RED', 'GREEN']))
+
+    def test_schema_name(self):
+        index = EnumerationIndex({'a.schema.json': {'definitions': {'ColorOptions': {'enum': ['RED']}}},
+                                  'b.schema.json': {'definitions': {'SizeOptions': {'enum': ['SMALL']}}}})
+        self.assertTrue(index.contains('SizeOptions', 'small', 'b.schema.json'))
+        self.assertFalse(index.contains('SizeOptions', 'small', 'a.schema.json'))
+        self.assertEqual(index.values('SizeOptions', 'a.schema.json'), frozenset())
+        self.assertEqual(index.summary(), 'enumeration index: 2 enumerations, 2 values')
+
+    def test_validator_index(self):
+        index = Validator().enumeration_index
+        self.assertTrue(index.contains('LightingSpaceOptions2019ASHRAE901TG37', 'atrium_high'))
+        self.assertFalse(index.contains('LightingSpaceOptions2019ASHRAE901TG37', 'DRY_DOCK'))
+        self.assertEqual(len(index.values('RulesetModelOptionsRESNET')), 4)
+        self.assertEqual(len(index.values('ConstructionClassificationOptions2019T24')), 3)
+        self.assertEqual(len(index.values('EnergySourceOptions')), 9)
@@ -0,0 +1,39 @@
+from unittest import TestCase
+
+from energyplus_rpd.envelope_topology import EnvelopeTopology
+
+
+class TestEnvelopeTopology(TestCase):
+
+    def setUp(self) -> None:
+        self.building_surfaces = {
+            'Wall_A': {'zone_name': 'Zone_A', 'outside_boundary_condition': 'Outdoors'},
+            'Int_Wall_A': {'zone_name': 'Zone_A', 'outside_boundary_condition': 'Surface',
+                           'outside_boundary_condition_object': 'Int_Wall_B'},
+            'Int_Wall_B': {'zone_name': 'Zone_B', 'outside_boundary_condition': 'Surface',
+                           'outside_boundary_condition_object': 'Int_Wall_A'},
+            'Slab_B': {'zone_name': 'Zone_B', 'outside_boundary_condition': 'Ground',
+                       'outside_boundary_condition_object': 'Missing'},
+        }
+        self.subsurfaces = {'WALL_A': [{'id': 'WINDOW_A'}]}
+
+    def test_surfaces_by_zone(self):
+        topology = EnvelopeTopology(self.building_surfaces, self.subsurfaces)
+        self.assertEqual(topology.surfaces_of_zone('ZONE_A'), ['WALL_A', 'INT_WALL_A'])
+        self.assertEqual(topology.surfaces_of_zone('ZONE_B'), ['INT_WALL_B', 'SLAB_B'])
+        self.assertEqual(topology.surfaces_of_zone('ZONE_C'), [])
+        self.assertEqual(topology.zone_by_surface['SLAB_B'], 'ZONE_B')
+
+    def test_adjacency(self):
+        topology = EnvelopeTopology(self.building_surfaces, self.subsurfaces)
+        self.assertEqual(topology.adjacent_surface_by_surface,
+                         {'INT_WALL_A': 'INT_WALL_B', 'INT_WALL_B': 'INT_WALL_A', 'SLAB_B': 'MISSING'})
+        self.assertEqual(topology.adjacent_zone_by_surface, {'INT_WALL_A': 'ZONE_B', 'INT_WALL_B': 'ZONE_A'})
+        self.assertEqual(topology.outside_boundary_condition_by_surface['SLAB_B'], 'GROUND')
+
+    def test_subsurfaces_and_summary(self):
+        topology = EnvelopeTopology(self.building_surfaces, self.subsurfaces)
+        self.assertEqual(topology.subsurfaces_by_surface['WALL_A'][0]['id'], 'WINDOW_A')
+        self.assertTrue(topology.is_built_from(self.building_surfaces))
+        self.assertFalse(topology.is_built_from(dict(self.building_surfaces)))
+        self.assertEqual(topology.summary(), 'envelope topology: 2 zones, 4 surfaces, 1 subsurfaces')
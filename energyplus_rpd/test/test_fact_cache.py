@@ -0,0 +1,49 @@
+from unittest import TestCase
+
+from energyplus_rpd.fact_cache import FactCache, cached_fact
+
+
+class Holder:
+    def __init__(self):
+        self.fact_cache = FactCache()
+        self.calls = 0
+
+    @cached_fact()
+    def gather_numbers(self):
+        self.calls += 1
+        return [1, 2, 3]
+
+    @cached_fact('letters')
+    def gather_letters(self):
+        self.calls += 1
+        return ['a']
+
+
+class TestFactCache(TestCase):
+
+    def test_get_counts_hits_and_misses(self):
+        cache = FactCache()
+        self.assertEqual(cache.get('x', lambda: 1), 1)
+        self.assertEqual(cache.get('x', lambda: 2), 1)
+        self.assertEqual(cache.hits, {'x': 1})
+        self.assertEqual(cache.misses, {'x': 1})
+        self.assertEqual(cache.summary(), 'fact cache: x 1 hits 1 misses')
+
+    def test_invalidate(self):
+        cache = FactCache()
+        self.assertEqual(cache.summary(), 'fact cache: empty')
+        cache.get('x', lambda: 1)
+        cache.get('y', lambda: 1)
+        cache.invalidate('x')
+        self.assertEqual(list(cache.values), ['y'])
+        self.assertEqual(cache.get('x', lambda: 2), 2)
+        cache.invalidate()
+        self.assertEqual(cache.values, {})
+
+    def test_cached_fact(self):
+        holder = Holder()
+        self.assertIs(holder.gather_numbers(), holder.gather_numbers())
+        holder.gather_letters()
+        self.assertEqual(holder.calls, 2)
+        self.assertEqual(sorted(holder.fact_cache.values), ['gather_numbers', 'letters'])
+        self.assertEqual(Holder.gather_numbers.__name__, 'gather_numbers')
@@ -0,0 +1,83 @@
+from json import dumps
+from pathlib import Path
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from energyplus_rpd.hourly_store import HourlyStore
+from energyplus_rpd.hourly_store import column_key
+
+
+def make_cols(*names):
+    return [{"Variable": f"{name}:Schedule Value"} for name in names]
+
+
+class TestHourlyStore(TestCase):
+
+    def test_hourly_values(self):
+        store = HourlyStore.from_object({"Cols": make_cols('ONE', 'TWO', 'THREE'), "Rows": [
+            {"01/01 01:00:00": [1, 11, 21]},
+            {"01/01 02:00:00": [2, 12, 22]},
+            {"01/01 03:00:00": [3, 13, 23]},
+        ]})
+        self.assertEqual(store.row_count, 3)
+        self.assertEqual(store.timestamps, ['01/01 01:00:00', '01/01 02:00:00', '01/01 03:00:00'])
+        self.assertEqual(store.column('ONE').tolist(), [1., 2., 3.])
+        self.assertEqual(store.split_design_days('THREE'), ([21., 22., 23.], [], []))
+        self.assertFalse(store.has_design_days())
+        self.assertTrue(store.is_numeric())
+
+    def test_lookup_by_name(self):
+        self.assertEqual(column_key('Office Occ:Schedule Value'), 'OFFICE OCC')
+        store = HourlyStore.from_object({"Cols": make_cols('ONE') + [{"Variable": "Site Outdoor Air Drybulb"}],
+                                         "Rows": [{"01/01 01:00:00": [5, 6]}]})
+        self.assertEqual(store.find('one'), 0)
+        self.assertEqual(store.find('ONE:Schedule Value'), 0)
+        self.assertEqual(store.column('site outdoor air drybulb').tolist(), [6.])
+        self.assertIsNone(store.find('TWO'))
+        with self.assertRaises(KeyError):
+            store.column('TWO')
+
+    def test_repeated_name_finds_last_column(self):
+        store = HourlyStore.from_object({"Cols": make_cols('ONE', 'TWO', 'ONE'),
+                                         "Rows": [{"01/01 01:00:00": [1, 2, 3]}]})
+        self.assertEqual(store.find('ONE'), 2)
+        self.assertEqual(store.column('ONE').tolist(), [3.])
+
+    def test_no_rows(self):
+        store = HourlyStore.from_object({"Cols": make_cols('ONE')})
+        self.assertEqual(store.column('ONE').tolist(), [])
+        self.assertEqual(store.row_count, 0)
+        store = HourlyStore.from_object({"Cols": [], "Rows": [{"01/01 01:00:00": [5, 6]}]})
+        self.assertEqual(store.row_count, 1)
+        self.assertIsNone(store.find('ONE'))
+
+    def test_values_that_are_not_numbers(self):
+        store = HourlyStore.from_object({"Cols": make_cols('ONE', 'TWO'), "Rows": [{"01/01 01:00:00": [None, 2]}]})
+        self.assertFalse(store.is_numeric())
+        self.assertEqual(store.split_design_days('ONE'), ([None], [], []))
+        self.assertEqual(store.column('TWO').tolist(), [2.])
+
+    def test_split_design_days(self):
+        rows = [{f'row {index}': [index, -index]} for index in range(8808)]
+        store = HourlyStore.from_object({"Cols": make_cols('A', 'B'), "Rows": rows})
+        self.assertTrue(store.has_design_days())
+        design_cooling_hourly, design_heating_hourly = store.design_days('B')
+        # the periods are views of the column rather than copies
+        self.assertIsInstance(design_cooling_hourly, memoryview)
+        self.assertIs(store.annual('B').obj, store.columns[1])
+        hourly, design_cooling_hourly, design_heating_hourly = store.split_design_days('B')
+        self.assertEqual(len(hourly), 8760)
+        self.assertEqual(hourly[0], -48.)
+        self.assertEqual(design_cooling_hourly, [float(-x) for x in range(24)])
+        self.assertEqual(design_heating_hourly, [float(-x) for x in range(24, 48)])
+
+    def test_from_stream(self):
+        hourly_path = Path(mkdtemp()) / 'in_hourly.json'
+        hourly_path.write_text(dumps({"Cols": make_cols('A', 'B', 'C'),
+                                      "Rows": [{"01/01 01:00:00": [1, 2, 3]}, {"01/01 02:00:00": [4, 5, 6]}]}))
+        store = HourlyStore.from_stream(hourly_path, lambda cols: {'C': 2, 'A': 0})
+        self.assertEqual(store.row_count, 2)
+        self.assertEqual(store.cols, make_cols('C', 'A'))
+        self.assertEqual(store.column('C').tolist(), [3., 6.])
+        self.assertEqual(store.column('A').tolist(), [1., 4.])
+        self.assertIsNone(store.find('B'))
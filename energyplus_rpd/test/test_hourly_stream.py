@@ -0,0 +1,74 @@
+import gzip
+from json import dumps
+from pathlib import Path
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from energyplus_rpd.hourly_stream import HourlyJsonStream
+from energyplus_rpd.hourly_stream import load_hourly_columns
+
+
+def select_b_and_c(cols):
+    return {col['Variable']: index for index, col in enumerate(cols) if col['Variable'] in ['B', 'C']}
+
+
+class TestHourlyStream(TestCase):
+    def setUp(self) -> None:
+        self.run_dir_path = Path(mkdtemp())
+        self.hourly = {
+            'Cols': [{'Variable': 'A'}, {'Variable': 'B'}, {'Variable': 'C'}],
+            'ReportFrequency': 'Hourly',
+            'Rows': [{f'01/01 {hour:02d}:00:00': [hour, 100.5 + hour, -1234567.25 * hour]} for hour in range(1, 25)],
+            'Trailing': {'nested': [1, 2, {'x': 'y'}]}
+        }
+
+    def write(self, contents) -> Path:
+        hourly_path = self.run_dir_path / 'inout_hourly.json'
+        hourly_path.write_text(contents)
+        return hourly_path
+
+    def test_iterate_members(self):
+        hourly_path = self.write(dumps(self.hourly, indent=2))
+        members = {}
+        for key, value in HourlyJsonStream(hourly_path, chunk_size=5).iterate_members():
+            members[key] = list(value) if key == 'Rows' else value
+        self.assertEqual(members, self.hourly)
+
+    def test_load_hourly_columns(self):
+        for chunk_size in [1, 3, 7, 64, 1 << 20]:
+            hourly_path = self.write(dumps(self.hourly))
+            cols, columns, row_count = load_hourly_columns(hourly_path, select_b_and_c, chunk_size)
+            self.assertEqual(cols, self.hourly['Cols'])
+            self.assertEqual(row_count, 24)
+            self.assertEqual(list(columns.keys()), ['B', 'C'])
+            self.assertEqual(columns['B'].tolist(), [100.5 + hour for hour in range(1, 25)])
+            self.assertEqual(columns['C'].tolist(), [-1234567.25 * hour for hour in range(1, 25)])
+
+    def test_compressed(self):
+        hourly_path = self.run_dir_path / 'inout_hourly.json.gz'
+        with gzip.open(hourly_path, 'wt') as hourly_file:
+            hourly_file.write(dumps(self.hourly))
+        _, columns, row_count = load_hourly_columns(hourly_path, select_b_and_c, 64)
+        self.assertEqual(row_count, 24)
+        self.assertEqual(columns['B'].tolist(), [100.5 + hour for hour in range(1, 25)])
+
+    def test_rows_before_cols(self):
+        hourly_path = self.write(dumps({'Rows': self.hourly['Rows'], 'Cols': self.hourly['Cols']}))
+        _, columns, row_count = load_hourly_columns(hourly_path, select_b_and_c, 11)
+        self.assertEqual(row_count, 24)
+        self.assertEqual(columns['B'].tolist(), [100.5 + hour for hour in range(1, 25)])
+
+    def test_empty_and_invalid(self):
+        self.assertEqual(load_hourly_columns(self.write('{}'), select_b_and_c), ([], {}, 0))
+        self.assertEqual(load_hourly_columns(self.write('{"Cols": []}'), select_b_and_c), ([], {}, 0))
+        with self.assertRaises(Exception):
+            load_hourly_columns(self.write('{"Cols": [], "Rows": [{"a": [1]}'), select_b_and_c)
+
+    def test_null_values(self):
+        self.hourly['Rows'][3] = {'01/01 04:00:00': [4, None, -1234567.25 * 4]}
+        for hourly in [self.hourly, {'Rows': self.hourly['Rows'], 'Cols': self.hourly['Cols']}]:
+            hourly_path = self.write(dumps(hourly))
+            _, columns, row_count = load_hourly_columns(hourly_path, select_b_and_c, 64)
+            self.assertEqual(row_count, 24)
+            self.assertEqual(columns['B'], [100.5 + hour if hour != 4 else None for hour in range(1, 25)])
+            self.assertEqual(columns['C'].tolist(), [-1234567.25 * hour for hour in range(1, 25)])
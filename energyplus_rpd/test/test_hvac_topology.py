@@ -0,0 +1,91 @@
+from unittest import TestCase
+
+from energyplus_rpd.hvac_topology import HvacTopology
+from energyplus_rpd.hvac_topology import component_roles
+
+
+def supply_row(airloop, branch, component, sub_component=('', ''), sub_sub_component=('', '')):
+    return {
+        'Airloop Name': airloop,
+        'Supply Branch Name': branch,
+        'Component Type': component[0],
+        'Component Name': component[1],
+        'Sub-Component Type': sub_component[0],
+        'Sub-Component Name': sub_component[1],
+        'Sub-Sub-Component Type': sub_sub_component[0],
+        'Sub-Sub-Component Name': sub_sub_component[1],
+    }
+
+
+def zone_equipment_row(zone, component, sub_component=('', ''), sub_sub_component=('', '')):
+    return {
+        'Zone Name': zone,
+        'Component Type': component[0],
+        'Component Name': component[1],
+        'Sub-Component Type': sub_component[0],
+        'Sub-Component Name': sub_component[1],
+        'Sub-Sub-Component Type': sub_sub_component[0],
+        'Sub-Sub-Component Name': sub_sub_component[1],
+    }
+
+
+class TestHvacTopology(TestCase):
+
+    def test_component_roles(self):
+        self.assertEqual(component_roles('FAN:ZONEEXHAUST'), frozenset(['fan', 'zone_exhaust_fan']))
+        self.assertEqual(component_roles('COIL:COOLING:DX:SINGLESPEED'), frozenset(['cooling_coil']))
+        self.assertEqual(component_roles('ZONEHVAC:BASEBOARD:RADIANTCONVECTIVE:WATER'),
+                         frozenset(['baseboard', 'radiant']))
+        self.assertEqual(component_roles(''), frozenset())
+
+    def test_supply_side(self):
+        airloop_supplies = [
+            supply_row('VAV_1', 'VAV_1 MAIN', ('AIRLOOPHVAC:OUTDOORAIRSYSTEM', 'VAV_1 OA SYS')),
+            supply_row('VAV_1', 'VAV_1 MAIN', ('COIL:COOLING:WATER', 'VAV_1 CLG COIL')),
+            supply_row('VAV_1', 'VAV_1 MAIN', ('COIL:HEATING:WATER', 'VAV_1 HTG COIL')),
+            supply_row('VAV_1', 'VAV_1 MAIN', ('COIL:HEATING:ELECTRIC', 'VAV_1 BACKUP COIL')),
+            supply_row('VAV_1', 'VAV_1 MAIN', ('FAN:VARIABLEVOLUME', 'VAV_1 FAN')),
+            supply_row('PSZ_1', 'PSZ_1 MAIN', ('AIRLOOPHVAC:UNITARYSYSTEM', 'PSZ_1 UNIT'),
+                       ('FAN:ONOFF', 'PSZ_1 FAN'), ('', '')),
+            supply_row('PSZ_1', 'PSZ_1 MAIN', ('HUMIDIFIER:STEAM:ELECTRIC', 'PSZ_1 HUMIDIFIER')),
+        ]
+        topology = HvacTopology(airloop_supplies, [], [])
+        self.assertEqual(topology.supply_topology_by_airloop, {
+            'VAV_1': {'cooling_coil': 'VAV_1 CLG COIL', 'main_heating_coil': 'VAV_1 HTG COIL',
+                      'backup_heating_coil': 'VAV_1 BACKUP COIL', 'supply_fan': 'VAV_1 FAN'},
+            'PSZ_1': {'supply_fan': 'PSZ_1 FAN'},
+        })
+        self.assertEqual(topology.airloop_by_oa_system, {'VAV_1 OA SYS': 'VAV_1'})
+        self.assertEqual(topology.humid_option_by_airloop, {'PSZ_1': 'OTHER'})
+        self.assertEqual(topology.neighbors(('airloop', 'VAV_1'), 'has_oa_system'), [('oa_system', 'VAV_1 OA SYS')])
+        self.assertEqual(topology.neighbors(('component', 'PSZ_1 UNIT'), 'contains'), [('component', 'PSZ_1 FAN')])
+
+    def test_demand_side_and_zone_equipment(self):
+        airloop_demands = [
+            {'Airloop Name': 'VAV_1', 'Terminal Unit Name': 'Z1 VAV BOX', 'Zone Name': 'Z1', 'first column': '1'},
+            {'Airloop Name': 'VAV_1', 'Terminal Unit Name': 'Z2 VAV BOX', 'Zone Name': 'Z2', 'first column': '2'},
+        ]
+        zone_equipments = [
+            zone_equipment_row('Z1', ('ZONEHVAC:AIRDISTRIBUTIONUNIT', 'Z1 ADU'),
+                               ('AIRTERMINAL:SINGLEDUCT:VAV:REHEAT', 'Z1 VAV BOX'),
+                               ('COIL:HEATING:WATER', 'Z1 REHEAT COIL')),
+            zone_equipment_row('Z2', ('', ''), ('FAN:ZONEEXHAUST', 'Z2 EXHAUST FAN')),
+        ]
+        topology = HvacTopology([], airloop_demands, zone_equipments)
+        self.assertEqual(topology.zones_by_airloop, {'VAV_1': ['Z1', 'Z2']})
+        self.assertEqual(topology.zone_by_terminal, {'Z1 VAV BOX': 'Z1', 'Z2 VAV BOX': 'Z2'})
+        self.assertEqual(topology.airloop_by_zone, {'Z1': 'VAV_1', 'Z2': 'VAV_1'})
+        self.assertEqual(topology.exhaust_fans_by_airloop, {'VAV_1': ['Z2 EXHAUST FAN']})
+        zone_equipment = topology.zone_equipment_by_zone['Z1'][0]
+        self.assertTrue(zone_equipment['has_ADU'])
+        self.assertTrue(zone_equipment['has_vav'])
+        self.assertEqual(zone_equipment['main_heating_coil'], 'Z1 REHEAT COIL')
+        self.assertEqual(topology.neighbors(('terminal', 'Z1 VAV BOX'), 'terminal_for'), [('zone', 'Z1')])
+        self.assertEqual(topology.summary(), f'hvac topology: {len(topology.nodes)} nodes, {topology.edge_count} edges')
+
+    def test_repeated_edges_are_added_once(self):
+        airloop_demands = [{'Airloop Name': 'VAV_1', 'Terminal Unit Name': f'Z{index} VAV BOX',
+                            'Zone Name': f'Z{index}', 'first column': str(index)} for index in range(2000)]
+        topology = HvacTopology([], airloop_demands + airloop_demands, [])
+        self.assertEqual(len(topology.neighbors(('airloop', 'VAV_1'))), 2000)
+        self.assertEqual(topology.edge_count, len(topology.edge_set))
@@ -0,0 +1,34 @@
+from unittest import TestCase
+
+from energyplus_rpd.id_registry import IdRegistry, find_duplicate_ids
+
+
+class TestIdRegistry(TestCase):
+
+    def test_assign(self):
+        registry = IdRegistry()
+        self.assertEqual(registry.assign('a'), 'a')
+        self.assertEqual(registry.assign('a'), 'a~~~00000001')
+        self.assertEqual(registry.assign('b'), 'b')
+        self.assertEqual(registry.assign('b~~~00000009'), 'b~~~00000002')
+
+    def test_assign_nested_keeps_walk_order(self):
+        registry = IdRegistry()
+        model = {'id': 'm',
+                 'zones': [{'id': 'z', 'surfaces': [{'id': 's'}, {'id': 'z'}]}, {'id': 'z'}],
+                 'other': {'id': 's'}}
+        registry.assign_nested(model)
+        self.assertEqual(model['zones'][0]['surfaces'][1]['id'], 'z~~~00000001')
+        self.assertEqual(model['zones'][1]['id'], 'z~~~00000002')
+        self.assertEqual(model['other']['id'], 's~~~00000003')
+        self.assertEqual(find_duplicate_ids(model), [])
+
+    def test_skipped_keys(self):
+        registry = IdRegistry(['hourly_values'])
+        model = {'schedules': [{'id': 'x', 'hourly_values': [1.0, 2.0]}, {'id': 'x', 'values': [{'id': 'x'}]}],
+                 'hourly_values': [{'id': 'x'}]}
+        registry.assign_nested(model)
+        self.assertEqual(model['schedules'][1]['id'], 'x~~~00000001')
+        self.assertEqual(model['schedules'][1]['values'][0]['id'], 'x~~~00000002')
+        self.assertEqual(model['hourly_values'][0]['id'], 'x')
+        self.assertEqual(find_duplicate_ids(model), ['x'])
@@ -0,0 +1,93 @@
+import os
+import shutil
+from json import dumps, loads
+from pathlib import Path
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from energyplus_rpd.input_cache import InputCache
+from energyplus_rpd.input_file import InputFile
+from energyplus_rpd.runner import run_with_path
+from energyplus_rpd.test.model_files import write_minimal_model
+
+
+class TestInputCache(TestCase):
+    def setUp(self) -> None:
+        self.run_dir_path = Path(mkdtemp())
+        self.cache = InputCache(self.run_dir_path / 'cache')
+        self.hourly = {"Cols": [{"Variable": "A:Schedule Value"}, {"Variable": "B:Schedule Value"}],
+                       "Rows": [{"01/01 01:00:00": [0.5, 1]}, {"01/01 02:00:00": [0.25, 2]}]}
+
+    def test_miss_then_hit(self):
+        input_file_path = write_minimal_model(self.run_dir_path, hourly_results=self.hourly)
+        first = InputFile(input_file_path, cache=self.cache)
+        second = InputFile(input_file_path, cache=self.cache)
+        self.assertEqual(self.cache.summary(), f'input cache: 1 hits, 1 misses in {self.cache.cache_dir}')
+        self.assertEqual(second.epjson_object, first.epjson_object)
+        self.assertEqual(second.json_results_object, {"TabularReports": []})
+        self.assertEqual(second.json_hourly_results_object, {"Cols": self.hourly["Cols"]})
+        self.assertIsInstance(second.hourly_store.columns[0], memoryview)
+        self.assertEqual(second.hourly_store.timestamps, ['01/01 01:00:00', '01/01 02:00:00'])
+        self.assertEqual(second.hourly_store.column('B').tolist(), [1., 2.])
+        self.assertEqual([column.tolist() for column in second.hourly_store.columns],
+                         [column.tolist() for column in first.hourly_store.columns])
+
+    def test_changed_source_is_parsed_again(self):
+        input_file_path = write_minimal_model(self.run_dir_path, hourly_results=self.hourly)
+        InputFile(input_file_path, cache=self.cache)
+        self.hourly["Rows"][0]["01/01 01:00:00"][0] = 0.75
+        (self.run_dir_path / 'inout_hourly.json').write_text(dumps(self.hourly))
+        changed = InputFile(input_file_path, cache=self.cache)
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(changed.hourly_store.column('A').tolist(), [0.75, 0.25])
+        # the same contents with a new modification time are found by their hash
+        os.utime(input_file_path, (0, 0))
+        InputFile(input_file_path, cache=self.cache)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_values_that_are_not_numbers_are_not_cached(self):
+        self.hourly["Rows"][0]["01/01 01:00:00"][0] = None
+        input_file_path = write_minimal_model(self.run_dir_path, hourly_results=self.hourly)
+        InputFile(input_file_path, cache=self.cache)
+        loaded = InputFile(input_file_path, cache=self.cache)
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(loaded.hourly_store.column('A'), [None, 0.25])
+
+    def test_damaged_entry_is_replaced(self):
+        input_file_path = write_minimal_model(self.run_dir_path, hourly_results=self.hourly)
+        InputFile(input_file_path, cache=self.cache)
+        entry_path = self.cache.entry_path(input_file_path)
+        entry_path.write_bytes(entry_path.read_bytes()[:-20])
+        InputFile(input_file_path, cache=self.cache)
+        loaded = InputFile(input_file_path, cache=self.cache)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(loaded.hourly_store.column('B').tolist(), [1., 2.])
+
+    def test_stream_hourly_entry_has_no_columns(self):
+        input_file_path = write_minimal_model(self.run_dir_path, hourly_results=self.hourly)
+        InputFile(input_file_path, stream_hourly=True, cache=self.cache)
+        streamed = InputFile(input_file_path, stream_hourly=True, cache=self.cache)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertIsNone(streamed.hourly_store)
+        InputFile(input_file_path, cache=self.cache)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_same_rpd_with_input_cache(self):
+        resources_path = Path(__file__).parent / 'resources'
+        for name in ['test_input.epJSON', 'test_inputout.json', 'test_inputout_hourly.json']:
+            shutil.copy(resources_path / name, self.run_dir_path / name)
+        input_file_path = self.run_dir_path / 'test_input.epJSON'
+        rpd_file_path = self.run_dir_path / 'test_input.rpd'
+
+        def read_rpd():
+            rpd = loads(rpd_file_path.read_text())
+            del rpd['metadata']['time_of_creation']
+            return rpd
+
+        run_with_path(input_file_path)
+        expected = read_rpd()
+        for _ in range(2):
+            rpd_file_path.unlink()
+            run_with_path(input_file_path, input_cache=self.cache)
+            self.assertEqual(read_rpd(), expected)
+        self.assertEqual(self.cache.hits, 1)
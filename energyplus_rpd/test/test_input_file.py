@@ -3,6 +3,7 @@ from pathlib import Path
 from tempfile import mkdtemp
 from unittest import TestCase
 
+from energyplus_rpd.compression import open_text
 from energyplus_rpd.input_file import InputFile
 
 
@@ -46,3 +47,48 @@ class TestInputFile(TestCase):
         real_file.write_text("Hello!")
         with self.assertRaises(Exception):
             InputFile(real_file)
+
+    def test_compressed_inputs(self):
+        for suffix in ['.gz', '.bz2', '.xz']:
+            run_dir_path = Path(mkdtemp())
+            contents = {
+                run_dir_path / f'real.epJSON{suffix}': {"Version": {"Version 1": {"version_identifier": "22.1"}}},
+                run_dir_path / f'eplusout.json{suffix}': {"out": 7},
+                run_dir_path / f'realout_hourly.json{suffix}': {"Cols": []},
+            }
+            for path, value in contents.items():
+                with open_text(path, 'w') as text_file:
+                    text_file.write(dumps(value))
+            i = InputFile(run_dir_path / f'real.epJSON{suffix}')
+            self.assertIn('Version', i.epjson_object)
+            self.assertEqual(i.json_results_object, {"out": 7})
+            self.assertEqual(i.json_results_input_path, run_dir_path / f'eplusout.json{suffix}')
+            self.assertEqual(i.json_hourly_results_object, {"Cols": []})
+
+    def test_concurrent_errors_in_file_order(self):
+        real_file = self.run_dir_path / 'real.epJSON'
+        real_file.write_text("Hello!")
+        for concurrent in [True, False]:
+            with self.assertRaises(ValueError):
+                InputFile(real_file, concurrent=concurrent)
+        real_file.write_text(dumps({"Version": {"Version 1": {"version_identifier": "22.1"}}}))
+        for concurrent in [True, False]:
+            with self.assertRaisesRegex(Exception, 'Could not find EnergyPlus results JSON file at path: .*realout'):
+                InputFile(real_file, concurrent=concurrent)
+
+    def test_load_times(self):
+        real_file = self.run_dir_path / 'real.epJSON'
+        real_file.write_text(dumps({"Version": {"Version 1": {"version_identifier": "22.1"}}}))
+        (self.run_dir_path / 'realout.json').write_text(dumps({"out": 7}))
+        (self.run_dir_path / 'realout_hourly.json').write_text(dumps({"Cols": []}))
+        serial = InputFile(real_file)
+        for i in [InputFile(real_file, concurrent=True), InputFile(real_file, process_min_bytes=0)]:
+            self.assertEqual(i.epjson_object, serial.epjson_object)
+            self.assertEqual(i.json_results_object, {"out": 7})
+            self.assertEqual(i.json_hourly_results_object, {"Cols": []})
+            self.assertEqual(list(sorted(i.load_times)), ['epjson', 'hourly', 'results'])
+            self.assertRegex(i.timing_summary(),
+                             r'input files: loaded in \d+\.\d{3} s \(epjson \d+\.\d{3} s, results \d+\.\d{3} s, '
+                             r'hourly \d+\.\d{3} s\)')
+        streamed = InputFile(real_file, stream_hourly=True)
+        self.assertNotIn('hourly', streamed.load_times)
@@ -0,0 +1,44 @@
+import json
+from math import isnan
+from unittest import TestCase
+
+from energyplus_rpd.json_codec import JsonCodec
+from energyplus_rpd.json_codec import available_backend_names
+from energyplus_rpd.json_codec import get_codec
+
+
+class TestJsonCodec(TestCase):
+
+    def setUp(self) -> None:
+        self.value = {'id': 'a', 'values': [0.5, 1.0, 2], 'nested': {'text': 'x, y/é', 'empty': [], 'none': None}}
+
+    def test_backends_round_trip(self):
+        for backend_name in available_backend_names():
+            codec = JsonCodec(backend_name)
+            self.assertEqual(codec.loads(codec.dumps(self.value)), self.value)
+            self.assertEqual(codec.loads(codec.dumps_indented(self.value)), self.value)
+            self.assertNotIn(' ', codec.dumps({'a': [1, 2]}))
+            self.assertEqual(codec.dumps_indented({'a': [1, 2]}), '{\n  "a": [\n    1,\n    2\n  ]\n}')
+
+    def test_stdlib_matches_json_module(self):
+        codec = JsonCodec('stdlib')
+        self.assertEqual(codec.dumps(self.value), json.dumps(self.value, separators=(',', ':')))
+        self.assertEqual(codec.dumps_indented(self.value), json.dumps(self.value, indent=2))
+        self.assertEqual(codec.dumps_indented([1, 2]), json.dumps([1, 2], indent=2))
+
+    def test_fallback_to_json_module(self):
+        for backend_name in available_backend_names():
+            codec = JsonCodec(backend_name)
+            self.assertTrue(isnan(codec.loads('[NaN]')[0]))
+            self.assertEqual(codec.dumps([2 ** 70]), '[1180591620717411303424]')
+            with self.assertRaises(ValueError):
+                codec.loads('{')
+
+    def test_unknown_backend(self):
+        with self.assertRaises(Exception):
+            JsonCodec('simplejson2')
+
+    def test_default_codec(self):
+        self.assertIs(get_codec(), get_codec())
+        self.assertIn(get_codec().name, available_backend_names())
+        self.assertEqual(available_backend_names()[-1], 'stdlib')
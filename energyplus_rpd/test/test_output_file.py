@@ -1,9 +1,11 @@
-from json import loads
+import gzip
+from json import dumps, loads
 from pathlib import Path
 from tempfile import mkdtemp
 from unittest import TestCase
 
 from energyplus_rpd.output_file import OutputFile
+from energyplus_rpd.output_file import iterencode
 
 
 class TestOutputFile(TestCase):
@@ -17,3 +19,35 @@ class TestOutputFile(TestCase):
         o.write(output_dict)
         written_json = loads(out_file.read_text())
         self.assertIn('message', written_json)
+
+    def test_pretty_matches_indented_dumps(self):
+        out_file = self.run_dir_path / 'output.rpd'
+        output_dict = {'id': 'a', 'schedules': [{'id': 'b', 'hourly_values': [0.5, 1.0, 2]}, {}], 'empty': [],
+                       'nested': {'list': [[1, 2], {'c': None}], 'text': 'x, y'}}
+        o = OutputFile(out_file)
+        o.write(output_dict)
+        self.assertEqual(out_file.read_text(), dumps(output_dict, indent=2))
+        self.assertEqual(o.bytes_written, len(dumps(output_dict, indent=2)))
+        self.assertIn('pretty', o.summary())
+
+    def test_compact(self):
+        out_file = self.run_dir_path / 'output.rpd'
+        output_dict = {'id': 'a', 'schedules': [{'id': 'b', 'hourly_values': [0.5, 1.0, 2]}], 1: True}
+        o = OutputFile(out_file, compact=True)
+        o.write(output_dict)
+        self.assertEqual(out_file.read_text(),
+                         '{"id":"a","schedules":[{"id":"b","hourly_values":[0.5,1.0,2]}],"1":true}')
+        self.assertIn('compact', o.summary())
+
+    def test_iterencode_in_pieces(self):
+        value = {'a': [{'b': [1, 2]}, {'c': 3}]}
+        pieces = list(iterencode(value))
+        self.assertGreater(len(pieces), 1)
+        self.assertEqual(''.join(pieces), dumps(value, indent=2))
+
+    def test_gzip(self):
+        o = OutputFile(self.run_dir_path / 'output.epJSON.gz', compress=True)
+        self.assertEqual(o.rpd_file_path, self.run_dir_path / 'output.rpd.gz')
+        o.write({'message': 'compressed'})
+        with gzip.open(o.rpd_file_path, 'rt') as rpd_file:
+            self.assertEqual(loads(rpd_file.read()), {'message': 'compressed'})
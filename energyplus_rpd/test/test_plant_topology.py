@@ -0,0 +1,61 @@
+from unittest import TestCase
+
+from energyplus_rpd.plant_topology import PlantTopology
+
+
+def plant_row(loop_name, side, branch_name, component_type, component_name):
+    return {
+        'Loop Name': loop_name,
+        'Side': side,
+        'Branch Name': branch_name,
+        'Component Type': component_type,
+        'Component Name': component_name,
+    }
+
+
+class TestPlantTopology(TestCase):
+
+    def setUp(self) -> None:
+        self.rows = [
+            plant_row('CHW LOOP', 'Supply', 'CHW PUMP BRANCH', 'PUMP:VARIABLESPEED', 'CHW PUMP'),
+            plant_row('CHW LOOP', 'Supply', 'CHW CHILLER BRANCH', 'CHILLER:ELECTRIC:EIR', 'CHILLER 1'),
+            plant_row('CHW LOOP', 'Supply', 'CHW CHILLER BRANCH', 'HeatExchanger:FluidToFluid', 'HX 1'),
+            plant_row('CW LOOP', 'Supply', 'CW TOWER BRANCH', 'PUMP:CONSTANTSPEED', 'CW PUMP'),
+            plant_row('CW LOOP', 'Supply', 'CW TOWER BRANCH', 'COOLINGTOWER:SINGLESPEED', 'TOWER 1'),
+            plant_row('CW LOOP', 'Demand', 'CW CHILLER BRANCH', 'CHILLER:ELECTRIC:EIR', 'CHILLER 1'),
+            plant_row('HW LOOP', 'Supply', 'HW BOILER BRANCH', 'BOILER:HOTWATER', 'BOILER 1'),
+            plant_row('HW LOOP', 'Supply', 'HW BOILER BRANCH', 'PUMP:VARIABLESPEED', 'HW PUMP'),
+        ]
+
+    def test_indexes(self):
+        topology = PlantTopology(self.rows)
+        self.assertEqual(list(topology.rows_by_loop.keys()), ['CHW LOOP', 'CW LOOP', 'HW LOOP'])
+        self.assertEqual(len(topology.branches[('CHW LOOP', 'Supply', 'CHW CHILLER BRANCH')]), 2)
+        self.assertEqual(topology.pump_names_by_loop, {'CHW LOOP': ['CHW PUMP'], 'CW LOOP': ['CW PUMP'],
+                                                       'HW LOOP': ['HW PUMP']})
+        self.assertEqual(len(topology.rows_of_type('CHILLER:ELECTRIC:EIR')), 2)
+        self.assertEqual(topology.branch_of_component('chiller 1', 'demand'), 'CW CHILLER BRANCH')
+        self.assertFalse(topology.reports_no_loops)
+        self.assertEqual(topology.summary(), 'plant topology: 3 loops, 5 branches, 8 rows')
+
+    def test_is_pump_on_component_branch(self):
+        topology = PlantTopology(self.rows)
+        self.assertFalse(topology.is_pump_on_component_branch('CHILLER 1', 'Supply'))
+        self.assertTrue(topology.is_pump_on_component_branch('TOWER 1', 'Supply'))
+        self.assertTrue(topology.is_pump_on_component_branch('BOILER 1', 'Supply'))
+        self.assertFalse(topology.is_pump_on_component_branch('BOILER 1', 'Demand'))
+
+    def test_do_component_types_share_branch(self):
+        topology = PlantTopology(self.rows)
+        self.assertTrue(topology.do_component_types_share_branch('chiller', 'heatexchanger'))
+        self.assertFalse(topology.do_component_types_share_branch('tower', 'heatexchanger'))
+
+    def test_likely_loop_types(self):
+        topology = PlantTopology(self.rows)
+        self.assertEqual(topology.likely_loop_types(), {'CHW LOOP': 'COOLING', 'CW LOOP': 'CONDENSER',
+                                                        'HW LOOP': 'HEATING'})
+
+    def test_reports_no_loops(self):
+        topology = PlantTopology([{'Loop Name': '', 'first column': 'None'}])
+        self.assertTrue(topology.reports_no_loops)
+        self.assertFalse(PlantTopology([]).reports_no_loops)
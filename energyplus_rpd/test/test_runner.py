@@ -0,0 +1,30 @@
+import contextlib
+import io
+from pathlib import Path
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from energyplus_rpd.runner import build_argument_parser
+from energyplus_rpd.runner import run_with_path
+from energyplus_rpd.test.benchmark_startup import import_times
+from energyplus_rpd.test.benchmark_startup import loaded_heavy_modules
+from energyplus_rpd.test.model_files import write_minimal_model
+
+
+class TestRunner(TestCase):
+    def test_import_does_not_load_heavy_modules(self):
+        # the command line has to start quickly for --help and for RPD files found in the cache
+        times = import_times('energyplus_rpd.runner')
+        self.assertEqual(loaded_heavy_modules(times, 'energyplus_rpd.runner'), [])
+
+    def test_implementation_report_is_opt_in(self):
+        parser = build_argument_parser()
+        self.assertFalse(parser.parse_args(['in.epJSON']).implementation_report)
+        self.assertTrue(parser.parse_args(['in.epJSON', '--implementation_report']).implementation_report)
+
+    def test_timings_report_the_caches(self):
+        input_file_path = write_minimal_model(Path(mkdtemp()))
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(run_with_path(input_file_path, timings=True), 0)
+        self.assertIn('fact cache: ', output.getvalue())
+        self.assertRegex(output.getvalue(), r'tabular catalog: \d+ tables indexed, \d+ lookups served')
@@ -0,0 +1,133 @@
+import shutil
+import socket
+from http.client import HTTPConnection
+from json import dumps, loads
+from pathlib import Path
+from tempfile import mkdtemp
+from threading import Thread
+from unittest import TestCase, skipUnless
+
+from energyplus_rpd.service import TranslationService
+from energyplus_rpd.service import make_server
+
+
+class UnixHTTPConnection(HTTPConnection):
+    def __init__(self, socket_path: Path):
+        super().__init__('localhost')
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(str(self.socket_path))
+
+
+class TestService(TestCase):
+    def setUp(self) -> None:
+        self.run_dir_path = Path(mkdtemp())
+        resources_path = Path(__file__).parent / 'resources'
+        for name in ['test_input.epJSON', 'test_inputout.json', 'test_inputout_hourly.json']:
+            shutil.copy(resources_path / name, self.run_dir_path / name)
+        self.input_file_path = self.run_dir_path / 'test_input.epJSON'
+        self.service = TranslationService(workers=1, max_queued=0)
+
+    def start(self, socket_path=None):
+        server = make_server(self.service, port=0, socket_path=socket_path)
+        thread = Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        def stop():
+            server.shutdown()
+            server.server_close()
+            self.service.shutdown()
+        self.addCleanup(stop)
+        return server
+
+    def connect(self) -> HTTPConnection:
+        server = self.start()
+        return HTTPConnection('127.0.0.1', server.server_address[1], timeout=60)
+
+    @staticmethod
+    def post(connection: HTTPConnection, request):
+        connection.request('POST', '/translate', body=dumps(request), headers={'Content-Type': 'application/json'})
+        response = connection.getresponse()
+        return response, response.read()
+
+    def test_health(self):
+        connection = self.connect()
+        connection.request('GET', '/health')
+        response = connection.getresponse()
+        status = loads(response.read())
+        self.assertEqual(response.status, 200)
+        self.assertEqual(status['status'], 'ok')
+        self.assertEqual(status['workers'], 1)
+        self.assertEqual(status['translations'], 0)
+
+    def test_translate_streams_rpd(self):
+        connection = self.connect()
+        for _ in range(2):
+            response, body = self.post(connection, {'epjson_path': str(self.input_file_path), 'compact': True})
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.getheader('Transfer-Encoding'), 'chunked')
+            rpd_file_path = self.run_dir_path / 'test_input.rpd'
+            self.assertEqual(response.getheader('X-RPD-Path'), str(rpd_file_path))
+            self.assertEqual(body, rpd_file_path.read_bytes())
+            self.assertEqual(loads(body)['id'], 'project description root')
+        self.assertEqual(self.service.translations, 2)
+        self.assertEqual(self.service.pending, 0)
+
+    def test_bad_requests(self):
+        connection = self.connect()
+        response, body = self.post(connection, {'path': str(self.input_file_path)})
+        self.assertEqual(response.status, 400)
+        self.assertIn('epjson_path', loads(body)['error'])
+        response, body = self.post(connection, {'epjson_path': str(self.input_file_path), 'gzip': True})
+        self.assertEqual(response.status, 400)
+        self.assertIn('gzip', loads(body)['error'])
+        connection.request('GET', '/translate')
+        response = connection.getresponse()
+        response.read()
+        self.assertEqual(response.status, 404)
+
+    def test_failed_translation(self):
+        connection = self.connect()
+        response, body = self.post(connection, {'epjson_path': str(self.run_dir_path / 'missing.epJSON')})
+        self.assertEqual(response.status, 500)
+        self.assertIn('missing.epJSON', loads(body)['error'])
+        self.assertEqual(self.service.failures, 1)
+        self.assertEqual(self.service.pending, 0)
+
+    def test_full_queue_is_turned_away(self):
+        connection = self.connect()
+        self.assertTrue(self.service.try_reserve())
+        response, body = self.post(connection, {'epjson_path': str(self.input_file_path)})
+        self.assertEqual(response.status, 503)
+        self.service.pending -= 1
+
+    def test_concurrent_requests_for_one_model(self):
+        self.service = TranslationService(workers=2, max_queued=4)
+        server = self.start()
+        bodies = {}
+
+        def post(index):
+            connection = HTTPConnection('127.0.0.1', server.server_address[1], timeout=60)
+            request = {'epjson_path': str(self.input_file_path), 'compact': index % 2 == 0}
+            bodies[index] = self.post(connection, request)[1]
+
+        threads = [Thread(target=post, args=(index,)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for index, body in bodies.items():
+            self.assertEqual(loads(body)['id'], 'project description root')
+            self.assertEqual(b'\n  ' in body, index % 2 == 1)
+        self.assertEqual(self.service.output_locks, {})
+
+    @skipUnless(hasattr(socket, 'AF_UNIX'), 'Unix sockets are not available')
+    def test_unix_socket(self):
+        socket_path = self.run_dir_path / 'service.sock'
+        self.start(socket_path)
+        connection = UnixHTTPConnection(socket_path)
+        response, body = self.post(connection, {'epjson_path': str(self.input_file_path)})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(body, (self.run_dir_path / 'test_input.rpd').read_bytes())
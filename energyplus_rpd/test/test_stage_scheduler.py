@@ -0,0 +1,73 @@
+from random import Random
+from threading import Lock
+from time import sleep
+from unittest import TestCase
+
+from energyplus_rpd.stage_scheduler import find_stage_dependencies
+from energyplus_rpd.stage_scheduler import paths_overlap
+from energyplus_rpd.stage_scheduler import run_stages
+from energyplus_rpd.stage_scheduler import stage_spec
+
+
+class TestStageScheduler(TestCase):
+    def setUp(self) -> None:
+        self.stages = [
+            stage_spec('skeleton', writes=['model']),
+            stage_spec('weather', writes=['model.weather']),
+            stage_spec('pumps', writes=['model.pumps', 'pump_extra']),
+            stage_spec('loops', reads=['model.pumps', 'pump_extra'], writes=['model.loops']),
+            stage_spec('ground', reads=['fact.ground'], writes=['model.weather']),
+            stage_spec('lights', reads=['fact.ground']),
+            stage_spec('ids', writes=['model']),
+        ]
+
+    def test_paths_overlap(self):
+        self.assertTrue(paths_overlap('model', 'model.weather'))
+        self.assertTrue(paths_overlap('model.weather', 'model'))
+        self.assertTrue(paths_overlap('model.weather', 'model.weather'))
+        self.assertFalse(paths_overlap('model.weather', 'model.weather_file'))
+        self.assertFalse(paths_overlap('model.weather', 'model.pumps'))
+
+    def test_find_stage_dependencies(self):
+        self.assertEqual(find_stage_dependencies(self.stages), {
+            'skeleton': [],
+            'weather': ['skeleton'],
+            'pumps': ['skeleton'],
+            'loops': ['skeleton', 'pumps'],
+            'ground': ['skeleton', 'weather'],
+            'lights': [],
+            'ids': ['skeleton', 'weather', 'pumps', 'loops', 'ground'],
+        })
+
+    def test_run_stages_respects_dependencies(self):
+        dependencies = find_stage_dependencies(self.stages)
+        random = Random(1)
+        for jobs in [1, 2, 4]:
+            finished = []
+            lock = Lock()
+
+            def run_stage(name):
+                with lock:
+                    for dependency in dependencies[name]:
+                        self.assertIn(dependency, finished)
+                sleep(random.random() * 0.01)
+                with lock:
+                    finished.append(name)
+
+            run_stages(self.stages, run_stage, jobs)
+            self.assertEqual(sorted(finished), sorted(stage.name for stage in self.stages))
+            if jobs == 1:
+                self.assertEqual(finished, [stage.name for stage in self.stages])
+
+    def test_run_stages_raises_first_error(self):
+        started = []
+
+        def run_stage(name):
+            started.append(name)
+            if name == 'pumps':
+                raise Exception('no pumps')
+
+        with self.assertRaisesRegex(Exception, 'no pumps'):
+            run_stages(self.stages, run_stage, 3)
+        self.assertNotIn('loops', started)
+        self.assertNotIn('ids', started)
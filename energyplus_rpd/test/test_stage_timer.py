@@ -0,0 +1,73 @@
+from json import loads
+from pathlib import Path
+from tempfile import mkdtemp
+from threading import Barrier, Thread
+from unittest import TestCase
+
+from energyplus_rpd.stage_timer import StageTimer
+
+
+class TestStageTimer(TestCase):
+
+    def test_stages_are_recorded(self):
+        timer = StageTimer()
+        with timer.stage('small'):
+            [0] * 10
+        with timer.stage('large'):
+            big = [0] * 1000000
+        del big
+        self.assertEqual([record['stage'] for record in timer.stages], ['small', 'large'])
+        self.assertGreater(timer.stages[1]['peak_memory'], 8000000)
+        self.assertLess(timer.stages[0]['peak_memory'], 8000000)
+        for record in timer.stages:
+            self.assertGreaterEqual(record['wall_time'], 0.)
+            self.assertGreaterEqual(record['cpu_time'], 0.)
+
+    def test_overlapping_stages_have_no_peak(self):
+        timer = StageTimer()
+        both_started = Barrier(2)
+
+        def run_stage(name):
+            with timer.stage(name):
+                both_started.wait()
+                [0] * 100000
+
+        with timer.tracing():
+            threads = [Thread(target=run_stage, args=(name,)) for name in ['first', 'second']]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            with timer.stage('alone'):
+                big = [0] * 1000000
+            del big
+        peaks = {record['stage']: record['peak_memory'] for record in timer.stages}
+        self.assertIsNone(peaks['first'])
+        self.assertIsNone(peaks['second'])
+        self.assertGreater(peaks['alone'], 7000000)
+        self.assertEqual(timer.running, [])
+        first_line = [line for line in timer.report().splitlines() if line.startswith('first')][0]
+        self.assertTrue(first_line.endswith(' -'))
+
+    def test_stage_recorded_on_exception(self):
+        timer = StageTimer(trace_memory=False)
+        with self.assertRaises(ValueError):
+            with timer.stage('failing'):
+                raise ValueError('stop')
+        self.assertEqual(timer.stages[0]['stage'], 'failing')
+        self.assertIsNone(timer.stages[0]['peak_memory'])
+
+    def test_report_and_json(self):
+        timer = StageTimer(trace_memory=False)
+        timer.stages = [{'stage': 'fast', 'wall_time': 1., 'cpu_time': 1., 'peak_memory': None},
+                        {'stage': 'slow', 'wall_time': 3., 'cpu_time': 2., 'peak_memory': None}]
+        lines = timer.report().splitlines()
+        self.assertTrue(lines[1].startswith('slow'))
+        self.assertIn('75.0%', lines[1])
+        self.assertTrue(lines[2].startswith('fast'))
+        self.assertTrue(lines[3].startswith('total'))
+        json_path = Path(mkdtemp()) / 'timings.json'
+        timer.write_json(json_path)
+        written = loads(json_path.read_text())
+        self.assertEqual(written['total_wall_time'], 4.)
+        self.assertEqual(len(written['stages']), 2)
@@ -0,0 +1,60 @@
+import os
+from json import loads
+from pathlib import Path
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from energyplus_rpd.status_reporter import StatusReporter
+
+
+class TestStatusReporter(TestCase):
+    def setUp(self) -> None:
+        self.run_dir_path = Path(mkdtemp())
+        self.extra_schema_path = self.run_dir_path / 'extra.schema.yaml'
+        self.extra_schema_path.write_text('''
+Building:
+  Object Type: Data Group
+  Data Elements:
+    id:
+      EPin Object: Building
+      EPstatus: DoneUsingInput
+    notes:
+      EPstatus: ToDo
+''')
+        self.report_file_path = self.run_dir_path / 'report.txt'
+
+    def make_reporter(self) -> StatusReporter:
+        return StatusReporter(self.extra_schema_path, self.report_file_path)
+
+    def test_generate_if_needed(self):
+        reporter = self.make_reporter()
+        self.assertTrue(reporter.generate_if_needed())
+        self.assertEqual(reporter.extra_schema_source, 'yaml')
+        report = self.report_file_path.read_text()
+        self.assertIn('  input   DoneUsingInput           id', report)
+        self.assertIn("('Building', 'notes')", report)
+        self.assertFalse(self.make_reporter().generate_if_needed())
+        self.assertTrue(self.make_reporter().generate_if_needed(force=True))
+        self.assertEqual([path.name for path in self.run_dir_path.glob('*.tmp')], [])
+
+    def test_extra_schema_cache(self):
+        self.make_reporter().generate_if_needed()
+        cached = loads(self.make_reporter().cache_file_path.read_text())
+        self.assertEqual(cached['extra_schema']['Building']['Object Type'], 'Data Group')
+        self.report_file_path.unlink()
+        reporter = self.make_reporter()
+        self.assertTrue(reporter.generate_if_needed())
+        self.assertEqual(reporter.extra_schema_source, 'cache')
+        # a changed extra schema is parsed again and makes the report out of date
+        self.extra_schema_path.write_text(self.extra_schema_path.read_text().replace('ToDo', 'NotStarted'))
+        later = self.report_file_path.stat().st_mtime_ns + 10 ** 9
+        os.utime(self.extra_schema_path, ns=(later, later))
+        reporter = self.make_reporter()
+        self.assertTrue(reporter.generate_if_needed())
+        self.assertEqual(reporter.extra_schema_source, 'yaml')
+        self.assertNotIn("('Building', 'notes')", self.report_file_path.read_text())
+
+    def test_no_extra_schema(self):
+        self.extra_schema_path.unlink()
+        self.assertFalse(self.make_reporter().generate_if_needed())
+        self.assertFalse(self.report_file_path.exists())
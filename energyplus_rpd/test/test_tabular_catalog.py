@@ -0,0 +1,104 @@
+from unittest import TestCase
+
+from energyplus_rpd.tabular_catalog import RowView, TabularCatalog
+
+
+class TestTabularCatalog(TestCase):
+
+    def test_get_table(self):
+        tabular_reports = [
+            {
+                'ReportName': 'ReportA',
+                'Tables': [
+                    {'TableName': 'Table1', 'Cols': ['a'], 'Rows': {'r1': ['1']}},
+                    {'TableName': 'Table2', 'Cols': ['b'], 'Rows': {'r1': ['2']}},
+                ]
+            },
+            {
+                'ReportName': 'ReportB',
+                'Tables': [
+                    {'TableName': 'Table1', 'Cols': ['c'], 'Rows': {'r1': ['3']}},
+                ]
+            },
+        ]
+        catalog = TabularCatalog(tabular_reports)
+        self.assertEqual(catalog.tables_built, 3)
+        self.assertEqual(catalog.get_table('ReportA', 'Table2')['Cols'], ['b'])
+        self.assertEqual(catalog.get_table('ReportB', 'Table1')['Cols'], ['c'])
+        self.assertEqual(catalog.get_table('ReportB', 'Table2'), {})
+        self.assertEqual(catalog.lookups_served, 3)
+        self.assertTrue(catalog.is_built_from(tabular_reports))
+        self.assertFalse(catalog.is_built_from(list(tabular_reports)))
+        self.assertEqual(catalog.summary(), 'tabular catalog: 3 tables indexed, 3 lookups served')
+
+    def test_first_occurrence_wins(self):
+        tabular_reports = [
+            {
+                'ReportName': 'ReportA',
+                'Tables': [
+                    {'TableName': 'Table1', 'Cols': ['first'], 'Rows': {}},
+                ]
+            },
+            {
+                'ReportName': 'ReportA',
+                'Tables': [
+                    {'TableName': 'Table1', 'Cols': ['second'], 'Rows': {}},
+                ]
+            },
+        ]
+        catalog = TabularCatalog(tabular_reports)
+        self.assertEqual(catalog.tables_built, 1)
+        self.assertEqual(catalog.get_table('ReportA', 'Table1')['Cols'], ['first'])
+
+    def test_no_tabular_reports(self):
+        catalog = TabularCatalog('')
+        self.assertEqual(catalog.tables_built, 0)
+        self.assertEqual(catalog.get_table('ReportA', 'Table1'), {})
+
+    def test_get_table_list(self):
+        tabular_reports = [
+            {
+                'ReportName': 'ReportA',
+                'Tables': [
+                    {'TableName': 'Table1', 'Cols': ['a', 'b'], 'Rows': {'r1': ['1', '2'], 'r2': ['3', '4']}},
+                ]
+            },
+        ]
+        catalog = TabularCatalog(tabular_reports)
+        table_list = catalog.get_table_list('ReportA', 'Table1')
+        self.assertEqual(table_list, [{'a': '1', 'b': '2', 'first column': 'r1'},
+                                      {'a': '3', 'b': '4', 'first column': 'r2'}])
+        self.assertEqual(list(table_list[0].keys()), ['a', 'b', 'first column'])
+        self.assertIs(catalog.get_table_list('ReportA', 'Table1'), table_list)
+        self.assertEqual(catalog.get_table_list('ReportA', 'Missing'), [])
+        self.assertEqual(catalog.lookups_served, 3)
+
+    def test_get_table_dictionary(self):
+        rows = {'r1': ['m1', '1', '2'], 'r2': ['m2', '3', '4']}
+        tabular_reports = [
+            {
+                'ReportName': 'ReportA',
+                'Tables': [
+                    {'TableName': 'Table1', 'Cols': ['name', 'a', 'b'], 'Rows': rows},
+                ]
+            },
+        ]
+        catalog = TabularCatalog(tabular_reports)
+        table_dict = catalog.get_table_dictionary('ReportA', 'Table1')
+        self.assertEqual(table_dict, {'r1': {'name': 'm1', 'a': '1', 'b': '2'},
+                                      'r2': {'name': 'm2', 'a': '3', 'b': '4'}})
+        self.assertIs(catalog.get_table_dictionary('ReportA', 'Table1'), table_dict)
+        ignored_dict = catalog.get_table_dictionary('ReportA', 'Table1', ignore_first_column=True)
+        self.assertEqual(ignored_dict, {'m1': {'a': '1', 'b': '2'}, 'm2': {'a': '3', 'b': '4'}})
+        self.assertEqual(catalog.get_column_index('ReportA', 'Table1'), {'name': 0, 'a': 1, 'b': 2})
+
+    def test_row_view_is_read_only_view(self):
+        values = ['1', '2']
+        row = RowView(values, {'a': 0, 'b': 1})
+        with self.assertRaises(TypeError):
+            row['a'] = '5'
+        with self.assertRaises(KeyError):
+            row['c']
+        values[0] = '7'
+        self.assertEqual(row['a'], '7')
+        self.assertEqual(len(row), 2)
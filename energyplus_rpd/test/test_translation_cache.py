@@ -0,0 +1,107 @@
+import os
+from json import dumps
+from pathlib import Path
+from tempfile import mkdtemp
+from threading import Thread
+from time import sleep
+from unittest import TestCase
+
+from energyplus_rpd.batch import run_batch
+from energyplus_rpd.runner import run_with_path
+from energyplus_rpd.test.model_files import write_minimal_model
+from energyplus_rpd.translation_cache import TranslationCache
+from energyplus_rpd.translation_cache import translate_with_cache
+from energyplus_rpd.translation_cache import translation_key
+
+
+class TestTranslationCache(TestCase):
+    def setUp(self) -> None:
+        self.run_dir_path = Path(mkdtemp())
+        self.cache = TranslationCache(self.run_dir_path / 'cache')
+
+    def test_translation_key(self):
+        first = write_minimal_model(self.run_dir_path / 'a')
+        second = write_minimal_model(self.run_dir_path / 'b')
+        self.assertEqual(translation_key(first), translation_key(second))
+        self.assertNotEqual(translation_key(first), translation_key(first, compact=True))
+        (second.parent / 'inout_hourly.json').write_text(dumps({"Cols": [], "Rows": [{}]}))
+        self.assertNotEqual(translation_key(first), translation_key(second))
+        with self.assertRaises(Exception):
+            translation_key(self.run_dir_path / 'missing.epJSON')
+
+    def test_get_and_put(self):
+        source = self.run_dir_path / 'source.rpd'
+        source.write_text('{"id": "a"}')
+        destination = self.run_dir_path / 'destination.rpd'
+        self.assertFalse(self.cache.get('ab12', destination))
+        self.assertFalse(destination.exists())
+        self.cache.put('ab12', source)
+        self.assertTrue(self.cache.get('ab12', destination))
+        self.assertEqual(destination.read_text(), '{"id": "a"}')
+        self.assertEqual(self.cache.summary(), f'translation cache: 1 hits, 1 misses in {self.cache.cache_dir}')
+        self.assertEqual([path.name for path in self.cache.cache_dir.rglob('*')], ['ab', 'ab12.rpd-entry'])
+
+    def test_evict_least_recently_used(self):
+        cache = TranslationCache(self.run_dir_path / 'small_cache', max_bytes=25)
+        source = self.run_dir_path / 'source.rpd'
+        source.write_text('0123456789')
+        for index, key in enumerate(['aa1', 'bb2']):
+            cache.put(key, source)
+            os.utime(cache.entry_path(key), (index, index))
+        cache.get('aa1', self.run_dir_path / 'out.rpd')
+        cache.put('cc3', source)
+        self.assertTrue(cache.entry_path('aa1').exists())
+        self.assertFalse(cache.entry_path('bb2').exists())
+        self.assertTrue(cache.entry_path('cc3').exists())
+
+    def test_lock_waits_for_owner(self):
+        events = []
+
+        def hold_lock():
+            with self.cache.lock('dd4'):
+                events.append('first in')
+                sleep(0.2)
+                events.append('first out')
+
+        thread = Thread(target=hold_lock)
+        thread.start()
+        while not events:
+            sleep(0.01)
+        with self.cache.lock('dd4'):
+            events.append('second in')
+        thread.join()
+        self.assertEqual(events, ['first in', 'first out', 'second in'])
+        self.assertFalse(self.cache.lock_path('dd4').exists())
+
+    def test_stale_lock_is_removed(self):
+        lock_path = self.cache.lock_path('ee5')
+        lock_path.parent.mkdir()
+        lock_path.write_text('elsewhere:1')
+        os.utime(lock_path, (0, 0))
+        with self.cache.lock('ee5'):
+            self.assertTrue(lock_path.exists())
+        self.assertFalse(lock_path.exists())
+
+    def test_translate_with_cache(self):
+        first = write_minimal_model(self.run_dir_path / 'a')
+        second = write_minimal_model(self.run_dir_path / 'b')
+        translated = []
+
+        def translate(path):
+            translated.append(path)
+            path.with_suffix('.rpd').write_text('{"id": "rpd"}')
+
+        self.assertFalse(translate_with_cache(self.cache, first, lambda: translate(first)))
+        self.assertTrue(translate_with_cache(self.cache, second, lambda: translate(second)))
+        self.assertEqual(translated, [first])
+        self.assertEqual((second.parent / 'in.rpd').read_text(), '{"id": "rpd"}')
+
+    def test_run_with_path_reuses_rpd(self):
+        first = write_minimal_model(self.run_dir_path / 'a')
+        second = write_minimal_model(self.run_dir_path / 'b')
+        run_with_path(first, cache=self.cache)
+        run_with_path(second, cache=self.cache)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual((first.parent / 'in.rpd').read_text(), (second.parent / 'in.rpd').read_text())
+        results = run_batch([first, second], 1, cache=self.cache)
+        self.assertEqual([result['cached'] for result in results], [True, True])
@@ -1,9 +1,13 @@
+import contextlib
+import io
+import shutil
 from json import dumps, loads
 from pathlib import Path
 from tempfile import mkdtemp
 from unittest import TestCase
 
 from energyplus_rpd.translator import Translator
+from energyplus_rpd.translator import MODEL_STAGES
 from energyplus_rpd.translator import is_float
 from energyplus_rpd.translator import energy_source_convert
 from energyplus_rpd.translator import heating_type_convert
@@ -55,6 +59,114 @@ class TestTranslator(TestCase):
         written_json = loads(output_file_path.read_text())
         self.assertIn('TabularReports', written_json)
 
+    def test_status_report_is_opt_in(self):
+        class CountingReporter:
+            generated = 0
+
+            def generate_if_needed(self):
+                self.generated += 1
+
+        self.set_minimal_files()
+        t = Translator(self.run_dir_path / 'in.epJSON')
+        self.assertIsNone(t.status_reporter)
+        t.process()
+        reporter = CountingReporter()
+        Translator(self.run_dir_path / 'in.epJSON', status_reporter=reporter).process()
+        self.assertEqual(reporter.generated, 1)
+
+    def test_process_with_timings(self):
+        self.set_minimal_files()
+        t = Translator(self.run_dir_path / 'in.epJSON', timings=True)
+        t.process()
+        stage_names = [record['stage'] for record in t.stage_timer.stages]
+        self.assertEqual(stage_names[0], 'create_skeleton')
+        self.assertIn('add_zones', stage_names)
+        self.assertEqual(stage_names[-2:], ['validate_rpd', 'write'])
+        self.assertIn('total', t.stage_timer.report())
+
+    def test_process_with_jobs(self):
+        self.set_minimal_files()
+        rpd_by_jobs = {}
+        for jobs in [1, 4]:
+            t = Translator(self.run_dir_path / 'in.epJSON', jobs=jobs, timings=True)
+            t.process()
+            self.assertEqual(len(t.stage_timer.stages), len(MODEL_STAGES) + 2)
+            rpd = loads(t.rpd_file_path.read_text())
+            del rpd['metadata']['time_of_creation']
+            rpd_by_jobs[jobs] = dumps(rpd)
+        self.assertEqual(rpd_by_jobs[1], rpd_by_jobs[4])
+
+    def test_from_objects(self):
+        resources_path = Path(__file__).parent / 'resources'
+        for name in ['test_input.epJSON', 'test_inputout.json', 'test_inputout_hourly.json']:
+            shutil.copy(resources_path / name, self.run_dir_path / name)
+        input_file_path = self.run_dir_path / 'test_input.epJSON'
+        t = Translator(input_file_path)
+        t.process()
+        expected = loads(t.rpd_file_path.read_text())
+        t.rpd_file_path.unlink()
+
+        epjson = loads(input_file_path.read_text())
+        with open(self.run_dir_path / 'test_inputout.json', 'rb') as results_file, \
+                open(self.run_dir_path / 'test_inputout_hourly.json') as hourly_file:
+            printed = io.StringIO()
+            with contextlib.redirect_stdout(printed):
+                t = Translator.from_objects(epjson, results_file, hourly_file)
+                rpd = t.translate()
+        self.assertEqual(printed.getvalue(), '')
+        self.assertIsNone(t.rpd_file_path)
+        self.assertEqual(sorted(path.name for path in self.run_dir_path.iterdir()),
+                         ['test_input.epJSON', 'test_inputout.json', 'test_inputout_hourly.json'])
+        self.assertEqual(t.validation_message, '')
+        del rpd['metadata']['time_of_creation'], expected['metadata']['time_of_creation']
+        self.assertEqual(loads(dumps(rpd)), expected)
+
+    def test_from_objects_with_compliance_parameters(self):
+        epjson = {"Version": {"Version 1": {"version_identifier": "22.1"}},
+                  "Building": {"OfficeSmall": {"loads_convergence_tolerance_value": 0.04}}}
+        t = Translator.from_objects(epjson, {"TabularReports": []}, {"Cols": []},
+                                    compliance_parameters={"compliance_path": "CODE_COMPLIANT"})
+        rpd = t.translate()
+        self.assertEqual(rpd['compliance_path'], 'CODE_COMPLIANT')
+        self.assertIsNone(t.status_reporter)
+
+    def test_restore_section_order(self):
+        t = self.set_minimal_files()
+        t.create_skeleton()
+        t.model_description['schedules'] = []
+        t.model_description['weather'] = {}
+        t.building_segment['zones'] = []
+        t.building_segment['heating_ventilating_air_conditioning_systems'] = []
+        t.restore_section_order()
+        self.assertEqual(list(t.model_description), ['id', 'notes', 'type', 'buildings', 'weather', 'schedules'])
+        self.assertEqual(list(t.building_segment), ['id', 'heating_ventilating_air_conditioning_systems', 'zones'])
+        self.assertIs(t.project_description['ruleset_model_descriptions'][0], t.model_description)
+
+    def test_fact_cache_dropped_with_tabular_reports(self):
+        t = self.set_minimal_files()
+        t.json_results_object['TabularReports'] = []
+        first = t.gather_coil_connections()
+        self.assertIs(t.gather_coil_connections(), first)
+        self.assertEqual(t.fact_cache.hits['gather_coil_connections'], 1)
+        t.json_results_object['TabularReports'] = []
+        self.assertIsNot(t.gather_coil_connections(), first)
+        self.assertEqual(t.fact_cache.misses['gather_coil_connections'], 2)
+
+    def test_envelope_topology_without_surfaces_is_built_once(self):
+        t = self.set_minimal_files()
+        t.json_results_object['TabularReports'] = []
+        first = t.envelope_topology
+        self.assertIs(t.envelope_topology, first)
+        t.epjson_object['BuildingSurface:Detailed'] = {'Wall': {'zone_name': 'Zone'}}
+        self.assertEqual(t.envelope_topology.zone_by_surface, {'WALL': 'ZONE'})
+
+    def test_process_with_verified_ids(self):
+        self.set_minimal_files()
+        t = Translator(self.run_dir_path / 'in.epJSON', verify_ids=True)
+        t.process()
+        self.assertIn('hourly_values', t.id_registry.skipped_keys)
+        self.assertIn('OfficeSmall', t.id_registry.id_used)
+
     def test_input_file_is_invalid_for_translation(self):
         input_file_path = self.run_dir_path / 'in.epJSON'
         input_file_path.write_text(dumps(
@@ -249,6 +361,37 @@ class TestTranslator(TestCase):
         t.add_schedules()
         self.assertEqual(t.model_description['schedules'], model_description)
 
+    def test_add_schedules_streamed(self):
+        t = self.set_minimal_files()
+        hourly_result_file = self.run_dir_path / 'inout_hourly.json'
+        hourly_result_file.write_text(dumps(
+            {
+                'Cols': [
+                    {"Variable": "ONE-SCHEDULE:Schedule Value"},
+                    {"Variable": "TWO-SCHEDULE:Schedule Value"},
+                ],
+                'Rows': [
+                    {"01/01 01:00:00": [1, 11]},
+                    {"01/01 02:00:00": [2, 12]},
+                    {"01/01 03:00:00": [3, 13]}
+                ]
+            }
+        ))
+        t = Translator(self.run_dir_path / 'in.epJSON', stream_hourly=True)
+        self.assertEqual(t.json_hourly_results_object, {})
+        t.schedules_used_names = ['two-schedule', ]
+        model_description = [
+            {
+                'id': 'TWO-SCHEDULE',
+                'sequence_type': 'HOURLY',
+                'hourly_values': [11, 12, 13],
+                'hourly_cooling_design_day': [],
+                'hourly_heating_design_day': []
+            }
+        ]
+        t.add_schedules()
+        self.assertEqual(t.model_description['schedules'], model_description)
+
     def test_gather_infiltration(self):
         t = self.set_minimal_files()
         t.json_results_object['TabularReports'] = [
@@ -816,6 +959,31 @@ class TestTranslator(TestCase):
 
         self.assertEqual(added_spaces, expected)
 
+    def test_add_spaces_writes_enumeration_values_as_in_schema(self):
+        t = self.set_minimal_files()
+
+        t.json_results_object['TabularReports'] = [{
+            'For': 'Entire Facility',
+            'ReportName': 'InputVerificationandResultsSummary',
+            'Tables': [{
+                'Cols': ['Area [m2]', 'Zone Name', 'Space Type', 'People [m2 per person]', 'Tags'],
+                'Rows': {
+                    'CORE_ZN': ['100.00', 'CORE_ZN', 'office_enclosed', '0.00', 'Office_Buildings_Office_Space'],
+                    'STORAGE': ['20.00', 'STORAGE_ZN', 'not_a_space_type', '0.00', 'not_a_tag']
+                },
+                'TableName': 'Space Summary'
+            }]
+        }]
+
+        t.building_segment['zones'] = [{'id': 'CORE_ZN'}, {'id': 'STORAGE_ZN'}]
+
+        added_spaces = t.add_spaces()
+
+        self.assertEqual(added_spaces['CORE_ZN']['lighting_space_type'], 'OFFICE_ENCLOSED')
+        self.assertEqual(added_spaces['CORE_ZN']['ventilation_space_type'], 'OFFICE_BUILDINGS_OFFICE_SPACE')
+        self.assertNotIn('lighting_space_type', added_spaces['STORAGE_ZN'])
+        self.assertNotIn('ventilation_space_type', added_spaces['STORAGE_ZN'])
+
     def test_get_zone_for_each_surface(self):
         t = self.set_minimal_files()
 
@@ -3744,6 +3912,42 @@ class TestTranslator(TestCase):
 
         self.assertEqual(gathered_equipment_fans, expected)
 
+    @staticmethod
+    def air_heat_recovery_reports(rows):
+        cols = ['Type', 'Plate/Rotary', 'Sensible Effectiveness at 100% Heating Air Flow',
+                'Sensible Effectiveness at 100% Cooling Air Flow', 'Latent Effectiveness at 100% Heating Air Flow',
+                'Latent Effectiveness at 100% Cooling Air Flow', 'Exhaust Airflow Inlet Node',
+                'Outdoor Air Inlet Node', 'Supply Air Flow Rate [m3/s]', 'Exhaust Air Flow Rate [m3/s]',
+                'Heat Recovery Active', 'Airloop Name']
+        return [{'For': 'Entire Facility', 'ReportName': 'EquipmentSummary',
+                 'Tables': [{'Cols': cols, 'Rows': rows, 'TableName': 'Air Heat Recovery'}]}]
+
+    def test_gather_air_heat_recovery_empty_table(self):
+        t = self.set_minimal_files()
+        # EnergyPlus writes a single blank row named None when the model has no heat exchangers
+        t.json_results_object['TabularReports'] = self.air_heat_recovery_reports({'None': [''] * 12})
+        self.assertEqual(t.gather_air_heat_recovery('any loop'), {})
+        self.assertEqual(t.gather_air_heat_recovery(''), {})
+
+    def test_gather_air_heat_recovery_bad_row_fails_its_airloop_only(self):
+        t = self.set_minimal_files()
+        t.json_results_object['TabularReports'] = self.air_heat_recovery_reports({
+            'HX 1': ['HeatExchanger:AirToAir:SensibleAndLatent', 'Rotary', '0.76', '0.7', '0.68', '0.6', 'A', 'B',
+                     '1.5', '1.4', 'WhenFansOn', 'LOOP 1'],
+            'HX 2': ['HeatExchanger:AirToAir:SensibleAndLatent', 'Plate', 'bad', '0.7', '0', '0', 'C', 'D',
+                     '1.0', '1.0', 'Scheduled', 'LOOP 2'],
+        })
+        self.assertEqual(t.gather_air_heat_recovery('LOOP 1'), {
+            'id': 'HX 1',
+            'type': 'ENTHALPY_HEAT_WHEEL',
+            'design_sensible_effectiveness': 0.76,
+            'design_latent_effectiveness': 0.68,
+            'outdoor_airflow': 1.5,
+            'exhaust_airflow': 1.4,
+            'energy_recovery_operation': 'WHEN_FANS_ON'})
+        with self.assertRaises(ValueError):
+            t.gather_air_heat_recovery('LOOP 2')
+
     def test_gather_fan_operating_points(self):
         t = self.set_minimal_files()
 
@@ -5303,6 +5507,32 @@ class TestTranslator(TestCase):
 
         self.assertEqual(table, expected)
 
+    def test_get_table_uses_catalog(self):
+        t = self.set_minimal_files()
+
+        t.json_results_object['TabularReports'] = [{
+            'For': 'Entire Facility',
+            'ReportName': 'AnnualBuildingUtilityPerformanceSummary',
+            'Tables': [
+                {
+                    "Cols": ["Area [m2]"],
+                    "Rows": {"Total Building Area": ["511.16"]},
+                    "TableName": "Building Area"
+                },
+            ]
+        }]
+
+        table = t.get_table('AnnualBuildingUtilityPerformanceSummary', 'Building Area')
+        self.assertEqual(table['Rows']['Total Building Area'], ['511.16'])
+        self.assertEqual(t.get_table('AnnualBuildingUtilityPerformanceSummary', 'Missing Table'), {})
+        self.assertEqual(t.tabular_catalog.tables_built, 1)
+        self.assertEqual(t.tabular_catalog.lookups_served, 2)
+
+        # replacing the tabular reports rebuilds the catalog
+        t.json_results_object['TabularReports'] = []
+        self.assertEqual(t.get_table('AnnualBuildingUtilityPerformanceSummary', 'Building Area'), {})
+        self.assertEqual(t.tabular_catalog.tables_built, 0)
+
     def test_gather_table_into_list(self):
         t = self.set_minimal_files()
 
@@ -1,6 +1,10 @@
+from json import dumps
+from pathlib import Path
+from tempfile import mkdtemp
 from unittest import TestCase
 
 from energyplus_rpd.validator import Validator
+from energyplus_rpd.validator import get_shared_validator
 
 
 class TestValidator(TestCase):
@@ -28,3 +32,30 @@ class TestValidator(TestCase):
         v = Validator()
         self.assertTrue(v.is_in_901_enumeration('LightingSpaceOptions2019ASHRAE901TG37', 'ATRIUM_HIGH'))
         self.assertFalse(v.is_in_901_enumeration('LightingSpaceOptions2019ASHRAE901TG37', 'DRY_DOCK'))
+
+    def test_shared_validator(self):
+        self.assertIs(get_shared_validator(), get_shared_validator())
+
+    def test_resolved_schema_has_no_file_references(self):
+        v = Validator()
+        self.assertNotIn('.schema.json#', dumps(v.resolved_schema))
+        self.assertIn('LightingSpaceOptions2019ASHRAE901TG37', v.enum_901['definitions'])
+
+    def test_schema_artifact(self):
+        artifact_path = Path(mkdtemp()) / 'cache' / 'schema.json'
+        v = Validator(artifact_path)
+        self.assertEqual(v.schema_source, 'schema files')
+        self.assertTrue(artifact_path.exists())
+        v = Validator(artifact_path)
+        self.assertEqual(v.schema_source, 'schema artifact')
+        passed, message = v.validate_rpd({"junk": 0.0})
+        self.assertFalse(passed)
+        self.assertEqual(message, "invalid: 'id' is a required property at $")
+        self.assertTrue(v.is_in_901_enumeration('LightingSpaceOptions2019ASHRAE901TG37', 'ATRIUM_HIGH'))
+        self.assertIn('first validation done', v.timing_summary())
+
+    def test_stale_schema_artifact(self):
+        artifact_path = Path(mkdtemp()) / 'schema.json'
+        artifact_path.write_text(dumps({'fingerprint': [], 'schema': {}}))
+        v = Validator(artifact_path)
+        self.assertEqual(v.schema_source, 'schema files')
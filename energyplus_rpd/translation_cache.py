@@ -0,0 +1,183 @@
+import hashlib
+import json
+import os
+import shutil
+import socket
+from contextlib import contextmanager
+from pathlib import Path
+from time import sleep, time
+from typing import Callable, Dict, Iterator, Optional
+
+from energyplus_rpd import VERSION
+from energyplus_rpd.compliance_parameter_handler import ComplianceParameterHandler
+from energyplus_rpd.compression import without_compression_suffix
+from energyplus_rpd.input_cache import file_digest
+from energyplus_rpd.input_file import find_hourly_results_json_path, find_results_json_path
+from energyplus_rpd.json_codec import get_codec
+from energyplus_rpd.output_file import OutputFile
+
+ENTRY_SUFFIX = '.rpd-entry'
+LOCK_SUFFIX = '.lock'
+MEGABYTE = 1 << 20
+DEFAULT_MAX_MEGABYTES = 1024
+LOCK_POLL_INTERVAL = 0.05
+# a lock older than this is taken to be left behind by a process that was killed on another machine
+STALE_LOCK_AGE = 3600.
+
+
+def translation_inputs(epjson_file_path: Path, add_cp=False) -> Dict[str, Optional[Path]]:
+    # the same files the translator reads, found the same way, so a missing file fails with the same message
+    cp_file_path = ComplianceParameterHandler(without_compression_suffix(epjson_file_path)).cp_file_path
+    return {
+        'epjson': epjson_file_path,
+        'results': find_results_json_path(epjson_file_path),
+        'hourly': find_hourly_results_json_path(epjson_file_path),
+        'compliance_parameters': cp_file_path if add_cp else None,
+    }
+
+
+def translation_key(epjson_file_path: Path, add_cp=False, compact=False, compress=False) -> str:
+    """Returns the sha256 of the input file hashes, the translator version and the options that change the RPD file
+
+    The JSON backend is part of the key since the fast backends write some numbers differently.
+    """
+    if not epjson_file_path.exists():
+        raise Exception(f"Could not find input file at path: {epjson_file_path}")
+    key_parts = {
+        'version': VERSION,
+        'inputs': {name: file_digest(path) if path is not None else None
+                   for name, path in translation_inputs(epjson_file_path, add_cp).items()},
+        'options': {'add_cp': add_cp, 'compact': compact, 'compress': compress, 'json_backend': get_codec().name},
+    }
+    return hashlib.sha256(json.dumps(key_parts, sort_keys=True).encode()).hexdigest()
+
+
+def remove_if_present(path: Path):
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class TranslationCache:
+    """Keeps finished RPD files in a directory, each under the key of the inputs it was translated from
+
+    Entries are written to a temporary file and renamed into place, so a reader sees a whole entry or none, and a
+    lock file per key lets only one process translate a given set of inputs while the others wait and then copy its
+    result. Each hit touches the entry, and once the entries add up to more than max_bytes the least recently used
+    ones are removed.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_MEGABYTES * MEGABYTE):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / (key + ENTRY_SUFFIX)
+
+    def lock_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / (key + LOCK_SUFFIX)
+
+    @staticmethod
+    def is_stale_lock(lock_path: Path) -> bool:
+        try:
+            owner = lock_path.read_text()
+            age = time() - lock_path.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        host, _, pid = owner.partition(':')
+        # signal 0 only checks that the process exists on POSIX, on Windows os.kill would end it
+        if os.name == 'posix' and host == socket.gethostname() and pid.isdigit():
+            try:
+                os.kill(int(pid), 0)
+            except ProcessLookupError:
+                return True
+            except OSError:
+                pass
+        return age > STALE_LOCK_AGE
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        lock_path = self.lock_path(key)
+        lock_path.parent.mkdir(exist_ok=True)
+        while True:
+            try:
+                lock_descriptor = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                if self.is_stale_lock(lock_path):
+                    remove_if_present(lock_path)
+                else:
+                    sleep(LOCK_POLL_INTERVAL)
+        try:
+            os.write(lock_descriptor, f'{socket.gethostname()}:{os.getpid()}'.encode())
+            os.close(lock_descriptor)
+            yield
+        finally:
+            remove_if_present(lock_path)
+
+    def get(self, key: str, destination: Path) -> bool:
+        """Copies the entry to destination and returns True, or returns False when there is no entry for the key"""
+        entry_path = self.entry_path(key)
+        temporary_path = destination.with_name(f'{destination.name}.{os.getpid()}.tmp')
+        try:
+            shutil.copyfile(entry_path, temporary_path)
+        except FileNotFoundError:
+            remove_if_present(temporary_path)
+            self.misses += 1
+            return False
+        os.replace(temporary_path, destination)
+        try:
+            os.utime(entry_path)
+        except FileNotFoundError:
+            # evicted by another process after the copy
+            pass
+        self.hits += 1
+        return True
+
+    def put(self, key: str, source: Path):
+        entry_path = self.entry_path(key)
+        entry_path.parent.mkdir(exist_ok=True)
+        temporary_path = entry_path.with_name(f'{entry_path.name}.{os.getpid()}.tmp')
+        shutil.copyfile(source, temporary_path)
+        os.replace(temporary_path, entry_path)
+        self.evict()
+
+    def evict(self) -> int:
+        """Removes the least recently used entries until the rest fit in max_bytes and returns how many were removed"""
+        entries = []
+        for entry_path in self.cache_dir.glob('*/*' + ENTRY_SUFFIX):
+            try:
+                status = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((status.st_mtime, status.st_size, entry_path))
+        total_size = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+            remove_if_present(entry_path)
+            total_size -= size
+            removed += 1
+        return removed
+
+    def summary(self) -> str:
+        return f'translation cache: {self.hits} hits, {self.misses} misses in {self.cache_dir}'
+
+
+def translate_with_cache(cache: TranslationCache, epjson_file_path: Path, translate: Callable[[], None],
+                         add_cp=False, compact=False, compress=False) -> bool:
+    """Writes the cached RPD file for these inputs and returns True, or calls translate, caches its RPD file and
+    returns False"""
+    key = translation_key(epjson_file_path, add_cp, compact, compress)
+    rpd_file_path = OutputFile(epjson_file_path, compact, compress).rpd_file_path
+    with cache.lock(key):
+        if cache.get(key, rpd_file_path):
+            return True
+        translate()
+        cache.put(key, rpd_file_path)
+    return False
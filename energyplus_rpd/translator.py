@@ -1,18 +1,76 @@
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from datetime import timezone
 
+from energyplus_rpd.input_cache import InputCache
 from energyplus_rpd.input_file import InputFile
 from energyplus_rpd.output_file import OutputFile
-from energyplus_rpd.validator import Validator
+from energyplus_rpd.compression import without_compression_suffix
+from energyplus_rpd.validator import Validator, get_shared_validator
 from energyplus_rpd.status_reporter import StatusReporter
 from energyplus_rpd.compliance_parameter_handler import ComplianceParameterHandler
+from energyplus_rpd.tabular_catalog import RowView, TabularCatalog
+from energyplus_rpd.hvac_topology import HvacTopology
+from energyplus_rpd.plant_topology import PlantTopology
+from energyplus_rpd.envelope_topology import EnvelopeTopology, NO_BUILDING_SURFACES
+from energyplus_rpd.fact_cache import FactCache, cached_fact
+from energyplus_rpd.id_registry import IdRegistry, find_duplicate_ids
+from energyplus_rpd.hourly_store import HourlyStore, without_schedule_value_suffix
+from energyplus_rpd.stage_scheduler import run_stages, stage_spec
+from energyplus_rpd.stage_timer import StageTimer
 
 JsonDict = Dict[str, Any]
 JsonList = List[Any]
 TableRows = Dict[str, JsonList]
 
+# the methods of Translator that build the model description, in the order process() runs them one at a time, with
+# the state each one reads and writes so stages that share no state can run at the same time on separate threads
+MODEL_STAGES = (
+    stage_spec('create_skeleton',
+               writes=['project_description', 'model_description', 'building', 'building_segment', 'metadata']),
+    stage_spec('add_external_fluid_source', reads=['plant_topology'],
+               writes=['model_description.external_fluid_sources']),
+    stage_spec('add_weather', writes=['model_description.weather']),
+    stage_spec('add_calendar', writes=['model_description.calendar']),
+    stage_spec('add_materials', writes=['model_description.materials']),
+    stage_spec('add_constructions', writes=['model_description.constructions', 'epjson.Construction']),
+    stage_spec('find_surfaces_by_zone', reads=['envelope_topology'], writes=['surfaces_by_zone']),
+    stage_spec('gather_coil_connections', writes=['fact.gather_coil_connections']),
+    stage_spec('add_airloop_heating_ventilation_ac_system',
+               reads=['hvac_topology', 'fact.gather_coil_connections', 'fact.gather_equipment_fans',
+                      'fact.gather_air_heat_recovery_by_airloop'],
+               writes=['building_segment.heating_ventilating_air_conditioning_systems']),
+    stage_spec('add_terminal_hvac_system',
+               reads=['hvac_topology', 'fact.gather_equipment_fans', 'fact.gather_air_heat_recovery_by_airloop'],
+               writes=['terminals_by_zone']),
+    stage_spec('add_chillers', reads=['plant_topology'], writes=['model_description.chillers']),
+    stage_spec('add_boilers', writes=['model_description.boilers']),
+    stage_spec('add_heat_rejection', writes=['model_description.heat_rejections']),
+    stage_spec('add_pumps', writes=['model_description.pumps', 'pump_extra']),
+    stage_spec('add_fluid_loops', reads=['plant_topology', 'model_description.pumps', 'pump_extra'],
+               writes=['model_description.fluid_loops']),
+    stage_spec('add_zones',
+               reads=['envelope_topology', 'hvac_topology', 'terminals_by_zone', 'fact.gather_equipment_fans',
+                      'fact.gather_air_heat_recovery_by_airloop'],
+               writes=['building_segment.zones', 'schedules_used_names']),
+    stage_spec('add_spaces', writes=['building_segment.zones', 'schedules_used_names']),
+    stage_spec('add_service_water_heating', reads=['plant_topology'],
+               writes=['model_description.service_water_heating_distribution_systems',
+                       'model_description.service_water_heating_equipment',
+                       'model_description.service_water_heating_uses', 'building_segment.service_water_heating_uses',
+                       'building_segment.zones', 'schedules_used_names']),
+    stage_spec('add_exterior_lighting', writes=['building.exterior_lighting']),
+    stage_spec('add_simulation_outputs', writes=['model_description.model_output', 'project_description.output']),
+    stage_spec('add_schedules', reads=['schedules_used_names', 'hourly_store'], writes=['model_description.schedules']),
+    stage_spec('add_ground_schedule', writes=['model_description.schedules', 'model_description.weather']),
+    stage_spec('restore_section_order',
+               writes=['project_description', 'model_description', 'building', 'building_segment']),
+    stage_spec('ensure_all_id_unique', writes=['model_description']),
+)
+# the dictionaries whose sections are written by different stages
+SECTION_OWNERS = ('project_description', 'model_description', 'building', 'building_segment')
+
 
 def energy_source_convert(energy_name_input: str) -> str:
     energy_source_map = {'ELECTRICITY': 'ELECTRICITY',
@@ -157,70 +215,88 @@ def heat_rejection_fan_speed_convert(type_input_obj):
 
 
 def do_chiller_and_pump_share_branch(chiller_name, list_of_dict, side_of_loop):
-    answer = False
-    chiller_branch_name = ''
-    # find the branch used by the chiller
-    for row in list_of_dict:
-        if row['Side'].lower() == side_of_loop.lower():
-            if chiller_name.lower() == row['Component Name'].lower():
-                chiller_branch_name = row['Branch Name']
-                break
-    # find if a pump is on the same branch
-    if chiller_branch_name:
-        for row in list_of_dict:
-            if chiller_branch_name == row['Branch Name']:
-                if 'pump' in row['Component Type'].lower():
-                    answer = True
-                    break
-    return answer
+    # find if a pump is on the branch used by the chiller
+    return PlantTopology(list_of_dict).is_pump_on_component_branch(chiller_name, side_of_loop)
 
 
 def do_share_branch(comp_a, comp_b, list_of_dict):
-    answer = False
-    comp_a_branch_names = []
-    # find the branches used by the component type A
-    for row in list_of_dict:
-        if comp_a.lower() in row['Component Type'].lower():
-            comp_a_branch_names.append(row['Branch Name'])
-    # find if component type B is on the same branch
-    if comp_a_branch_names:
-        for row in list_of_dict:
-            if (row['Branch Name']
-                    in comp_a_branch_names):
-                if comp_b in row['Component Type'].lower():
-                    answer = True
-                    break
-    return answer
+    # find if component type B is on the same branch as component type A
+    return PlantTopology(list_of_dict).do_component_types_share_branch(comp_a, comp_b)
 
 
 class Translator:
-    """This class reads in the input files and does the heavy lifting to write output files"""
+    """This class reads in the input files and does the heavy lifting to write output files
 
-    def __init__(self, epjson_file_path: Path, rpd_name=None, add_cp=False, empty_cp=False):
+    Use Translator.from_objects to translate inputs that are already in memory into the RPD dict instead.
+    """
+
+    def __init__(self, epjson_file_path: Path, rpd_name=None, add_cp=False, empty_cp=False, stream_hourly=False,
+                 validator: Optional[Validator] = None, timings=False, verify_ids=False, compact_output=False,
+                 compress_output=False, input_cache: Optional[InputCache] = None,
+                 input_process_min_bytes: Optional[int] = None, jobs=1,
+                 status_reporter: Optional[StatusReporter] = None, concurrent_load=False):
         print(f"Reading epJSON input file at {epjson_file_path}")
-        self.input_file = InputFile(epjson_file_path)
-        self.epjson_object = self.input_file.epjson_object
-        self.json_results_object = self.input_file.json_results_object
-        print(f"Reading EnergyPlus results JSON file: {self.input_file.json_results_input_path}")
-        self.json_hourly_results_object = self.input_file.json_hourly_results_object
-        print(f"Reading EnergyPlus hourly results JSON file: {self.input_file.json_hourly_results_input_path}")
+        input_file = InputFile(epjson_file_path, stream_hourly, input_cache, concurrent=concurrent_load,
+                               process_min_bytes=input_process_min_bytes)
+        print(input_file.timing_summary())
+        if input_cache is not None:
+            print(input_cache.summary())
 
         # Modify export name - to avoid long execution line set by windows
         output_path = Path(str(epjson_file_path.parent.absolute()) + "\\" + rpd_name) if rpd_name else epjson_file_path
-        self.output_file = OutputFile(output_path)
+        self.output_file: Optional[OutputFile] = OutputFile(output_path, compact_output, compress_output)
         self.rpd_file_path = self.output_file.rpd_file_path
         print(f"Writing output file to {self.rpd_file_path}")
 
-        self.validator = Validator()
-        self.status_reporter = StatusReporter()
+        self.compliance_parameter = ComplianceParameterHandler(without_compression_suffix(epjson_file_path))
+        if add_cp or empty_cp:
+            print(f"File with compliance parameter information is: {self.compliance_parameter.cp_empty_file_path}")
+        self.set_up(input_file, validator, status_reporter, add_cp, empty_cp, timings, verify_ids, jobs, quiet=False)
+
+    @classmethod
+    def from_objects(cls, epjson: Any, json_results: Any, json_hourly_results: Any,
+                     compliance_parameters: Optional[JsonDict] = None, validator: Optional[Validator] = None,
+                     timings=False, verify_ids=False, jobs=1) -> 'Translator':
+        """Returns a translator for the inputs of a model that are already in memory
+
+        The epJSON, results and hourly results are each the parsed JSON object or an open file to parse it from.
+        The compliance parameters, when given, are merged in as they are from the file used with --add_cp. Call
+        translate() for the RPD dict. Nothing is read from or written to the file system, no status report is
+        generated and nothing is printed; a validation failure is kept in validation_message instead.
+        """
+        translator = cls.__new__(cls)
+        translator.output_file = None
+        translator.rpd_file_path = None
+        translator.compliance_parameter = ComplianceParameterHandler()
+        if compliance_parameters is not None:
+            translator.compliance_parameter.cp_file = compliance_parameters
+        translator.set_up(InputFile.from_objects(epjson, json_results, json_hourly_results), validator, None,
+                          compliance_parameters is not None, False, timings, verify_ids, jobs, quiet=True)
+        return translator
+
+    def set_up(self, input_file: InputFile, validator: Optional[Validator], status_reporter: Optional[StatusReporter],
+               add_cp: bool, empty_cp: bool, timings: bool, verify_ids: bool, jobs: int, quiet: bool):
+        self.input_file = input_file
+        self.epjson_object = self.input_file.epjson_object
+        self.json_results_object = self.input_file.json_results_object
+        self.json_hourly_results_object = self.input_file.json_hourly_results_object
+
+        # the schemas are only loaded and compiled once per process unless a validator is passed in
+        self.validator = validator if validator is not None else get_shared_validator()
+        # the status report is for tracking development and is only generated when a status reporter is passed in
+        self.status_reporter = status_reporter
+        # with timings on, each stage of process() is recorded and can be reported afterwards
+        self.stage_timer: Optional[StageTimer] = StageTimer() if timings else None
+        # the number of threads that run the stages of MODEL_STAGES which do not depend on each other
+        self.jobs = jobs
+        # when quiet, the messages of the translation are kept in messages instead of printed
+        self.quiet = quiet
+        self.messages: List[str] = []
+        self.validation_message = ''
 
         self.do_use_compliance_parameters = add_cp
         self.do_create_empty_compliance_parameters = empty_cp
 
-        self.compliance_parameter = ComplianceParameterHandler(epjson_file_path)
-        if self.do_use_compliance_parameters or self.do_create_empty_compliance_parameters:
-            print(f"File with compliance parameter information is: {self.compliance_parameter.cp_empty_file_path}")
-
         self.project_description = {}
         self.model_description = {}
         self.building = {}
@@ -229,9 +305,20 @@ class Translator:
         self.surfaces_by_zone = {}
         self.schedules_used_names = []
         self.terminals_by_zone = {}
-        self.serial_number = 0
-        self.id_used = set()
+        self.id_registry = IdRegistry(self.validator.numeric_array_properties)
+        self.do_verify_ids = verify_ids
         self.pump_extra = {}
+        self._tabular_catalog: Optional[TabularCatalog] = None
+        self._hvac_topology: Optional[HvacTopology] = None
+        self._hvac_topology_catalog: Optional[TabularCatalog] = None
+        self._plant_topology: Optional[PlantTopology] = None
+        self._plant_topology_catalog: Optional[TabularCatalog] = None
+        self._envelope_topology: Optional[EnvelopeTopology] = None
+        self._envelope_topology_catalog: Optional[TabularCatalog] = None
+        self._fact_cache = FactCache()
+        self._fact_cache_catalog: Optional[TabularCatalog] = None
+        self._hourly_store: Optional[HourlyStore] = None
+        self._hourly_store_source: Optional[JsonDict] = None
 
     @staticmethod
     def validate_input_contents(input_json: Dict):
@@ -247,13 +334,7 @@ class Translator:
         return list(building_input.keys())[0]
 
     def get_zone_for_each_surface(self):
-        surfaces_to_zone = {}
-        if 'BuildingSurface:Detailed' in self.epjson_object:
-            building_surface_detailed = self.epjson_object['BuildingSurface:Detailed']
-            for surface_name, fields in building_surface_detailed.items():
-                if 'zone_name' in fields:
-                    surfaces_to_zone[surface_name.upper()] = fields['zone_name'].upper()
-        return surfaces_to_zone
+        return dict(self.envelope_topology.zone_by_surface)
 
     def get_dynamic_fenestration(self):
         dynamic_fenestrations = []
@@ -306,22 +387,10 @@ class Translator:
         return windows_with_fins
 
     def get_adjacent_surface_for_each_surface(self):
-        adjacent_by_surface = {}
-        if 'BuildingSurface:Detailed' in self.epjson_object:
-            building_surface_detailed = self.epjson_object['BuildingSurface:Detailed']
-            for surface_name, fields in building_surface_detailed.items():
-                if 'outside_boundary_condition_object' in fields:
-                    adjacent_by_surface[surface_name.upper()] = fields['outside_boundary_condition_object'].upper()
-        return adjacent_by_surface
+        return dict(self.envelope_topology.adjacent_surface_by_surface)
 
     def get_outside_boundary_condition_for_each_surface(self):
-        boundary_by_surface = {}
-        if 'BuildingSurface:Detailed' in self.epjson_object:
-            building_surface_detailed = self.epjson_object['BuildingSurface:Detailed']
-            for surface_name, fields in building_surface_detailed.items():
-                if 'outside_boundary_condition' in fields:
-                    boundary_by_surface[surface_name.upper()] = fields['outside_boundary_condition'].upper()
-        return boundary_by_surface
+        return dict(self.envelope_topology.outside_boundary_condition_by_surface)
 
     @staticmethod
     def should_emit_surface(surface_name, surfaces_by_surface, adjacent_surfaces):
@@ -449,23 +518,19 @@ class Translator:
 
     def gather_people_schedule_by_zone(self):
         people_schedule_by_zone = {}
-        tabular_reports = self.json_results_object['TabularReports']
-        for tabular_report in tabular_reports:
-            if tabular_report['ReportName'] == 'InitializationSummary':
-                tables = tabular_report['Tables']
-                for table in tables:
-                    if table['TableName'] == 'People Internal Gains Nominal':
-                        rows = table['Rows']
-                        row_keys = list(rows.keys())
-                        cols = table['Cols']
-                        zone_name_column = cols.index('Zone Name')
-                        schedule_name_column = cols.index('Schedule Name')
-                        for row_key in row_keys:
-                            if row_key == 'None':
-                                continue
-                            zone_name = rows[row_key][zone_name_column]
-                            schedule_name = rows[row_key][schedule_name_column]
-                            people_schedule_by_zone[zone_name.upper()] = schedule_name
+        table = self.get_table('InitializationSummary', 'People Internal Gains Nominal')
+        if table:
+            rows = table['Rows']
+            row_keys = list(rows.keys())
+            cols = table['Cols']
+            zone_name_column = cols.index('Zone Name')
+            schedule_name_column = cols.index('Schedule Name')
+            for row_key in row_keys:
+                if row_key == 'None':
+                    continue
+                zone_name = rows[row_key][zone_name_column]
+                schedule_name = rows[row_key][schedule_name_column]
+                people_schedule_by_zone[zone_name.upper()] = schedule_name
         # print(people_schedule_by_zone)
         return people_schedule_by_zone
 
@@ -508,8 +573,7 @@ class Translator:
 
     def add_external_fluid_source(self):
         external_fluid_sources = []
-        plant_loop_arrangements = self.gather_table_into_list('HVACTopology', 'Plant Loop Component Arrangement')
-        for arrangement_row in plant_loop_arrangements:
+        for arrangement_row in self.plant_topology.rows:
             comp_type = arrangement_row['Component Type']
             if comp_type == 'DISTRICTCOOLING':
                 external_fluid = {
@@ -537,40 +601,35 @@ class Translator:
         return external_fluid_sources
 
     def add_weather(self):
-        tabular_reports = self.json_results_object['TabularReports']
         weather_file = ''
         climate_zone = ''
         heating_design_day_option = ''
         cooling_design_day_option = ''
-        for tabular_report in tabular_reports:
-            if tabular_report['ReportName'] == 'InputVerificationandResultsSummary':
-                tables = tabular_report['Tables']
-                for table in tables:
-                    if table['TableName'] == 'General':
-                        rows = table['Rows']
-                        weather_file = rows['Weather File'][0]
-            if tabular_report['ReportName'] == 'ClimaticDataSummary':
-                tables = tabular_report['Tables']
-                for table in tables:
-                    if table['TableName'] == 'Weather Statistics File':
-                        rows = table['Rows']
-                        if 'ASHRAE Climate Zone' in rows:
-                            climate_zone = rows['ASHRAE Climate Zone'][0]
-                            if climate_zone:
-                                climate_zone = 'CZ' + climate_zone
-                    if table['TableName'] == 'SizingPeriod:DesignDay':
-                        rows = table['Rows']
-                        for design_day_names in rows.keys():
-                            if '99.6%' in design_day_names:
-                                heating_design_day_option = 'HEATING_99_6'
-                            elif '99%' in design_day_names or '99.0%' in design_day_names:
-                                heating_design_day_option = 'HEATING_99_0'
-                            elif '.4%' in design_day_names:
-                                cooling_design_day_option = 'COOLING_0_4'
-                            elif '1%' in design_day_names or '1.0%' in design_day_names:
-                                cooling_design_day_option = 'COOLING_1_0'
-                            elif '2%' in design_day_names or '2.0%' in design_day_names:
-                                cooling_design_day_option = 'COOLING_2_0'
+        general_table = self.get_table('InputVerificationandResultsSummary', 'General')
+        if general_table:
+            rows = general_table['Rows']
+            weather_file = rows['Weather File'][0]
+        weather_statistics_table = self.get_table('ClimaticDataSummary', 'Weather Statistics File')
+        if weather_statistics_table:
+            rows = weather_statistics_table['Rows']
+            if 'ASHRAE Climate Zone' in rows:
+                climate_zone = rows['ASHRAE Climate Zone'][0]
+                if climate_zone:
+                    climate_zone = 'CZ' + climate_zone
+        design_day_table = self.get_table('ClimaticDataSummary', 'SizingPeriod:DesignDay')
+        if design_day_table:
+            rows = design_day_table['Rows']
+            for design_day_names in rows.keys():
+                if '99.6%' in design_day_names:
+                    heating_design_day_option = 'HEATING_99_6'
+                elif '99%' in design_day_names or '99.0%' in design_day_names:
+                    heating_design_day_option = 'HEATING_99_0'
+                elif '.4%' in design_day_names:
+                    cooling_design_day_option = 'COOLING_0_4'
+                elif '1%' in design_day_names or '1.0%' in design_day_names:
+                    cooling_design_day_option = 'COOLING_1_0'
+                elif '2%' in design_day_names or '2.0%' in design_day_names:
+                    cooling_design_day_option = 'COOLING_2_0'
         weather = {
             'file_name': weather_file,
             'data_source_type': 'OTHER',
@@ -585,69 +644,61 @@ class Translator:
         return weather
 
     def add_calendar(self):
-        tabular_reports = self.json_results_object['TabularReports']
         calendar = {}
-        for tabular_report in tabular_reports:
-            if tabular_report['ReportName'] == 'InitializationSummary':
-                tables = tabular_report['Tables']
-                for table in tables:
-                    if table['TableName'] == 'Environment':
-                        rows = table['Rows']
-                        row_keys = list(rows.keys())
-                        cols = table['Cols']
-                        environment_name_column = cols.index('Environment Name')
-                        start_date_column = cols.index('Start Date')
-                        start_day_of_week_column = cols.index('Start DayOfWeek')
-                        for row_key in row_keys:
-                            if row_key == 'None':
-                                continue
-                            environment_name = rows[row_key][environment_name_column]
-                            start_date = rows[row_key][start_date_column]
-                            calendar['notes'] = 'name environment: ' + environment_name
-                            # add day of week for january 1 only if the start date is 01/01/xxxx
-                            start_date_parts = start_date.split('/')
-                            if start_date_parts[0] == '01' and start_date_parts[1] == '01':
-                                start_day_of_week = rows[row_key][start_day_of_week_column]
-                                calendar['day_of_week_for_january_1'] = start_day_of_week.upper()
-                            self.model_description['calendar'] = calendar
+        table = self.get_table('InitializationSummary', 'Environment')
+        if table:
+            rows = table['Rows']
+            row_keys = list(rows.keys())
+            cols = table['Cols']
+            environment_name_column = cols.index('Environment Name')
+            start_date_column = cols.index('Start Date')
+            start_day_of_week_column = cols.index('Start DayOfWeek')
+            for row_key in row_keys:
+                if row_key == 'None':
+                    continue
+                environment_name = rows[row_key][environment_name_column]
+                start_date = rows[row_key][start_date_column]
+                calendar['notes'] = 'name environment: ' + environment_name
+                # add day of week for january 1 only if the start date is 01/01/xxxx
+                start_date_parts = start_date.split('/')
+                if start_date_parts[0] == '01' and start_date_parts[1] == '01':
+                    start_day_of_week = rows[row_key][start_day_of_week_column]
+                    calendar['day_of_week_for_january_1'] = start_day_of_week.upper()
+                self.model_description['calendar'] = calendar
         return calendar
 
     def add_exterior_lighting(self):
         exterior_lightings = []
-        tabular_reports = self.json_results_object['TabularReports']
-        for tabular_report in tabular_reports:
-            if tabular_report['ReportName'] == 'LightingSummary':
-                tables = tabular_report['Tables']
-                for table in tables:
-                    if table['TableName'] == 'Exterior Lighting':
-                        rows = table['Rows']
-                        exterior_light_names = list(rows.keys())
-                        exterior_light_names.remove('Exterior Lighting Total')
-                        cols = table['Cols']
-                        total_watt_column = cols.index('Total Watts')
-                        schedule_column = cols.index('Schedule Name')
-                        type_column = cols.index('Astronomical Clock/Schedule')
-                        for exterior_light_name in exterior_light_names:
-                            if exterior_light_name == 'None':
-                                continue
-                            exterior_light = {
-                                'id': exterior_light_name,
-                                'power': float(rows[exterior_light_name][total_watt_column]),
-                            }
-                            if rows[exterior_light_name][type_column] == 'AstronomicalClock':
-                                exterior_light['multiplier_schedule'] = 'uses_astronomical_clock_not_schedule'
-                            else:
-                                if rows[exterior_light_name][schedule_column] != '-':
-                                    exterior_light['multiplier_schedule'] = rows[exterior_light_name][schedule_column]
-                            exterior_lightings.append(exterior_light)
+        table = self.get_table('LightingSummary', 'Exterior Lighting')
+        if table:
+            rows = table['Rows']
+            exterior_light_names = list(rows.keys())
+            exterior_light_names.remove('Exterior Lighting Total')
+            cols = table['Cols']
+            total_watt_column = cols.index('Total Watts')
+            schedule_column = cols.index('Schedule Name')
+            type_column = cols.index('Astronomical Clock/Schedule')
+            for exterior_light_name in exterior_light_names:
+                if exterior_light_name == 'None':
+                    continue
+                exterior_light = {
+                    'id': exterior_light_name,
+                    'power': float(rows[exterior_light_name][total_watt_column]),
+                }
+                if rows[exterior_light_name][type_column] == 'AstronomicalClock':
+                    exterior_light['multiplier_schedule'] = 'uses_astronomical_clock_not_schedule'
+                else:
+                    if rows[exterior_light_name][schedule_column] != '-':
+                        exterior_light['multiplier_schedule'] = rows[exterior_light_name][schedule_column]
+                exterior_lightings.append(exterior_light)
         self.building['exterior_lighting'] = exterior_lightings
         return exterior_lightings
 
     def add_zones(self):
-        tabular_reports = self.json_results_object['TabularReports']
         zones = []
+        envelope_topology = self.envelope_topology
         surfaces_by_surface = self.gather_surfaces()
-        adjacent_surfaces = self.get_adjacent_surface_for_each_surface()
+        adjacent_surfaces = envelope_topology.adjacent_surface_by_surface
         setpoint_schedules = self.gather_thermostat_setpoint_schedules()
         humid_sch_name_by_zone = self.gather_humidity_schedules()
         effective_by_zone = self.gather_air_dist_effectiveness()
@@ -657,76 +708,71 @@ class Translator:
         infiltration_by_zone = self.gather_infiltration()
         exhaust_fans_by_zone = self.gather_exhaust_fans_by_zone()
         equipment_fans = self.gather_equipment_fans()
-        for tabular_report in tabular_reports:
-            if tabular_report['ReportName'] == 'InputVerificationandResultsSummary':
-                tables = tabular_report['Tables']
-                for table in tables:
-                    if table['TableName'] == 'Zone Summary':
-                        rows = table['Rows']
-                        zone_names = list(rows.keys())
-                        zone_names.remove('Total')
-                        zone_names.remove('Conditioned Total')
-                        zone_names.remove('Unconditioned Total')
-                        zone_names.remove('Not Part of Total')
-                        # print(zone_names)
-                        cols = table['Cols']
-                        volume_column = cols.index('Volume [m3]')
-                        # print(volume_column)
-                        for zone_name in zone_names:
-                            if zone_name == 'None':
-                                continue
-                            zone = {'id': zone_name,
-                                    'volume': float(rows[zone_name][volume_column]),
-                                    }
-                            # 'thermostat_cooling_setpoint_schedule': 'always_70',
-                            # 'thermostat_heating_setpoint_schedule': 'always_70',
-                            # 'minimum_humidity_setpoint_schedule': 'always_0_3',
-                            # 'maximum_humidity_setpoint_schedule': 'always_0_8',
-                            # 'exhaust_airflow_rate_multiplier_schedule': 'always_1'}
-                            zones.append(zone)
-                            if zone_name in setpoint_schedules:
-                                zone['thermostat_cooling_setpoint_schedule'] = setpoint_schedules[zone_name]['cool']
-                                zone['thermostat_heating_setpoint_schedule'] = setpoint_schedules[zone_name]['heat']
-                            if zone_name in setpoint_by_zone:
-                                heat_setpoint, cool_setpoint = setpoint_by_zone[zone_name]
-                                zone['design_thermostat_heating_setpoint'] = heat_setpoint
-                                zone['design_thermostat_cooling_setpoint'] = cool_setpoint
-                            if zone_name.upper() in humid_sch_name_by_zone:
-                                humid_sch, dehumid_sch = humid_sch_name_by_zone[zone_name]
-                                zone['minimum_humidity_setpoint_schedule'] = humid_sch
-                                zone['maximum_humidity_setpoint_schedule'] = dehumid_sch
-                            if zone_name in effective_by_zone:
-                                zone['air_distribution_effectiveness'] = effective_by_zone[zone_name]
-                            surfaces = []
-                            for key, value in self.surfaces_by_zone.items():
-                                if zone_name == value:
-                                    if self.should_emit_surface(key, surfaces_by_surface, adjacent_surfaces):
-                                        surfaces.append(surfaces_by_surface[key])
-                            zone['surfaces'] = surfaces
-                            if zone_name in infiltration_by_zone:
-                                zone['infiltration'] = infiltration_by_zone[zone_name]
-                            else:
-                                infiltration_zero = {
-                                    'id': 'infiltration-' + zone_name,
-                                    'modeling_method': 'WEATHER_DRIVEN',
-                                    'algorithm_name': 'ZoneInfiltration',
-                                    'flow_rate': 0.0,
-                                    'multiplier_schedule': 'always_1'
-                                }
-                                zone['infiltration'] = infiltration_zero
-                            if zone_name.upper() in self.terminals_by_zone:
-                                zone['terminals'] = self.terminals_by_zone[zone_name.upper()]
-                            if zone_name.upper() in zone_info_init_summary:
-                                zone['floor_name'] = 'Floor at Height ' + zone_info_init_summary[zone_name.upper()][
-                                    'Minimum Z {m}']
-                            if zone_name.upper() in exhaust_fans_by_zone:
-                                zone['zonal_exhaust_fans'] = [
-                                    {
-                                        "id": f"{zone_name} exhaust_fan",
-                                        **equipment_fans[exhaust_fans_by_zone[zone_name.upper()]][0],
-                                    }
-                                ]
-                break
+        table = self.get_table('InputVerificationandResultsSummary', 'Zone Summary')
+        if table:
+            rows = table['Rows']
+            zone_names = list(rows.keys())
+            zone_names.remove('Total')
+            zone_names.remove('Conditioned Total')
+            zone_names.remove('Unconditioned Total')
+            zone_names.remove('Not Part of Total')
+            # print(zone_names)
+            cols = table['Cols']
+            volume_column = cols.index('Volume [m3]')
+            # print(volume_column)
+            for zone_name in zone_names:
+                if zone_name == 'None':
+                    continue
+                zone = {'id': zone_name,
+                        'volume': float(rows[zone_name][volume_column]),
+                        }
+                # 'thermostat_cooling_setpoint_schedule': 'always_70',
+                # 'thermostat_heating_setpoint_schedule': 'always_70',
+                # 'minimum_humidity_setpoint_schedule': 'always_0_3',
+                # 'maximum_humidity_setpoint_schedule': 'always_0_8',
+                # 'exhaust_airflow_rate_multiplier_schedule': 'always_1'}
+                zones.append(zone)
+                if zone_name in setpoint_schedules:
+                    zone['thermostat_cooling_setpoint_schedule'] = setpoint_schedules[zone_name]['cool']
+                    zone['thermostat_heating_setpoint_schedule'] = setpoint_schedules[zone_name]['heat']
+                if zone_name in setpoint_by_zone:
+                    heat_setpoint, cool_setpoint = setpoint_by_zone[zone_name]
+                    zone['design_thermostat_heating_setpoint'] = heat_setpoint
+                    zone['design_thermostat_cooling_setpoint'] = cool_setpoint
+                if zone_name.upper() in humid_sch_name_by_zone:
+                    humid_sch, dehumid_sch = humid_sch_name_by_zone[zone_name]
+                    zone['minimum_humidity_setpoint_schedule'] = humid_sch
+                    zone['maximum_humidity_setpoint_schedule'] = dehumid_sch
+                if zone_name in effective_by_zone:
+                    zone['air_distribution_effectiveness'] = effective_by_zone[zone_name]
+                surfaces = []
+                for surface_name in envelope_topology.surfaces_of_zone(zone_name):
+                    if self.should_emit_surface(surface_name, surfaces_by_surface, adjacent_surfaces):
+                        surfaces.append(surfaces_by_surface[surface_name])
+                zone['surfaces'] = surfaces
+                if zone_name in infiltration_by_zone:
+                    zone['infiltration'] = infiltration_by_zone[zone_name]
+                else:
+                    infiltration_zero = {
+                        'id': 'infiltration-' + zone_name,
+                        'modeling_method': 'WEATHER_DRIVEN',
+                        'algorithm_name': 'ZoneInfiltration',
+                        'flow_rate': 0.0,
+                        'multiplier_schedule': 'always_1'
+                    }
+                    zone['infiltration'] = infiltration_zero
+                if zone_name.upper() in self.terminals_by_zone:
+                    zone['terminals'] = self.terminals_by_zone[zone_name.upper()]
+                if zone_name.upper() in zone_info_init_summary:
+                    zone['floor_name'] = 'Floor at Height ' + zone_info_init_summary[zone_name.upper()][
+                        'Minimum Z {m}']
+                if zone_name.upper() in exhaust_fans_by_zone:
+                    zone['zonal_exhaust_fans'] = [
+                        {
+                            "id": f"{zone_name} exhaust_fan",
+                            **equipment_fans[exhaust_fans_by_zone[zone_name.upper()]][0],
+                        }
+                    ]
         self.building_segment['zones'] = zones
         return zones
 
@@ -767,109 +813,109 @@ class Translator:
         return effective_by_zone
 
     def add_spaces(self):
-        tabular_reports = self.json_results_object['TabularReports']
         spaces: Dict[str, List[JsonDict]] = {}
         lights_by_space = self.gather_interior_lighting()
         people_schedule_by_zone = self.gather_people_schedule_by_zone()
         equipment_by_zone = self.gather_miscellaneous_equipment()
         people_annual_list = self.gather_table_into_list("PEOPLE INTERNAL GAIN ANNUAL", "Custom Annual Report")
-        for tabular_report in tabular_reports:
-            if tabular_report['ReportName'] == 'InputVerificationandResultsSummary':
-                tables = tabular_report['Tables']
-                for table in tables:
-                    if table['TableName'] == 'Space Summary':
-                        rows = table['Rows']
-                        space_names = list(rows.keys())
-                        if 'Total' in space_names:
-                            space_names.remove('Total')
-                        if 'Conditioned Total' in space_names:
-                            space_names.remove('Conditioned Total')
-                        if 'Unconditioned Total' in space_names:
-                            space_names.remove('Unconditioned Total')
-                        if 'Not Part of Total' in space_names:
-                            space_names.remove('Not Part of Total')
-                        # print(space_names)
-                        cols = table['Cols']
-                        zone_name_column = cols.index('Zone Name')
-                        area_column = cols.index('Area [m2]')
-                        people_density_column = cols.index('People [m2 per person]')
-                        space_type_column = cols.index('Space Type')
-                        tags_column = cols.index('Tags')
-                        for space_name in space_names:
-                            if space_name == 'None':
-                                continue
-                            floor_area = float(rows[space_name][area_column])
-                            people_density = float(rows[space_name][people_density_column])
-                            zone_name = rows[space_name][zone_name_column]
-                            space_type = rows[space_name][space_type_column]
-                            tags = rows[space_name][tags_column]
-
-                            if people_density > 0:
-                                people = floor_area / people_density
-                            else:
-                                people = 0
-
-                            space = {'id': space_name,
-                                     'floor_area': floor_area,
-                                     'number_of_occupants': round(people, 2),
-                                     }
-                            if zone_name in people_schedule_by_zone:
-                                space['occupant_multiplier_schedule'] = people_schedule_by_zone[zone_name]
-
-                            # get the sensible and latent from annual
-                            # this only works if space name is subset of people input object name
-                            sensible = 0
-                            latent = 0
-                            for people_annual_row in people_annual_list:
-                                if space_name in people_annual_row['first column']:
-                                    people_count = float(people_annual_row['People Occupant Count {AT MAX/MIN} []'])
-                                    if people_count > 0:
-                                        sens = float(people_annual_row['People Sensible Heating Rate {AT MAX/MIN} [W]'])
-                                        sensible = sens / people_count
-                                        lat = float(people_annual_row['People Latent Gain Rate {AT MAX/MIN} [W]'])
-                                        latent = lat / people_count
-                                    break
-                            if sensible > 0:
-                                space['occupant_sensible_heat_gain'] = sensible
-                            if latent > 0:
-                                space['occupant_latent_heat_gain'] = latent
-
-                            if space_name in lights_by_space:
-                                space['interior_lighting'] = lights_by_space[space_name]
-                            if space_type:
-                                if self.validator.is_in_901_enumeration('LightingSpaceOptions2019ASHRAE901TG37',
-                                                                        space_type.upper()):
-                                    space['lighting_space_type'] = space_type
-                                # print(space, rows[space_name][zone_name_column])
-                            if zone_name in equipment_by_zone:
-                                misc_equipments = equipment_by_zone[zone_name]
-                                # remove power density and replace with power
-                                for misc_equipment in misc_equipments:
-                                    power_density = misc_equipment.pop('POWER DENSITY')
-                                    power = power_density * floor_area
-                                    misc_equipment['power'] = power
-                                    space['miscellaneous_equipment'] = misc_equipments
-                            tag_list = []
-                            if tags:
-                                if ',' in tags:
-                                    tag_list = tags.split(', ')
-                                else:
-                                    tag_list.append(tags)
-                            if tag_list:
-                                first_tag = tag_list.pop(0)
-                                if self.validator.is_in_901_enumeration('VentilationSpaceOptions2019ASHRAE901',
-                                                                        first_tag.upper()):
-                                    space['ventilation_space_type'] = first_tag
-                            if tag_list:
-                                second_tag = tag_list.pop(0)
-                                if self.validator.is_in_901_enumeration('ServiceWaterHeatingSpaceOptions2019ASHRAE901',
-                                                                        second_tag.upper()):
-                                    space['service_water_heating_area_type'] = second_tag
-                            zone_key = zone_name.upper()
-                            if zone_key not in spaces:
-                                spaces[zone_key] = [space]
-                            else:
-                                spaces[zone_key].append(space)
+        enumeration_index = self.validator.enumeration_index
+        table = self.get_table('InputVerificationandResultsSummary', 'Space Summary')
+        if table:
+            rows = table['Rows']
+            space_names = list(rows.keys())
+            if 'Total' in space_names:
+                space_names.remove('Total')
+            if 'Conditioned Total' in space_names:
+                space_names.remove('Conditioned Total')
+            if 'Unconditioned Total' in space_names:
+                space_names.remove('Unconditioned Total')
+            if 'Not Part of Total' in space_names:
+                space_names.remove('Not Part of Total')
+            # print(space_names)
+            cols = table['Cols']
+            zone_name_column = cols.index('Zone Name')
+            area_column = cols.index('Area [m2]')
+            people_density_column = cols.index('People [m2 per person]')
+            space_type_column = cols.index('Space Type')
+            tags_column = cols.index('Tags')
+            for space_name in space_names:
+                if space_name == 'None':
+                    continue
+                floor_area = float(rows[space_name][area_column])
+                people_density = float(rows[space_name][people_density_column])
+                zone_name = rows[space_name][zone_name_column]
+                space_type = rows[space_name][space_type_column]
+                tags = rows[space_name][tags_column]
+
+                if people_density > 0:
+                    people = floor_area / people_density
+                else:
+                    people = 0
+
+                space = {'id': space_name,
+                         'floor_area': floor_area,
+                         'number_of_occupants': round(people, 2),
+                         }
+                if zone_name in people_schedule_by_zone:
+                    space['occupant_multiplier_schedule'] = people_schedule_by_zone[zone_name]
+
+                # get the sensible and latent from annual
+                # this only works if space name is subset of people input object name
+                sensible = 0
+                latent = 0
+                for people_annual_row in people_annual_list:
+                    if space_name in people_annual_row['first column']:
+                        people_count = float(people_annual_row['People Occupant Count {AT MAX/MIN} []'])
+                        if people_count > 0:
+                            sens = float(people_annual_row['People Sensible Heating Rate {AT MAX/MIN} [W]'])
+                            sensible = sens / people_count
+                            lat = float(people_annual_row['People Latent Gain Rate {AT MAX/MIN} [W]'])
+                            latent = lat / people_count
+                        break
+                if sensible > 0:
+                    space['occupant_sensible_heat_gain'] = sensible
+                if latent > 0:
+                    space['occupant_latent_heat_gain'] = latent
+
+                if space_name in lights_by_space:
+                    space['interior_lighting'] = lights_by_space[space_name]
+                if space_type:
+                    lighting_space_type = enumeration_index.canonical('LightingSpaceOptions2019ASHRAE901TG37',
+                                                                      space_type)
+                    if lighting_space_type:
+                        space['lighting_space_type'] = lighting_space_type
+                    # print(space, rows[space_name][zone_name_column])
+                if zone_name in equipment_by_zone:
+                    misc_equipments = equipment_by_zone[zone_name]
+                    # remove power density and replace with power
+                    for misc_equipment in misc_equipments:
+                        power_density = misc_equipment.pop('POWER DENSITY')
+                        power = power_density * floor_area
+                        misc_equipment['power'] = power
+                        space['miscellaneous_equipment'] = misc_equipments
+                tag_list = []
+                if tags:
+                    if ',' in tags:
+                        tag_list = tags.split(', ')
+                    else:
+                        tag_list.append(tags)
+                if tag_list:
+                    first_tag = tag_list.pop(0)
+                    ventilation_space_type = enumeration_index.canonical('VentilationSpaceOptions2019ASHRAE901',
+                                                                         first_tag)
+                    if ventilation_space_type:
+                        space['ventilation_space_type'] = ventilation_space_type
+                if tag_list:
+                    second_tag = tag_list.pop(0)
+                    service_water_heating_area_type = enumeration_index.canonical(
+                        'ServiceWaterHeatingSpaceOptions2019ASHRAE901', second_tag)
+                    if service_water_heating_area_type:
+                        space['service_water_heating_area_type'] = service_water_heating_area_type
+                zone_key = zone_name.upper()
+                if zone_key not in spaces:
+                    spaces[zone_key] = [space]
+                else:
+                    spaces[zone_key].append(space)
         # insert the space into the corresponding Zone
         for zone in self.building_segment['zones']:
             zone['spaces'] = spaces.get(zone['id'].upper(), [])
@@ -882,192 +928,180 @@ class Translator:
         return legacy_spaces
 
     def gather_interior_lighting(self):
-        tabular_reports = self.json_results_object['TabularReports']
         lights = {}  # dictionary by space name containing the lights
-        for tabular_report in tabular_reports:
-            if tabular_report['ReportName'] == 'LightingSummary':
-                tables = tabular_report['Tables']
-
-                # gather the daylighting method used by zone name
-                daylighting_method_dict = {}
-                for table in tables:
-                    if table['TableName'] == 'Daylighting':
-                        rows = table['Rows']
-                        daylighting_names = list(rows.keys())
-                        cols = table['Cols']
-                        zone_name_column = cols.index('Zone')
-                        daylighting_method_column = cols.index('Daylighting Method')
-                        for daylighting_name in daylighting_names:
-                            if daylighting_name == 'None':
-                                continue
-                            zone_name = rows[daylighting_name][zone_name_column]
-                            daylighting_method_dict[zone_name] = rows[daylighting_name][daylighting_method_column]
-
-                for table in tables:
-                    if table['TableName'] == 'Interior Lighting':
-                        rows = table['Rows']
-                        int_light_names = list(rows.keys())
-                        if 'Interior Lighting Total' in int_light_names:
-                            int_light_names.remove('Interior Lighting Total')
-                        cols = table['Cols']
-                        space_name_column = cols.index('Space Name')
-                        zone_name_column = cols.index('Zone Name')
-                        schedule_name_column = cols.index('Schedule Name')
-                        power_density_column = cols.index('Lighting Power Density [W/m2]')
-                        for int_light_name in int_light_names:
-                            if int_light_name == 'None':
-                                continue
-                            power_density = float(rows[int_light_name][power_density_column])
-                            space_name = rows[int_light_name][space_name_column]
-                            zone_name = rows[int_light_name][zone_name_column]
-                            schedule_name = rows[int_light_name][schedule_name_column]
-                            daylighting_control_type = 'NONE'
-                            if zone_name in daylighting_method_dict:
-                                native_method = daylighting_method_dict[zone_name]
-                                if native_method.find('Continuous'):
-                                    daylighting_control_type = 'CONTINUOUS_DIMMING'
-                                elif native_method.find('Step'):
-                                    daylighting_control_type = 'STEPPED'
-                            light = {'id': int_light_name,
-                                     'power_per_area': power_density,
-                                     'lighting_multiplier_schedule': schedule_name,
-                                     'daylighting_control_type': daylighting_control_type,
-                                     'are_schedules_used_for_modeling_occupancy_control': True,
-                                     'are_schedules_used_for_modeling_daylighting_control': False
-                                     }
-                            self.schedules_used_names.append(schedule_name)
-                            # print(light)
-                            if space_name not in lights:
-                                lights[space_name] = [light, ]
-                            else:
-                                lights[space_name].append(light)
+
+        # gather the daylighting method used by zone name
+        daylighting_method_dict = {}
+        table = self.get_table('LightingSummary', 'Daylighting')
+        if table:
+            rows = table['Rows']
+            daylighting_names = list(rows.keys())
+            cols = table['Cols']
+            zone_name_column = cols.index('Zone')
+            daylighting_method_column = cols.index('Daylighting Method')
+            for daylighting_name in daylighting_names:
+                if daylighting_name == 'None':
+                    continue
+                zone_name = rows[daylighting_name][zone_name_column]
+                daylighting_method_dict[zone_name] = rows[daylighting_name][daylighting_method_column]
+
+        table = self.get_table('LightingSummary', 'Interior Lighting')
+        if table:
+            rows = table['Rows']
+            int_light_names = list(rows.keys())
+            if 'Interior Lighting Total' in int_light_names:
+                int_light_names.remove('Interior Lighting Total')
+            cols = table['Cols']
+            space_name_column = cols.index('Space Name')
+            zone_name_column = cols.index('Zone Name')
+            schedule_name_column = cols.index('Schedule Name')
+            power_density_column = cols.index('Lighting Power Density [W/m2]')
+            for int_light_name in int_light_names:
+                if int_light_name == 'None':
+                    continue
+                power_density = float(rows[int_light_name][power_density_column])
+                space_name = rows[int_light_name][space_name_column]
+                zone_name = rows[int_light_name][zone_name_column]
+                schedule_name = rows[int_light_name][schedule_name_column]
+                daylighting_control_type = 'NONE'
+                if zone_name in daylighting_method_dict:
+                    native_method = daylighting_method_dict[zone_name]
+                    if native_method.find('Continuous'):
+                        daylighting_control_type = 'CONTINUOUS_DIMMING'
+                    elif native_method.find('Step'):
+                        daylighting_control_type = 'STEPPED'
+                light = {'id': int_light_name,
+                         'power_per_area': power_density,
+                         'lighting_multiplier_schedule': schedule_name,
+                         'daylighting_control_type': daylighting_control_type,
+                         'are_schedules_used_for_modeling_occupancy_control': True,
+                         'are_schedules_used_for_modeling_daylighting_control': False
+                         }
+                self.schedules_used_names.append(schedule_name)
+                # print(light)
+                if space_name not in lights:
+                    lights[space_name] = [light, ]
+                else:
+                    lights[space_name].append(light)
         return lights
 
     def gather_miscellaneous_equipment(self):
         miscellaneous_equipments_by_zone = {}  # dictionary by space name containing list of data elements
-        tabular_reports = self.json_results_object['TabularReports']
-        for tabular_report in tabular_reports:
-            if tabular_report['ReportName'] == 'InitializationSummary':
-                tables = tabular_report['Tables']
-                for table in tables:
-                    if table['TableName'] == 'ElectricEquipment Internal Gains Nominal':
-                        rows = table['Rows']
-                        row_keys = list(rows.keys())
-                        cols = table['Cols']
-                        equipment_name_column = cols.index('Name')
-                        zone_name_column = cols.index('Zone Name')
-                        power_density_column = cols.index('Equipment/Floor Area {W/m2}')
-                        schedule_name_column = cols.index('Schedule Name')
-                        latent_column = cols.index('Fraction Latent')
-                        lost_column = cols.index('Fraction Lost')
-                        for row_key in row_keys:
-                            if row_key == 'None':
-                                continue
-                            equipment_name = rows[row_key][equipment_name_column]
-                            zone_name = rows[row_key][zone_name_column]
-                            power_density = float(rows[row_key][power_density_column])
-                            schedule_name = rows[row_key][schedule_name_column]
-                            latent = float(rows[row_key][latent_column])
-                            lost = float(rows[row_key][lost_column])
-                            sensible = 1 - (latent + lost)
-                            equipment = {
-                                'id': equipment_name,
-                                'energy_type': 'ELECTRICITY',
-                                'multiplier_schedule': schedule_name,
-                                'sensible_fraction': sensible,
-                                'latent_fraction': latent,
-                                'POWER DENSITY': power_density
-                            }
-                            self.schedules_used_names.append(schedule_name)
-                            # print(equipment)
-                            if zone_name.upper() not in miscellaneous_equipments_by_zone:
-                                miscellaneous_equipments_by_zone[zone_name.upper()] = [equipment, ]
-                            else:
-                                miscellaneous_equipments_by_zone[zone_name.upper()].append(equipment)
+        table = self.get_table('InitializationSummary', 'ElectricEquipment Internal Gains Nominal')
+        if table:
+            rows = table['Rows']
+            row_keys = list(rows.keys())
+            cols = table['Cols']
+            equipment_name_column = cols.index('Name')
+            zone_name_column = cols.index('Zone Name')
+            power_density_column = cols.index('Equipment/Floor Area {W/m2}')
+            schedule_name_column = cols.index('Schedule Name')
+            latent_column = cols.index('Fraction Latent')
+            lost_column = cols.index('Fraction Lost')
+            for row_key in row_keys:
+                if row_key == 'None':
+                    continue
+                equipment_name = rows[row_key][equipment_name_column]
+                zone_name = rows[row_key][zone_name_column]
+                power_density = float(rows[row_key][power_density_column])
+                schedule_name = rows[row_key][schedule_name_column]
+                latent = float(rows[row_key][latent_column])
+                lost = float(rows[row_key][lost_column])
+                sensible = 1 - (latent + lost)
+                equipment = {
+                    'id': equipment_name,
+                    'energy_type': 'ELECTRICITY',
+                    'multiplier_schedule': schedule_name,
+                    'sensible_fraction': sensible,
+                    'latent_fraction': latent,
+                    'POWER DENSITY': power_density
+                }
+                self.schedules_used_names.append(schedule_name)
+                # print(equipment)
+                if zone_name.upper() not in miscellaneous_equipments_by_zone:
+                    miscellaneous_equipments_by_zone[zone_name.upper()] = [equipment, ]
+                else:
+                    miscellaneous_equipments_by_zone[zone_name.upper()].append(equipment)
         return miscellaneous_equipments_by_zone
 
     def gather_subsurface(self):
-        tabular_reports = self.json_results_object['TabularReports']
         subsurface_by_surface = {}
         classification_by_subsurface = self.get_subsurface_classification()
         dynamic_fenestrations = self.get_dynamic_fenestration()
         windows_with_overhangs = self.find_window_overhangs()
         windows_with_fins = self.find_window_fins()
-        for tabular_report in tabular_reports:
-            if tabular_report['ReportName'] == 'EnvelopeSummary':
-                tables = tabular_report['Tables']
-                for table in tables:
-                    if table['TableName'] == 'Exterior Fenestration':
-                        rows = table['Rows']
-                        fenestration_names = list(rows.keys())
-                        if 'Non-North Total or Average' in fenestration_names:
-                            fenestration_names.remove('Non-North Total or Average')
-                        if 'North Total or Average' in fenestration_names:
-                            fenestration_names.remove('North Total or Average')
-                        if 'Total or Average' in fenestration_names:
-                            fenestration_names.remove('Total or Average')
-                        cols = table['Cols']
-                        glass_area_column = cols.index('Glass Area [m2]')
-                        parent_surface_column = cols.index('Parent Surface')
-                        frame_area_column = cols.index('Frame Area [m2]')
-                        divider_area_column = cols.index('Divider Area [m2]')
-                        glass_u_factor_column = cols.index('Glass U-Factor [W/m2-K]')
-                        glass_shgc_column = cols.index('Glass SHGC')
-                        glass_visible_trans_column = cols.index('Glass Visible Transmittance')
-                        assembly_u_factor_column = cols.index('Assembly U-Factor [W/m2-K]')
-                        assembly_shgc_column = cols.index('Assembly SHGC')
-                        assembly_visible_trans_column = cols.index('Assembly Visible Transmittance')
-                        shade_control_column = cols.index('Shade Control')
-                        for fenestration_name in fenestration_names:
-                            if fenestration_name == 'None':
-                                continue
-                            glass_area = float(rows[fenestration_name][glass_area_column])
-                            parent_surface_name = rows[fenestration_name][parent_surface_column]
-                            frame_area = float(rows[fenestration_name][frame_area_column])
-                            divider_area = float(rows[fenestration_name][divider_area_column])
-                            glass_u_factor = float(rows[fenestration_name][glass_u_factor_column])
-                            glass_shgc = float(rows[fenestration_name][glass_shgc_column])
-                            glass_visible_trans = float(rows[fenestration_name][glass_visible_trans_column])
-                            assembly_u_factor_str = rows[fenestration_name][assembly_u_factor_column]
-                            assembly_shgc_str = rows[fenestration_name][assembly_shgc_column]
-                            assembly_visible_trans_str = rows[fenestration_name][assembly_visible_trans_column]
-                            if assembly_u_factor_str:
-                                u_factor = float(assembly_u_factor_str)
-                            else:
-                                u_factor = glass_u_factor
-                            if assembly_shgc_str:
-                                shgc = float(assembly_shgc_str)
-                            else:
-                                shgc = glass_shgc
-                            if assembly_visible_trans_str:
-                                visible_trans = float(assembly_visible_trans_str)
-                            else:
-                                visible_trans = glass_visible_trans
-                            shade_control = rows[fenestration_name][shade_control_column]
-
-                            subsurface = {
-                                'id': fenestration_name,
-                                'glazed_area': glass_area,
-                                'opaque_area': frame_area + divider_area,
-                                'u_factor': u_factor,
-                                'solar_heat_gain_coefficient': shgc,
-                                'visible_transmittance': visible_trans,
-                                'has_automatic_shades': shade_control == 'Yes'
-                            }
-                            if fenestration_name in classification_by_subsurface:
-                                subsurface['classification'] = classification_by_subsurface[fenestration_name]
-                            else:
-                                subsurface['classification'] = 'WINDOW'
-                            if fenestration_name.lower() in dynamic_fenestrations:
-                                subsurface['dynamic_glazing_type'] = 'AUTOMATIC_DYNAMIC'
-                            else:
-                                subsurface['dynamic_glazing_type'] = 'NOT_DYNAMIC'
-                            subsurface['has_shading_overhang'] = fenestration_name.lower() in windows_with_overhangs
-                            subsurface['has_shading_sidefins'] = fenestration_name.lower() in windows_with_fins
-                            if parent_surface_name not in subsurface_by_surface:
-                                subsurface_by_surface[parent_surface_name] = [subsurface, ]
-                            else:
-                                subsurface_by_surface[parent_surface_name].append(subsurface)
+        table = self.get_table('EnvelopeSummary', 'Exterior Fenestration')
+        if table:
+            rows = table['Rows']
+            fenestration_names = list(rows.keys())
+            if 'Non-North Total or Average' in fenestration_names:
+                fenestration_names.remove('Non-North Total or Average')
+            if 'North Total or Average' in fenestration_names:
+                fenestration_names.remove('North Total or Average')
+            if 'Total or Average' in fenestration_names:
+                fenestration_names.remove('Total or Average')
+            cols = table['Cols']
+            glass_area_column = cols.index('Glass Area [m2]')
+            parent_surface_column = cols.index('Parent Surface')
+            frame_area_column = cols.index('Frame Area [m2]')
+            divider_area_column = cols.index('Divider Area [m2]')
+            glass_u_factor_column = cols.index('Glass U-Factor [W/m2-K]')
+            glass_shgc_column = cols.index('Glass SHGC')
+            glass_visible_trans_column = cols.index('Glass Visible Transmittance')
+            assembly_u_factor_column = cols.index('Assembly U-Factor [W/m2-K]')
+            assembly_shgc_column = cols.index('Assembly SHGC')
+            assembly_visible_trans_column = cols.index('Assembly Visible Transmittance')
+            shade_control_column = cols.index('Shade Control')
+            for fenestration_name in fenestration_names:
+                if fenestration_name == 'None':
+                    continue
+                glass_area = float(rows[fenestration_name][glass_area_column])
+                parent_surface_name = rows[fenestration_name][parent_surface_column]
+                frame_area = float(rows[fenestration_name][frame_area_column])
+                divider_area = float(rows[fenestration_name][divider_area_column])
+                glass_u_factor = float(rows[fenestration_name][glass_u_factor_column])
+                glass_shgc = float(rows[fenestration_name][glass_shgc_column])
+                glass_visible_trans = float(rows[fenestration_name][glass_visible_trans_column])
+                assembly_u_factor_str = rows[fenestration_name][assembly_u_factor_column]
+                assembly_shgc_str = rows[fenestration_name][assembly_shgc_column]
+                assembly_visible_trans_str = rows[fenestration_name][assembly_visible_trans_column]
+                if assembly_u_factor_str:
+                    u_factor = float(assembly_u_factor_str)
+                else:
+                    u_factor = glass_u_factor
+                if assembly_shgc_str:
+                    shgc = float(assembly_shgc_str)
+                else:
+                    shgc = glass_shgc
+                if assembly_visible_trans_str:
+                    visible_trans = float(assembly_visible_trans_str)
+                else:
+                    visible_trans = glass_visible_trans
+                shade_control = rows[fenestration_name][shade_control_column]
+
+                subsurface = {
+                    'id': fenestration_name,
+                    'glazed_area': glass_area,
+                    'opaque_area': frame_area + divider_area,
+                    'u_factor': u_factor,
+                    'solar_heat_gain_coefficient': shgc,
+                    'visible_transmittance': visible_trans,
+                    'has_automatic_shades': shade_control == 'Yes'
+                }
+                if fenestration_name in classification_by_subsurface:
+                    subsurface['classification'] = classification_by_subsurface[fenestration_name]
+                else:
+                    subsurface['classification'] = 'WINDOW'
+                if fenestration_name.lower() in dynamic_fenestrations:
+                    subsurface['dynamic_glazing_type'] = 'AUTOMATIC_DYNAMIC'
+                else:
+                    subsurface['dynamic_glazing_type'] = 'NOT_DYNAMIC'
+                subsurface['has_shading_overhang'] = fenestration_name.lower() in windows_with_overhangs
+                subsurface['has_shading_sidefins'] = fenestration_name.lower() in windows_with_fins
+                if parent_surface_name not in subsurface_by_surface:
+                    subsurface_by_surface[parent_surface_name] = [subsurface, ]
+                else:
+                    subsurface_by_surface[parent_surface_name].append(subsurface)
         # print(subsurface_by_surface)
         return subsurface_by_surface
 
@@ -1086,102 +1120,94 @@ class Translator:
         return classification_by_subsurface
 
     def gather_surfaces(self):
-        tabular_reports = self.json_results_object['TabularReports']
         surfaces = {}  # dictionary by zone name containing the surface data elements
-        subsurface_by_surface = self.gather_subsurface()
+        envelope_topology = self.envelope_topology
+        subsurface_by_surface = envelope_topology.subsurfaces_by_surface
         do_surfaces_cast_shadows = self.are_shadows_cast_from_surfaces()
-        adjacent_surfaces = self.get_adjacent_surface_for_each_surface()
-        outside_boundary_conditions = self.get_outside_boundary_condition_for_each_surface()
+        adjacent_zones = envelope_topology.adjacent_zone_by_surface
+        outside_boundary_conditions = envelope_topology.outside_boundary_condition_by_surface
         optical_by_construction = self.gather_surface_optical()
-        for tabular_report in tabular_reports:
-            if tabular_report['ReportName'] == 'EnvelopeSummary':
-                tables = tabular_report['Tables']
-                for table in tables:
-                    is_exterior = table['TableName'] == 'Opaque Exterior'
-                    if is_exterior or table['TableName'] == 'Opaque Interior':
-                        rows = table['Rows']
-                        surface_names = list(rows.keys())
-                        cols = table['Cols']
-                        construction_name_column = cols.index('Construction')
-                        gross_area_column = cols.index('Gross Area [m2]')
-                        azimuth_column = cols.index('Azimuth [deg]')
-                        tilt_column = cols.index('Tilt [deg]')
-                        for surface_name in surface_names:
-                            if surface_name == 'None':
-                                continue
-                            construction_name = rows[surface_name][construction_name_column]
-                            gross_area = float(rows[surface_name][gross_area_column])
-                            azimuth = float(rows[surface_name][azimuth_column])
-                            tilt = float(rows[surface_name][tilt_column])
-                            if tilt > 120:
-                                surface_classification = 'FLOOR'
-                            elif tilt >= 60:
-                                surface_classification = 'WALL'
-                            else:
-                                surface_classification = 'CEILING'
-                            if is_exterior:
-                                adjacent_to = 'EXTERIOR'
-                                if surface_name in outside_boundary_conditions:
-                                    outside_boundary_condition = outside_boundary_conditions[surface_name]
-                                    if 'GROUND' in outside_boundary_condition:
-                                        adjacent_to = 'GROUND'
-                            else:
-                                adjacent_to = 'INTERIOR'
-                            surface = {
-                                'id': surface_name,
-                                'classification': surface_classification,
-                                'area': gross_area,
-                                'tilt': tilt,
-                                'azimuth': azimuth,
-                                'adjacent_to': adjacent_to,
-                                'does_cast_shade': do_surfaces_cast_shadows,
-                                'construction': construction_name
-                            }
-                            if not is_exterior:
-                                if surface_name in adjacent_surfaces:
-                                    adjacent_surface = adjacent_surfaces[surface_name]
-                                    if adjacent_surface in self.surfaces_by_zone:
-                                        surface['adjacent_zone'] = self.surfaces_by_zone[adjacent_surface]
-                            if surface_name in subsurface_by_surface:
-                                surface['subsurfaces'] = subsurface_by_surface[surface_name]
-                            surfaces[surface_name] = surface
-                            if construction_name in optical_by_construction:
-                                surface['optical_properties'] = optical_by_construction[construction_name]
+        for table_name in ['Opaque Exterior', 'Opaque Interior']:
+            table = self.get_table('EnvelopeSummary', table_name)
+            is_exterior = table_name == 'Opaque Exterior'
+            if table:
+                rows = table['Rows']
+                surface_names = list(rows.keys())
+                cols = table['Cols']
+                construction_name_column = cols.index('Construction')
+                gross_area_column = cols.index('Gross Area [m2]')
+                azimuth_column = cols.index('Azimuth [deg]')
+                tilt_column = cols.index('Tilt [deg]')
+                for surface_name in surface_names:
+                    if surface_name == 'None':
+                        continue
+                    construction_name = rows[surface_name][construction_name_column]
+                    gross_area = float(rows[surface_name][gross_area_column])
+                    azimuth = float(rows[surface_name][azimuth_column])
+                    tilt = float(rows[surface_name][tilt_column])
+                    if tilt > 120:
+                        surface_classification = 'FLOOR'
+                    elif tilt >= 60:
+                        surface_classification = 'WALL'
+                    else:
+                        surface_classification = 'CEILING'
+                    if is_exterior:
+                        adjacent_to = 'EXTERIOR'
+                        if surface_name in outside_boundary_conditions:
+                            outside_boundary_condition = outside_boundary_conditions[surface_name]
+                            if 'GROUND' in outside_boundary_condition:
+                                adjacent_to = 'GROUND'
+                    else:
+                        adjacent_to = 'INTERIOR'
+                    surface = {
+                        'id': surface_name,
+                        'classification': surface_classification,
+                        'area': gross_area,
+                        'tilt': tilt,
+                        'azimuth': azimuth,
+                        'adjacent_to': adjacent_to,
+                        'does_cast_shade': do_surfaces_cast_shadows,
+                        'construction': construction_name
+                    }
+                    if not is_exterior:
+                        if surface_name in adjacent_zones:
+                            surface['adjacent_zone'] = adjacent_zones[surface_name]
+                    if surface_name in subsurface_by_surface:
+                        surface['subsurfaces'] = subsurface_by_surface[surface_name]
+                    surfaces[surface_name] = surface
+                    if construction_name in optical_by_construction:
+                        surface['optical_properties'] = optical_by_construction[construction_name]
         # print(surfaces)
         return surfaces
 
     def gather_infiltration(self):
         infiltration_by_zone = {}
-        tabular_reports = self.json_results_object['TabularReports']
-        for tabular_report in tabular_reports:
-            if tabular_report['ReportName'] == 'InitializationSummary':
-                tables = tabular_report['Tables']
-                for table in tables:
-                    if table['TableName'] == 'ZoneInfiltration Airflow Stats Nominal':
-                        rows = table['Rows']
-                        row_keys = list(rows.keys())
-                        cols = table['Cols']
-                        infiltration_name_column = cols.index('Name')
-                        zone_name_column = cols.index('Zone Name')
-                        design_volume_flow_rate_column = cols.index('Design Volume Flow Rate {m3/s}')
-                        schedule_name_column = cols.index('Schedule Name')
-                        for row_key in row_keys:
-                            if row_key == 'None':
-                                continue
-                            infiltration_name = rows[row_key][infiltration_name_column]
-                            zone_name = rows[row_key][zone_name_column]
-                            design_volume_flow_rate = 1000 * float(rows[row_key][design_volume_flow_rate_column])
-                            schedule_name = rows[row_key][schedule_name_column]
-                            infiltration = {
-                                'id': infiltration_name,
-                                'modeling_method': 'WEATHER_DRIVEN',
-                                'algorithm_name': 'ZoneInfiltration',
-                                'flow_rate': design_volume_flow_rate,
-                                'multiplier_schedule': schedule_name
-                            }
-                            self.schedules_used_names.append(schedule_name)
-                            # print(infiltration)
-                            infiltration_by_zone[zone_name.upper()] = infiltration
+        table = self.get_table('InitializationSummary', 'ZoneInfiltration Airflow Stats Nominal')
+        if table:
+            rows = table['Rows']
+            row_keys = list(rows.keys())
+            cols = table['Cols']
+            infiltration_name_column = cols.index('Name')
+            zone_name_column = cols.index('Zone Name')
+            design_volume_flow_rate_column = cols.index('Design Volume Flow Rate {m3/s}')
+            schedule_name_column = cols.index('Schedule Name')
+            for row_key in row_keys:
+                if row_key == 'None':
+                    continue
+                infiltration_name = rows[row_key][infiltration_name_column]
+                zone_name = rows[row_key][zone_name_column]
+                design_volume_flow_rate = 1000 * float(rows[row_key][design_volume_flow_rate_column])
+                schedule_name = rows[row_key][schedule_name_column]
+                infiltration = {
+                    'id': infiltration_name,
+                    'modeling_method': 'WEATHER_DRIVEN',
+                    'algorithm_name': 'ZoneInfiltration',
+                    'flow_rate': design_volume_flow_rate,
+                    'multiplier_schedule': schedule_name
+                }
+                self.schedules_used_names.append(schedule_name)
+                # print(infiltration)
+                infiltration_by_zone[zone_name.upper()] = infiltration
         air_flow_network_annual = self.get_table_dictionary('AFN ZONE INFILTRATION ANNUAL', 'Custom Annual Report')
         for name, afn in air_flow_network_annual.items():
             if name == 'Annual Sum or Average' or name == 'Maximum of Rows' or name == 'Minimum of Rows' or name == '':
@@ -1196,44 +1222,22 @@ class Translator:
         return infiltration_by_zone
 
     def add_schedules(self):
-        unique_schedule_names_used = list(set(self.schedules_used_names))
-        unique_schedule_names_used = [name.upper() for name in unique_schedule_names_used]
-        output_variables = {}
-        if 'Cols' in self.json_hourly_results_object:
-            output_variables = self.json_hourly_results_object['Cols']
-        selected_names = {}
-        for count, output_variable in enumerate(output_variables):
-            output_variable_name = output_variable['Variable'].replace(':Schedule Value', '')
-            if output_variable_name in unique_schedule_names_used:
-                selected_names[output_variable_name] = count
+        hourly_store = self.hourly_store
+        selected_names = self.select_schedule_columns(hourly_store.cols)
         # print(selected_names)
         type_by_name = self.gather_schedule_type()
-        rows = {}
-        if 'Rows' in self.json_hourly_results_object:
-            rows = self.json_hourly_results_object['Rows']
         schedules = []
 
         init_week_schedules = self.get_table_dictionary('InitializationSummary', 'WeekSchedule - Hourly', True)
         init_day_schedules = self.get_table_dictionary('InitializationSummary', 'DaySchedule - Hourly', True)
         init_schedules = self.get_table_dictionary('InitializationSummary', 'Schedule - Hourly', True)
 
-        for schedule_name, count in selected_names.items():
-            hourly = []
-            design_heating_hourly = []
-            design_cooling_hourly = []
-            for row in rows:
-                timestamp = list(row.keys())[0]
-                values_at_time_step = row[timestamp]
-                hourly.append(values_at_time_step[count])
-            if len(hourly) < 8760:
-                print(f'The hourly schedule: {schedule_name} has less than the 8760 values expected. '
-                      f'{len(hourly)} values found')
-            if len(hourly) == 8808:
-                # In this scenario, we have two sizing day data in the schedule. Take them out.
-                design_cooling_hourly = hourly[:24]
-                design_heating_hourly = hourly[24:48]
-                hourly = hourly[48:]
-            else:
+        for schedule_name in selected_names:
+            hourly, design_cooling_hourly, design_heating_hourly = hourly_store.split_design_days(schedule_name)
+            if hourly_store.row_count < 8760:
+                self.report(f'The hourly schedule: {schedule_name} has less than the 8760 values expected. '
+                            f'{hourly_store.row_count} values found')
+            if not hourly_store.has_design_days():
                 #  the Hourly JSON file does not contain the summer and winter design days
                 #  assume that weekschedule1 or 2 contains both
                 if schedule_name in init_schedules:
@@ -1270,6 +1274,16 @@ class Translator:
             schedules.append(schedule)
         self.model_description['schedules'] = schedules
 
+    def select_schedule_columns(self, output_variables: List[JsonDict]) -> Dict[str, int]:
+        # the hourly output column of each schedule that has been used
+        unique_schedule_names_used = set(name.upper() for name in self.schedules_used_names)
+        selected_names = {}
+        for count, output_variable in enumerate(output_variables):
+            output_variable_name = without_schedule_value_suffix(output_variable['Variable'])
+            if output_variable_name in unique_schedule_names_used:
+                selected_names[output_variable_name] = count
+        return selected_names
+
     def gather_schedule_type(self):
         raw_to_final_map = {
             'FRACTIONAL': 'MULTIPLIER_DIMENSIONLESS',
@@ -1335,38 +1349,30 @@ class Translator:
         return list_of_8760
 
     def is_site_shaded(self):
-        tabular_reports = self.json_results_object['TabularReports']
         total_detached = 0  # assume no shading surfaces
-        for tabular_report in tabular_reports:
-            if tabular_report['ReportName'] == 'ObjectCountSummary':
-                tables = tabular_report['Tables']
-                for table in tables:
-                    if table['TableName'] == 'Surfaces by Class':
-                        rows = table['Rows']
-                        cols = table['Cols']
-                        total_column = cols.index('Total')
-                        building_detached = rows['Building Detached Shading'][total_column]
-                        fixed_detached = rows['Fixed Detached Shading'][total_column]
-                        try:
-                            total_detached = float(building_detached) + float(fixed_detached)
-                        except ValueError:
-                            print('non-numeric value found in ObjectCountSummary:Surfaces by Class:* Detached Shading')
+        table = self.get_table('ObjectCountSummary', 'Surfaces by Class')
+        if table:
+            rows = table['Rows']
+            cols = table['Cols']
+            total_column = cols.index('Total')
+            building_detached = rows['Building Detached Shading'][total_column]
+            fixed_detached = rows['Fixed Detached Shading'][total_column]
+            try:
+                total_detached = float(building_detached) + float(fixed_detached)
+            except ValueError:
+                self.report('non-numeric value found in ObjectCountSummary:Surfaces by Class:* Detached Shading')
         return total_detached > 0
 
     def are_shadows_cast_from_surfaces(self):
-        tabular_reports = self.json_results_object['TabularReports']
         shadows_cast = True  # assume shadows are cast
-        for tabular_report in tabular_reports:
-            if tabular_report['ReportName'] == 'InitializationSummary':
-                tables = tabular_report['Tables']
-                for table in tables:
-                    if table['TableName'] == 'Building Information':
-                        rows = table['Rows']
-                        cols = table['Cols']
-                        solar_distribution_column = cols.index('Solar Distribution')
-                        solar_distribution = rows['1'][solar_distribution_column]
-                        # shadows are always cast unless Solar Distribution is set to MinimalShadowing
-                        shadows_cast = solar_distribution != 'MinimalShadowing'
+        table = self.get_table('InitializationSummary', 'Building Information')
+        if table:
+            rows = table['Rows']
+            cols = table['Cols']
+            solar_distribution_column = cols.index('Solar Distribution')
+            solar_distribution = rows['1'][solar_distribution_column]
+            # shadows are always cast unless Solar Distribution is set to MinimalShadowing
+            shadows_cast = solar_distribution != 'MinimalShadowing'
         return shadows_cast
 
     def add_airloop_heating_ventilation_ac_system(self):
@@ -1375,7 +1381,6 @@ class Translator:
         humid_option_by_airloop = self.gather_humid_option_by_airloop()
 
         coils_table = self.get_table_dictionary("CoilSizingDetails", "Coils")
-        coil_connections = self.gather_coil_connections()
         heating_coil_efficiencies = self.gather_heating_coil_efficiencies()
         cooling_coil_efficiencies = self.gather_cooling_coil_efficiencies()
         coil_connections = self.gather_coil_connections()
@@ -1554,7 +1559,7 @@ class Translator:
                     fs["fan_control"] = "CONSTANT"
 
                 if "air_energy_recovery" in supply_fan_extra:
-                    fs["air_energy_recovery"] = supply_fan_extra["air_energy_recovery"]
+                    fs["air_energy_recovery"] = dict(supply_fan_extra["air_energy_recovery"])
 
                 if airloop in exhaust_fan_names:
                     fs["exhaust_fans"] = [{"id": n, **equipment_fans[n][0]} for n in exhaust_fan_names[airloop]]
@@ -1732,216 +1737,22 @@ class Translator:
         return has_cooling_compressor or has_heating_compressor
 
     def analyze_supply_topology_by_airloop(self):
-        tops = {}  # nested dictionary with inner dictionary having predefined terms such as "supply-fan"
-        airloop_supplies = self.gather_table_into_list('HVACTopology',
-                                                       "Air Loop Supply Side Component Arrangement")
-        top = {}
-        oa_found = False
-        heat_coil_found = False
-
-        for row_count, airloop_supply in enumerate(airloop_supplies):
-            current_airloop_name = airloop_supply['Airloop Name']
-
-            # find outside air system
-            if (airloop_supply['Component Type'] == 'AIRLOOPHVAC:OUTDOORAIRSYSTEM' or
-                    airloop_supply['Sub-Component Type'] == 'AIRLOOPHVAC:OUTDOORAIRSYSTEM' or
-                    airloop_supply['Sub-Sub-Component Type'] == 'AIRLOOPHVAC:OUTDOORAIRSYSTEM'):
-                oa_found = True
-
-            # find fan(s)
-            found = False
-            if 'FAN:' in airloop_supply['Component Type']:
-                name = airloop_supply['Component Name']
-                found = True
-            elif 'FAN:' in airloop_supply['Sub-Component Type']:
-                name = airloop_supply['Sub-Component Name']
-                found = True
-            elif 'FAN:' in airloop_supply['Sub-Sub-Component Type']:
-                name = airloop_supply['Sub-Sub-Component Name']
-                found = True
-            if found:
-                if oa_found:
-                    top['supply_fan'] = name
-                else:
-                    top['return_fan'] = name
-
-            # find cooling coils
-            found = False
-            if 'COIL:COOLING:' in airloop_supply['Component Type']:
-                name = airloop_supply['Component Name']
-                found = True
-            elif 'COIL:COOLING:' in airloop_supply['Sub-Component Type']:
-                name = airloop_supply['Sub-Component Name']
-                found = True
-            elif 'COIL:COOLING:' in airloop_supply['Sub-Sub-Component Type']:
-                name = airloop_supply['Sub-Sub-Component Name']
-                found = True
-            if found:
-                top['cooling_coil'] = name
-
-            # find heating coil(s)
-            found = False
-            if 'COIL:HEATING:' in airloop_supply['Component Type']:
-                name = airloop_supply['Component Name']
-                found = True
-            elif 'COIL:HEATING:' in airloop_supply['Sub-Component Type']:
-                name = airloop_supply['Sub-Component Name']
-                found = True
-            elif 'COIL:HEATING:' in airloop_supply['Sub-Sub-Component Type']:
-                name = airloop_supply['Sub-Sub-Component Name']
-                found = True
-            if found:
-                if heat_coil_found:
-                    top['backup_heating_coil'] = name
-                else:
-                    top['main_heating_coil'] = name
-                heat_coil_found = True
-
-            if (row_count == len(airloop_supplies) - 1) or ((row_count < len(airloop_supplies) - 1) and (
-                    current_airloop_name != airloop_supplies[row_count + 1]['Airloop Name'])):
-                oa_found = False
-                heat_coil_found = False
-                if top:  # add the current airloop topology unless empty (first iteration)
-
-                    # if no supply fan ever found but return fan was, assume classified wrong
-                    if 'supply_fan' not in top and 'return_fan' in top:
-                        top['supply_fan'] = top['return_fan']
-                        del top['return_fan']
-
-                    # add to dictionary across all airloops
-                    tops[current_airloop_name] = top
-                    top = {}
-        return tops
+        # nested dictionary with inner dictionary having predefined terms such as "supply-fan"
+        return self.hvac_topology.supply_topology_by_airloop
 
     def analyze_demand_topology_by_airloop(self):
-        zones_by_airloop = {}
-        zone_by_terminal = {}
-        airloop_by_zone = {}
-        airloop_demands = self.gather_table_into_list('HVACTopology',
-                                                      "Air Loop Demand Side Component Arrangement")
-        for airloop_demand in airloop_demands:
-            if airloop_demand['Zone Name'] and airloop_demand['Terminal Unit Name']:
-                current_air_loop = airloop_demand['Airloop Name']
-                zone_name = airloop_demand['Zone Name']
-                zone_by_terminal[airloop_demand['Terminal Unit Name']] = zone_name
-                airloop_by_zone[zone_name] = current_air_loop
-                if current_air_loop in zones_by_airloop:
-                    zones_by_airloop[current_air_loop].append(zone_name)
-                else:
-                    zones_by_airloop[current_air_loop] = [zone_name,]
-        return zones_by_airloop, zone_by_terminal, airloop_by_zone
+        topology = self.hvac_topology
+        return topology.zones_by_airloop, topology.zone_by_terminal, topology.airloop_by_zone
 
     def analyze_zone_equipment(self):
         # dictionary that is returned has zone names as the keys and for each is a list
         # that contains dictionsary for each zone equipment (usually ZoneHVAC:*)
         # each of these subdictionaries has fan, heating coil, cooling coil
-
-        zone_equipments = self.gather_table_into_list('HVACTopology',
-                                                      "Zone Equipment Component Arrangement")
-        tops = {}
-        ze = {}
-        heat_coil_found = False
-        component_group_list = []
-
-        for row_count, zone_equipment in enumerate(zone_equipments):
-            zone_name = zone_equipment['Zone Name']
-            component_name = zone_equipment['Component Name']
-
-            if 'ZONEHVAC:AIRDISTRIBUTIONUNIT' in zone_equipment['Component Type']:
-                ze['has_ADU'] = True
-
-            if 'FAN:' in zone_equipment['Sub-Component Type']:
-                ze['fan'] = zone_equipment['Sub-Component Name']
-            elif 'FAN:' in zone_equipment['Sub-Sub-Component Type']:
-                ze['fan'] = zone_equipment['Sub-Sub-Component Name']
-
-            found = False
-            if 'COIL:HEATING:' in zone_equipment['Sub-Component Type']:
-                name = zone_equipment['Sub-Component Name']
-                found = True
-            elif 'COIL:HEATING:' in zone_equipment['Sub-Sub-Component Type']:
-                name = zone_equipment['Sub-Sub-Component Name']
-                found = True
-            if found:
-                if heat_coil_found:
-                    ze['backup_heating_coil'] = name
-                else:
-                    ze['main_heating_coil'] = name
-                heat_coil_found = True
-
-            if 'COIL:COOLING:' in zone_equipment['Sub-Component Type']:
-                ze['cooling_coil'] = zone_equipment['Sub-Component Name']
-            elif 'COIL:COOLING:' in zone_equipment['Sub-Sub-Component Type']:
-                ze['cooling_coil'] = zone_equipment['Sub-Sub-Component Name']
-
-            if 'VAV:' in zone_equipment['Sub-Component Type']:
-                ze['has_vav'] = True
-            elif 'VAV:' in zone_equipment['Sub-Sub-Component Type']:
-                ze['has_vav'] = True
-
-            if 'PIU:' in zone_equipment['Sub-Component Type']:
-                ze['has_vav'] = True
-            elif 'PIU:' in zone_equipment['Sub-Sub-Component Type']:
-                ze['has_vav'] = True
-
-            if 'BASEBOARD:' in zone_equipment['Component Type']:
-                ze['has_baseboard'] = True
-            elif 'BASEBOARD:' in zone_equipment['Sub-Component Type']:
-                ze['has_baseboard'] = True
-            elif 'BASEBOARD:' in zone_equipment['Sub-Sub-Component Type']:
-                ze['has_baseboard'] = True
-            # use elif here since some baseboards also use term radiant
-            elif 'RADIANT' in zone_equipment['Component Type']:
-                ze['has_radiant'] = True
-            elif 'RADIANT' in zone_equipment['Sub-Component Type']:
-                ze['has_radiant'] = True
-            elif 'RADIANT' in zone_equipment['Sub-Sub-Component Type']:
-                ze['has_radiant'] = True
-
-            if 'VARIABLEREFRIGERANTFLOW' in zone_equipment['Component Type']:
-                ze['has_vrf'] = True
-            elif 'VARIABLEREFRIGERANTFLOW' in zone_equipment['Sub-Component Type']:
-                ze['has_vrf'] = True
-            elif 'VARIABLEREFRIGERANTFLOW' in zone_equipment['Sub-Sub-Component Type']:
-                ze['has_vrf'] = True
-
-            type_of_component = zone_equipment['Component Type']
-            name = zone_equipment['Component Name']
-            component_group = (type_of_component, name)
-            if component_group not in component_group_list and component_group != ('', ''):
-                component_group_list.append(component_group)
-
-            type_of_component = zone_equipment['Sub-Component Type']
-            name = zone_equipment['Sub-Component Name']
-            component_group = (type_of_component, name)
-            if component_group not in component_group_list and component_group != ('', ''):
-                component_group_list.append(component_group)
-
-            type_of_component = zone_equipment['Sub-Sub-Component Type']
-            name = zone_equipment['Sub-Sub-Component Name']
-            component_group = (type_of_component, name)
-            if component_group not in component_group_list and component_group != ('', ''):
-                component_group_list.append(component_group)
-
-            #  when new zone equipment component name or end of list
-            if (row_count == len(zone_equipments) - 1) or ((row_count < len(zone_equipments) - 1) and (
-                    component_name != zone_equipments[row_count + 1]['Component Name'])):
-                heat_coil_found = False
-                if component_group_list:
-                    ze['component_group_list'] = component_group_list
-                    component_group_list = []
-                    if zone_name in tops:
-                        tops[zone_name].append(ze)
-                    else:
-                        tops[zone_name] = [ze,]
-                ze = {}
-        return tops
+        return self.hvac_topology.zone_equipment_by_zone
 
     def gather_economizer_by_airloop(self):
         economizers = {}
         sys_econo_reps = self.gather_table_into_list('SystemSummary', 'Economizer')
-        airloop_supplies = self.gather_table_into_list('HVACTopology',
-                                                       "Air Loop Supply Side Component Arrangement")
         ep_control_type_map = {
             'FixedDryBulb': 'TEMPERATURE',
             'FixedEnthalpy': 'ENTHALPY',
@@ -1952,11 +1763,7 @@ class Translator:
             'DifferentialDryBulbAndEnthalpy': 'OTHER',
             'NoEconomizer': 'FIXED_FRACTION'
         }
-        airloop_by_oa_sys = {}
-        for airloop_supply in airloop_supplies:
-            if (airloop_supply['Component Type'] == 'AIRLOOPHVAC:OUTDOORAIRSYSTEM' and
-                    airloop_supply['Sub-Component Type'] == ''):
-                airloop_by_oa_sys[airloop_supply['Component Name']] = airloop_supply['Airloop Name']
+        airloop_by_oa_sys = self.hvac_topology.airloop_by_oa_system
         for sys_econo_rep in sys_econo_reps:
             if sys_econo_rep['AirLoopHVAC:OutdoorAirSystem Name'] in airloop_by_oa_sys:
                 economizer = {'id': sys_econo_rep['first column'], }
@@ -1972,41 +1779,83 @@ class Translator:
         return economizers
 
     def gather_dehumid_option_by_airloop(self):
-        dehumid_options = {}
-        airloop_supplies = self.gather_table_into_list('HVACTopology',
-                                                       "Air Loop Supply Side Component Arrangement")
-        for airloop_supply in airloop_supplies:
-            if ('desiccant' in (airloop_supply['Component Type']).lower() or
-                    'desiccant' in (airloop_supply['Sub-Component Type']).lower() or
-                    'desiccant' in (airloop_supply['Sub-Sub-Component Type']).lower()):
-                dehumid_options[airloop_supply['Airloop Name']] = 'DESICCANT'
-            elif 'coilsystem:cooling:water:heatexchangerassisted ' in (airloop_supply['Component Type']).lower():
-                dehumid_options[airloop_supply['Airloop Name']] = 'SERIES_HEAT_RECOVERY'
         # note that determining if it is MECHANICAL_COOLING would require output reporting that does not exist
         # to determine if the controls are present to control it that way
-        return dehumid_options
+        return self.hvac_topology.dehumid_option_by_airloop
 
     def gather_humid_option_by_airloop(self):
-        humid_options = {}
-        airloop_supplies = self.gather_table_into_list('HVACTopology',
-                                                       "Air Loop Supply Side Component Arrangement")
-        for airloop_supply in airloop_supplies:
-            if ('humidifier:steam:' in (airloop_supply['Component Type']).lower() or
-                    'humidifier:steam:' in (airloop_supply['Sub-Component Type']).lower() or
-                    'humidifier:steam:' in (airloop_supply['Sub-Sub-Component Type']).lower()):
-                humid_options[airloop_supply['Airloop Name']] = 'OTHER'
-        return humid_options
+        return self.hvac_topology.humid_option_by_airloop
+
+    @property
+    def tabular_catalog(self) -> TabularCatalog:
+        # the catalog is rebuilt whenever the TabularReports list is replaced with a different one
+        tabular_reports = self.json_results_object.get('TabularReports', [])
+        if self._tabular_catalog is None or not self._tabular_catalog.is_built_from(tabular_reports):
+            self._tabular_catalog = TabularCatalog(tabular_reports)
+        return self._tabular_catalog
 
     def get_table(self, report_name: str, table_name: str) -> JsonDict:
-        tabular_reports: List[JsonDict] = self.json_results_object['TabularReports']
-        for tabular_report in tabular_reports:
-            if tabular_report['ReportName'] == report_name:
-                tables: List[JsonDict] = tabular_report['Tables']
-                for table in tables:
-                    if table['TableName'] == table_name:
-                        return table
-        return {}
+        return self.tabular_catalog.get_table(report_name, table_name)
+
+    @property
+    def hvac_topology(self) -> HvacTopology:
+        # the topology graph is rebuilt whenever the tabular catalog is rebuilt
+        tabular_catalog = self.tabular_catalog
+        if self._hvac_topology is None or self._hvac_topology_catalog is not tabular_catalog:
+            self._hvac_topology = HvacTopology(
+                self.gather_table_into_list('HVACTopology', 'Air Loop Supply Side Component Arrangement'),
+                self.gather_table_into_list('HVACTopology', 'Air Loop Demand Side Component Arrangement'),
+                self.gather_table_into_list('HVACTopology', 'Zone Equipment Component Arrangement'))
+            self._hvac_topology_catalog = tabular_catalog
+        return self._hvac_topology
+
+    @property
+    def plant_topology(self) -> PlantTopology:
+        # the plant loop graph is rebuilt whenever the tabular catalog is rebuilt
+        tabular_catalog = self.tabular_catalog
+        if self._plant_topology is None or self._plant_topology_catalog is not tabular_catalog:
+            self._plant_topology = PlantTopology(
+                self.gather_table_into_list('HVACTopology', 'Plant Loop Component Arrangement'))
+            self._plant_topology_catalog = tabular_catalog
+        return self._plant_topology
+
+    @property
+    def fact_cache(self) -> FactCache:
+        # the cached facts are derived from the tabular reports so they are dropped when the catalog is rebuilt
+        tabular_catalog = self.tabular_catalog
+        if self._fact_cache_catalog is not tabular_catalog:
+            self._fact_cache.invalidate()
+            self._fact_cache_catalog = tabular_catalog
+        return self._fact_cache
+
+    @property
+    def envelope_topology(self) -> EnvelopeTopology:
+        # rebuilt when the surfaces in the epJSON or the tabular catalog, which gives the subsurfaces, are replaced
+        building_surfaces = self.epjson_object.get('BuildingSurface:Detailed', NO_BUILDING_SURFACES)
+        tabular_catalog = self.tabular_catalog
+        if (self._envelope_topology is None or not self._envelope_topology.is_built_from(building_surfaces)
+                or self._envelope_topology_catalog is not tabular_catalog):
+            self._envelope_topology = EnvelopeTopology(building_surfaces, self.gather_subsurface())
+            self._envelope_topology_catalog = tabular_catalog
+        return self._envelope_topology
+
+    @property
+    def hourly_store(self) -> HourlyStore:
+        # the stages that read hourly values share one store, which is rebuilt when the hourly results are replaced
+        # when streaming, only the columns of the schedules used are read, so it is built once those are known
+        if self._hourly_store is None or self._hourly_store_source is not self.json_hourly_results_object:
+            if self.input_file.hourly_store is not None and \
+                    self.json_hourly_results_object is self.input_file.json_hourly_results_object:
+                self._hourly_store = self.input_file.hourly_store
+            elif self.input_file.stream_hourly:
+                self._hourly_store = HourlyStore.from_stream(self.input_file.json_hourly_results_input_path,
+                                                             self.select_schedule_columns)
+            else:
+                self._hourly_store = HourlyStore.from_object(self.json_hourly_results_object)
+            self._hourly_store_source = self.json_hourly_results_object
+        return self._hourly_store
 
+    @cached_fact()
     def gather_coil_connections(self) -> Dict[str, Dict[str, str]]:
         connection_by_coil: Dict[str, Dict[str, str]] = {}
         table: JsonDict = self.get_table('CoilSizingDetails', 'Coil Connections')
@@ -2051,115 +1900,28 @@ class Translator:
             supply_fan_name_by_coil[row_key] = supply_fan_name
         return supply_fan_name_by_coil
 
-    def gather_table_into_list(self, report_name: str, table_name: str) -> List[JsonDict]:
-        # transform the rows and columns format into a list of dictionaries
-        list_of_dict: List[JsonDict] = []
-        table: JsonDict = self.get_table(report_name, table_name)
-        if not table:
-            return list_of_dict
-        rows: TableRows = table['Rows']
-        row_keys: List[str] = list(rows.keys())
-        cols: List[str] = table['Cols']
-        for row_key in row_keys:
-            arrangement: JsonDict = {}
-            for col in cols:
-                col_index: int = cols.index(col)
-                arrangement[col] = rows[row_key][col_index]
-            arrangement["first column"] = row_key
-            list_of_dict.append(arrangement)
-#        for item in list_of_dict:
-#            print(item)
-        return list_of_dict
+    def gather_table_into_list(self, report_name: str, table_name: str) -> List[RowView]:
+        # transform the rows and columns format into a list of read-only row views
+        return self.tabular_catalog.get_table_list(report_name, table_name)
 
     def get_table_dictionary(
             self,
             report_name: str,
             table_name: str,
             ignore_first_column: bool = False
-    ) -> Dict[str, JsonDict]:
-        # transform the rows and columns format into a dictionary of dictionaries
-        dict_of_dict: Dict[str, JsonDict] = {}
-        table: JsonDict = self.get_table(report_name, table_name)
-        if not table:
-            return dict_of_dict
-        rows: TableRows = table['Rows']
-        row_keys: List[str] = list(rows.keys())
-        cols: List[str] = table['Cols']
-        if not ignore_first_column:
-            for row_key in row_keys:
-                arrangement: JsonDict = {}
-                for col in cols:
-                    col_index: int = cols.index(col)
-                    arrangement[col] = rows[row_key][col_index]
-                dict_of_dict[row_key] = arrangement
-        else:
-            if cols:
-                for row_key in row_keys:
-                    arrangement: JsonDict = {}
-                    for col in cols[1:]:
-                        col_index: int = cols.index(col)
-                        arrangement[col] = rows[row_key][col_index]
-                    dict_of_dict[str(rows[row_key][0])] = arrangement
-#        for item in dict_of_dict.items():
-#            print(item)
-        return dict_of_dict
+    ) -> Dict[str, RowView]:
+        # transform the rows and columns format into a dictionary of read-only row views
+        return self.tabular_catalog.get_table_dictionary(report_name, table_name, ignore_first_column)
 
     def gather_exhaust_fans_by_zone(self):
-        exh_fan_by_zone = {}
-        topology_zone_equips = self.gather_table_into_list('HVACTopology', "Zone Equipment Component Arrangement")
-        for topology_zone_equip in topology_zone_equips:
-            current_zone_name = topology_zone_equip['Zone Name']
-            if topology_zone_equip['Component Type'] == 'FAN:ZONEEXHAUST':
-                exh_fan_by_zone[current_zone_name] = topology_zone_equip['Component Name']
-        return exh_fan_by_zone
+        return self.hvac_topology.exhaust_fan_by_zone
 
     def gather_possible_return_fans_by_airloop(self):
-        return_fans = {}
-        airloop_supplies = self.gather_table_into_list('HVACTopology',
-                                                       "Air Loop Supply Side Component Arrangement")
-        blank_row = False
-        for supply_row in airloop_supplies:
-            if supply_row['Supply Branch Name']:
-                if blank_row:
-                    if 'FAN:' in supply_row['Component Type']:
-                        return_fans[supply_row['Airloop Name']] = supply_row['Component Name']
-                    elif 'FAN:' in supply_row['Sub-Component Type']:
-                        return_fans[supply_row['Airloop Name']] = supply_row['Sub-Component Name']
-                blank_row = False
-            else:
-                # if empty string then the row is blank except for airloop name
-                blank_row = True
-                continue
-        return return_fans
+        return self.hvac_topology.return_fans_by_airloop
 
     def gather_exhaust_fans_by_airloop(self):
-        exh_fan_by_airloop = {}  # for each airloop name contains a list of exhaust fans
-        topology_zone_equips = self.gather_table_into_list('HVACTopology', "Zone Equipment Component Arrangement")
-        zone_name_exh_fan = []  # list of tuples of zone name and exhaust fans
-        for topology_zone_equip in topology_zone_equips:
-            current_zone_name = topology_zone_equip['Zone Name']
-            # only look in nested sub and sub-sub components
-            if topology_zone_equip['Sub-Component Type'] == 'FAN:ZONEEXHAUST':
-                zone_name_exh_fan.append((current_zone_name, topology_zone_equip['Sub-Component Name']))
-            elif topology_zone_equip['Sub-Sub-Component Type'] == 'FAN:ZONEEXHAUST':
-                zone_name_exh_fan.append((current_zone_name, topology_zone_equip['Sub-Sub-Component Name']))
-        topology_airloop_demands = self.gather_table_into_list('HVACTopology',
-                                                               "Air Loop Demand Side Component Arrangement")
-        airloop_by_zone = {}
-        for topology_airloop_demand in topology_airloop_demands:
-            if not topology_airloop_demands[0]['first column'] == 'None':
-                if topology_airloop_demand['Zone Name']:
-                    airloop_by_zone[topology_airloop_demand['Zone Name']] = topology_airloop_demand['Airloop Name']
-        if zone_name_exh_fan and airloop_by_zone:
-            for (zone_name, fan_name) in zone_name_exh_fan:
-                if zone_name in airloop_by_zone:
-                    airloop = airloop_by_zone[zone_name]
-                    if airloop not in exh_fan_by_airloop:
-                        exh_fan_by_airloop[airloop] = [fan_name, ]
-                        exh_fan_by_airloop[airloop] = [fan_name, ]
-                    else:
-                        exh_fan_by_airloop[airloop].append(fan_name)
-        return exh_fan_by_airloop
+        # for each airloop name contains a list of exhaust fans
+        return self.hvac_topology.exhaust_fans_by_airloop
 
     def gather_airflows_from_62(self):
         airflows_by_sys = {}
@@ -2354,6 +2116,7 @@ class Translator:
                     metric_values.append(coil_efficiency['nominal_eff'])
         return metric_types, metric_values
 
+    @cached_fact()
     def gather_equipment_fans(self):
         equipment_fans = {}
         table = self.get_table('EquipmentSummary', 'Fans')
@@ -2425,7 +2188,17 @@ class Translator:
         return equipment_fans
 
     def gather_air_heat_recovery(self, airloop_name):
-        heat_recovery = {}
+        heat_recovery = self.gather_air_heat_recovery_by_airloop().get(airloop_name, {})
+        if isinstance(heat_recovery, ValueError):
+            # only the air loop that owns a heat exchanger with a value that is not a number fails
+            raise heat_recovery
+        return dict(heat_recovery)
+
+    @cached_fact()
+    def gather_air_heat_recovery_by_airloop(self):
+        # when an air loop has more than one heat exchanger the last one is kept
+        # a row that cannot be parsed is kept as its error, which is raised for its air loop alone
+        heat_recovery_by_airloop = {}
         table_in = self.gather_table_into_list('EquipmentSummary', 'Air Heat Recovery')
         active_map = {
             'WhenFansOn': 'WHEN_FANS_ON',
@@ -2434,33 +2207,46 @@ class Translator:
             'WhenMinimumOutdoorAir': 'WHEN_MINIMUM_OUTSIDE_AIR'
         }
         for row_in in table_in:
-            if airloop_name == row_in['Airloop Name']:
-                if row_in['Type'] == 'HeatExchanger:AirToAir:SensibleAndLatent':
-                    if float(row_in['Latent Effectiveness at 100% Heating Air Flow']) > 0:
-                        option = 'ENTHALPY'
-                    else:
-                        option = 'ENTHALPY'
-                    if row_in['Plate/Rotary'] == 'Rotary':
-                        option += '_HEAT_WHEEL'
-                    else:
-                        option += '_HEAT_EXCHANGE'
-                else:
-                    option = 'SENSIBLE_HEAT_EXCHANGE'
-                sensible_effectiveness = max(float(row_in['Sensible Effectiveness at 100% Heating Air Flow']),
-                                             float(row_in['Sensible Effectiveness at 100% Cooling Air Flow']))
-                latent_effectiveness = max(float(row_in['Latent Effectiveness at 100% Heating Air Flow']),
-                                           float(row_in['Latent Effectiveness at 100% Cooling Air Flow']))
-                heat_recovery = {
-                    'id': row_in['first column'],
-                    'type': option,
-                    'design_sensible_effectiveness': sensible_effectiveness,
-                    'design_latent_effectiveness': latent_effectiveness,
-                    'outdoor_airflow': float(row_in['Supply Air Flow Rate [m3/s]']),
-                    'exhaust_airflow': float(row_in['Exhaust Air Flow Rate [m3/s]']),
-                }
-                active = row_in['Heat Recovery Active']
-                if active in active_map:
-                    heat_recovery['energy_recovery_operation'] = active_map[active]
+            airloop_name = row_in.get('Airloop Name', '')
+            # an empty table has a single row named None with every other field blank
+            if not airloop_name or row_in['first column'] == 'None':
+                continue
+            if isinstance(heat_recovery_by_airloop.get(airloop_name), ValueError):
+                continue
+            try:
+                heat_recovery_by_airloop[airloop_name] = self.parse_air_heat_recovery_row(row_in, active_map)
+            except ValueError as e:
+                heat_recovery_by_airloop[airloop_name] = e
+        return heat_recovery_by_airloop
+
+    @staticmethod
+    def parse_air_heat_recovery_row(row_in, active_map):
+        if row_in['Type'] == 'HeatExchanger:AirToAir:SensibleAndLatent':
+            if float(row_in['Latent Effectiveness at 100% Heating Air Flow']) > 0:
+                option = 'ENTHALPY'
+            else:
+                option = 'ENTHALPY'
+            if row_in['Plate/Rotary'] == 'Rotary':
+                option += '_HEAT_WHEEL'
+            else:
+                option += '_HEAT_EXCHANGE'
+        else:
+            option = 'SENSIBLE_HEAT_EXCHANGE'
+        sensible_effectiveness = max(float(row_in['Sensible Effectiveness at 100% Heating Air Flow']),
+                                     float(row_in['Sensible Effectiveness at 100% Cooling Air Flow']))
+        latent_effectiveness = max(float(row_in['Latent Effectiveness at 100% Heating Air Flow']),
+                                   float(row_in['Latent Effectiveness at 100% Cooling Air Flow']))
+        heat_recovery = {
+            'id': row_in['first column'],
+            'type': option,
+            'design_sensible_effectiveness': sensible_effectiveness,
+            'design_latent_effectiveness': latent_effectiveness,
+            'outdoor_airflow': float(row_in['Supply Air Flow Rate [m3/s]']),
+            'exhaust_airflow': float(row_in['Exhaust Air Flow Rate [m3/s]']),
+        }
+        active = row_in['Heat Recovery Active']
+        if active in active_map:
+            heat_recovery['energy_recovery_operation'] = active_map[active]
         return heat_recovery
 
     def gather_fan_operating_points(self, fan_name, max_flow, max_elec):
@@ -2588,249 +2374,215 @@ class Translator:
 
     def add_chillers(self):
         chillers = []
-        tabular_reports = self.json_results_object['TabularReports']
-        plant_loop_arrangement = self.gather_table_into_list('HVACTopology', 'Plant Loop Component Arrangement')
-        for tabular_report in tabular_reports:
-            if tabular_report['ReportName'] == 'EquipmentSummary':
-                tables = tabular_report['Tables']
-                for table in tables:
-                    if table['TableName'] == 'Chillers':
-                        rows = table['Rows']
-                        chiller_names = list(rows.keys())
-                        cols = table['Cols']
-                        plant_loop_name_column = cols.index('Plantloop Name')
-                        condenser_loop_name_column = cols.index('Condenser Loop Name')
-                        fuel_type_column = cols.index('Fuel Type')
-                        reference_capacity_column = cols.index('Reference Capacity[W]')
-                        rated_capacity_column = cols.index('Rated Capacity [W]')
-                        rated_enter_temp_column = cols.index('Rated Entering Condenser Temperature [C]')
-                        rated_leave_temp_column = cols.index('Rated Leaving Evaporator Temperature [C]')
-                        min_plr_column = cols.index('Minimum Part Load Ratio')
-                        chilled_water_rate_column = cols.index('Design Size Reference Chilled Water Flow Rate [kg/s]')
-                        condenser_water_rate_column = cols.index(
-                            'Design Size Reference Condenser Fluid Flow Rate [kg/s]')
-                        ref_enter_temp_column = cols.index('Reference Entering Condenser Temperature [C]')
-                        ref_leave_temp_column = cols.index('Reference Leaving Evaporator Temperature [C]')
-                        rated_efficiency_column = cols.index('Rated Efficiency [W/W]')
-                        part_load_efficiency_column = cols.index('IPLV in SI Units [W/W]')
-                        heat_recovery_loop_name_column = cols.index('Heat Recovery Plantloop Name')
-                        heat_recovery_fraction_column = cols.index('Recovery Relative Capacity Fraction')
-                        for chiller_name in chiller_names:
-                            if chiller_name != 'None':
-                                fuel_type = rows[chiller_name][fuel_type_column].upper().replace(' ', '_')
-                                metric_types = ['FULL_LOAD_EFFICIENCY_RATED',
-                                                'INTEGRATED_PART_LOAD_VALUE']
-                                metric_values = [float(rows[chiller_name][rated_efficiency_column]),
-                                                 float(rows[chiller_name][part_load_efficiency_column])]
-                                chiller = {'id': chiller_name,
-                                           'cooling_loop': rows[chiller_name][plant_loop_name_column],
-                                           'condensing_loop': rows[chiller_name][condenser_loop_name_column],
-                                           'energy_source_type': fuel_type,
-                                           'chiller_function': 'CHILLED_WATER_ONLY',
-                                           'design_capacity': float(rows[chiller_name][reference_capacity_column]),
-                                           'rated_capacity': float(rows[chiller_name][rated_capacity_column]),
-                                           'rated_entering_condenser_temperature': float(
-                                               rows[chiller_name][rated_enter_temp_column]),
-                                           'rated_leaving_evaporator_temperature': float(
-                                               rows[chiller_name][rated_leave_temp_column]),
-                                           'minimum_load_ratio': float(rows[chiller_name][min_plr_column]),
-                                           'design_flow_evaporator': float(
-                                               rows[chiller_name][chilled_water_rate_column]),
-                                           'design_flow_condenser': float(
-                                               rows[chiller_name][condenser_water_rate_column]),
-                                           'design_entering_condenser_temperature': float(
-                                               rows[chiller_name][ref_enter_temp_column]),
-                                           'design_leaving_evaporator_temperature': float(
-                                               rows[chiller_name][ref_leave_temp_column]),
-                                           'efficiency_metric_values': metric_values,
-                                           'efficiency_metric_types': metric_types,
-                                           'is_chilled_water_pump_interlocked': do_chiller_and_pump_share_branch(
-                                               chiller_name, plant_loop_arrangement, 'Supply'),
-                                           'is_condenser_water_pump_interlocked': do_chiller_and_pump_share_branch(
-                                               chiller_name, plant_loop_arrangement, 'Demand')}
-                                if rows[chiller_name][heat_recovery_loop_name_column] != 'N/A':
-                                    chiller['heat_recovery_loop'] = rows[chiller_name][heat_recovery_loop_name_column]
-                                    chiller['heat_recovery_fraction'] = (
-                                        float(rows[chiller_name][heat_recovery_fraction_column]))
-                                chillers.append(chiller)
+        plant_topology = self.plant_topology
+        table = self.get_table('EquipmentSummary', 'Chillers')
+        if table:
+            rows = table['Rows']
+            chiller_names = list(rows.keys())
+            cols = table['Cols']
+            plant_loop_name_column = cols.index('Plantloop Name')
+            condenser_loop_name_column = cols.index('Condenser Loop Name')
+            fuel_type_column = cols.index('Fuel Type')
+            reference_capacity_column = cols.index('Reference Capacity[W]')
+            rated_capacity_column = cols.index('Rated Capacity [W]')
+            rated_enter_temp_column = cols.index('Rated Entering Condenser Temperature [C]')
+            rated_leave_temp_column = cols.index('Rated Leaving Evaporator Temperature [C]')
+            min_plr_column = cols.index('Minimum Part Load Ratio')
+            chilled_water_rate_column = cols.index('Design Size Reference Chilled Water Flow Rate [kg/s]')
+            condenser_water_rate_column = cols.index(
+                'Design Size Reference Condenser Fluid Flow Rate [kg/s]')
+            ref_enter_temp_column = cols.index('Reference Entering Condenser Temperature [C]')
+            ref_leave_temp_column = cols.index('Reference Leaving Evaporator Temperature [C]')
+            rated_efficiency_column = cols.index('Rated Efficiency [W/W]')
+            part_load_efficiency_column = cols.index('IPLV in SI Units [W/W]')
+            heat_recovery_loop_name_column = cols.index('Heat Recovery Plantloop Name')
+            heat_recovery_fraction_column = cols.index('Recovery Relative Capacity Fraction')
+            for chiller_name in chiller_names:
+                if chiller_name != 'None':
+                    fuel_type = rows[chiller_name][fuel_type_column].upper().replace(' ', '_')
+                    metric_types = ['FULL_LOAD_EFFICIENCY_RATED',
+                                    'INTEGRATED_PART_LOAD_VALUE']
+                    metric_values = [float(rows[chiller_name][rated_efficiency_column]),
+                                     float(rows[chiller_name][part_load_efficiency_column])]
+                    chiller = {'id': chiller_name,
+                               'cooling_loop': rows[chiller_name][plant_loop_name_column],
+                               'condensing_loop': rows[chiller_name][condenser_loop_name_column],
+                               'energy_source_type': fuel_type,
+                               'chiller_function': 'CHILLED_WATER_ONLY',
+                               'design_capacity': float(rows[chiller_name][reference_capacity_column]),
+                               'rated_capacity': float(rows[chiller_name][rated_capacity_column]),
+                               'rated_entering_condenser_temperature': float(
+                                   rows[chiller_name][rated_enter_temp_column]),
+                               'rated_leaving_evaporator_temperature': float(
+                                   rows[chiller_name][rated_leave_temp_column]),
+                               'minimum_load_ratio': float(rows[chiller_name][min_plr_column]),
+                               'design_flow_evaporator': float(
+                                   rows[chiller_name][chilled_water_rate_column]),
+                               'design_flow_condenser': float(
+                                   rows[chiller_name][condenser_water_rate_column]),
+                               'design_entering_condenser_temperature': float(
+                                   rows[chiller_name][ref_enter_temp_column]),
+                               'design_leaving_evaporator_temperature': float(
+                                   rows[chiller_name][ref_leave_temp_column]),
+                               'efficiency_metric_values': metric_values,
+                               'efficiency_metric_types': metric_types,
+                               'is_chilled_water_pump_interlocked': plant_topology.is_pump_on_component_branch(
+                                   chiller_name, 'Supply'),
+                               'is_condenser_water_pump_interlocked': plant_topology.is_pump_on_component_branch(
+                                   chiller_name, 'Demand')}
+                    if rows[chiller_name][heat_recovery_loop_name_column] != 'N/A':
+                        chiller['heat_recovery_loop'] = rows[chiller_name][heat_recovery_loop_name_column]
+                        chiller['heat_recovery_fraction'] = (
+                            float(rows[chiller_name][heat_recovery_fraction_column]))
+                    chillers.append(chiller)
         self.model_description['chillers'] = chillers
         return chillers
 
     def add_boilers(self):
         boilers = []
-        tabular_reports = self.json_results_object['TabularReports']
         operation_load_based = self.gather_table_into_list('ControlSummary', 'PlantEquipmentOperation Load Based')
-        for tabular_report in tabular_reports:
-            if tabular_report['ReportName'] == 'EquipmentSummary':
-                tables = tabular_report['Tables']
-                for table in tables:
-                    if table['TableName'] == 'Boilers':
-                        rows = table['Rows']
-                        boiler_names = list(rows.keys())
-                        cols = table['Cols']
-                        plant_loop_name_column = cols.index('Plantloop Name')
-                        reference_capacity_column = cols.index('Reference Capacity [W]')
-                        rated_capacity_column = cols.index('Rated Capacity [W]')
-                        min_plr_column = cols.index('Minimum Part Load Ratio')
-                        fuel_type_column = cols.index('Fuel Type')
-                        reference_efficiency_column = cols.index('Reference Efficiency[W/W]')
-                        parasitic_load_column = cols.index('Parasitic Electric Load [W]')
-                        for boiler_name in boiler_names:
-                            if boiler_name != 'None':
-                                fuel_type = energy_source_convert(rows[boiler_name][fuel_type_column])
-                                boiler = {
-                                    'id': boiler_name,
-                                    'loop': rows[boiler_name][plant_loop_name_column],
-                                    'design_capacity': float(rows[boiler_name][reference_capacity_column]),
-                                    'rated_capacity': float(rows[boiler_name][rated_capacity_column]),
-                                    'minimum_load_ratio': float(rows[boiler_name][min_plr_column]),
-                                    'energy_source_type': fuel_type,
-                                    'efficiency_metric_types': ['THERMAL', ],
-                                    'efficiency_metric_values':
-                                        [float(rows[boiler_name][reference_efficiency_column]), ],
-                                    'auxiliary_power': float(rows[boiler_name][parasitic_load_column]),
-                                }
-                                for operation_row in operation_load_based:
-                                    if boiler_name == operation_row['Equipment']:
-                                        boiler['operation_lower_limit'] = float(operation_row['Lower Limit [W]'])
-                                        boiler['operation_upper_limit'] = float(operation_row['Upper Limit [W]'])
-                                        break
-                                boilers.append(boiler)
+        operation_by_equipment = {}
+        for operation_row in operation_load_based:
+            operation_by_equipment.setdefault(operation_row['Equipment'], operation_row)
+        table = self.get_table('EquipmentSummary', 'Boilers')
+        if table:
+            rows = table['Rows']
+            boiler_names = list(rows.keys())
+            cols = table['Cols']
+            plant_loop_name_column = cols.index('Plantloop Name')
+            reference_capacity_column = cols.index('Reference Capacity [W]')
+            rated_capacity_column = cols.index('Rated Capacity [W]')
+            min_plr_column = cols.index('Minimum Part Load Ratio')
+            fuel_type_column = cols.index('Fuel Type')
+            reference_efficiency_column = cols.index('Reference Efficiency[W/W]')
+            parasitic_load_column = cols.index('Parasitic Electric Load [W]')
+            for boiler_name in boiler_names:
+                if boiler_name != 'None':
+                    fuel_type = energy_source_convert(rows[boiler_name][fuel_type_column])
+                    boiler = {
+                        'id': boiler_name,
+                        'loop': rows[boiler_name][plant_loop_name_column],
+                        'design_capacity': float(rows[boiler_name][reference_capacity_column]),
+                        'rated_capacity': float(rows[boiler_name][rated_capacity_column]),
+                        'minimum_load_ratio': float(rows[boiler_name][min_plr_column]),
+                        'energy_source_type': fuel_type,
+                        'efficiency_metric_types': ['THERMAL', ],
+                        'efficiency_metric_values':
+                            [float(rows[boiler_name][reference_efficiency_column]), ],
+                        'auxiliary_power': float(rows[boiler_name][parasitic_load_column]),
+                    }
+                    if boiler_name in operation_by_equipment:
+                        operation_row = operation_by_equipment[boiler_name]
+                        boiler['operation_lower_limit'] = float(operation_row['Lower Limit [W]'])
+                        boiler['operation_upper_limit'] = float(operation_row['Upper Limit [W]'])
+                    boilers.append(boiler)
         self.model_description['boilers'] = boilers
         return boilers
 
     def add_heat_rejection(self):
         heat_rejections = []
-        tabular_reports = self.json_results_object['TabularReports']
-        for tabular_report in tabular_reports:
-            if tabular_report['ReportName'] == 'EquipmentSummary':
-                tables = tabular_report['Tables']
-                for table in tables:
-                    if table['TableName'] == 'Cooling Towers and Fluid Coolers':
-                        rows = table['Rows']
-                        heat_rejection_names = list(rows.keys())
-                        cols = table['Cols']
-                        type_column = cols.index('Type')
-                        fluid_type_column = cols.index('Fluid Type')
-                        loop_name_column = cols.index('Condenser Loop Name')
-                        range_column = cols.index('Range [C]')
-                        approach_column = cols.index('Approach [C]')
-                        fan_power_column = cols.index('Design Fan Power [W]')
-                        wet_bulb_column = cols.index('Design Inlet Air Wet-Bulb Temperature [C]')
-                        flow_rate_column = cols.index('Design Water Flow Rate [m3/s]')
-                        leaving_setpoint_column = cols.index('Leaving Water Setpoint Temperature [C]')
-                        for heat_rejection_name in heat_rejection_names:
-                            if heat_rejection_name != 'None':
-                                fan = {
-                                    'id': heat_rejection_name + '_fan',
-                                    'motor_nameplate_power': float(rows[heat_rejection_name][fan_power_column])
-                                }
-                                heat_rejection = {
-                                    'id': heat_rejection_name,
-                                    'loop': rows[heat_rejection_name][loop_name_column],
-                                    'range': float(rows[heat_rejection_name][range_column]),
-                                    'fan': fan,
-                                    'design_wetbulb_temperature': float(rows[heat_rejection_name][wet_bulb_column]),
-                                    'design_water_flowrate': float(rows[heat_rejection_name][flow_rate_column]) * 1000,
-                                    'leaving_water_setpoint_temperature':
-                                        float(rows[heat_rejection_name][leaving_setpoint_column]),
-                                }
-                                approach_str = rows[heat_rejection_name][approach_column]
-                                type_of_object = rows[heat_rejection_name][type_column]
-                                if approach_str:
-                                    heat_rejection['approach'] = float(approach_str)
-                                heat_rejection['type'] = heat_rejection_type_convert(type_of_object)
-                                fluid_type_str = rows[heat_rejection_name][fluid_type_column].lower()
-                                if fluid_type_str == 'water':
-                                    heat_rejection['fluid'] = 'WATER'
-                                else:
-                                    heat_rejection['fluid'] = 'OTHER'
-                                heat_rejection['fan_speed_control'] = heat_rejection_fan_speed_convert(type_of_object)
-                                heat_rejections.append(heat_rejection)
+        table = self.get_table('EquipmentSummary', 'Cooling Towers and Fluid Coolers')
+        if table:
+            rows = table['Rows']
+            heat_rejection_names = list(rows.keys())
+            cols = table['Cols']
+            type_column = cols.index('Type')
+            fluid_type_column = cols.index('Fluid Type')
+            loop_name_column = cols.index('Condenser Loop Name')
+            range_column = cols.index('Range [C]')
+            approach_column = cols.index('Approach [C]')
+            fan_power_column = cols.index('Design Fan Power [W]')
+            wet_bulb_column = cols.index('Design Inlet Air Wet-Bulb Temperature [C]')
+            flow_rate_column = cols.index('Design Water Flow Rate [m3/s]')
+            leaving_setpoint_column = cols.index('Leaving Water Setpoint Temperature [C]')
+            for heat_rejection_name in heat_rejection_names:
+                if heat_rejection_name != 'None':
+                    fan = {
+                        'id': heat_rejection_name + '_fan',
+                        'motor_nameplate_power': float(rows[heat_rejection_name][fan_power_column])
+                    }
+                    heat_rejection = {
+                        'id': heat_rejection_name,
+                        'loop': rows[heat_rejection_name][loop_name_column],
+                        'range': float(rows[heat_rejection_name][range_column]),
+                        'fan': fan,
+                        'design_wetbulb_temperature': float(rows[heat_rejection_name][wet_bulb_column]),
+                        'design_water_flowrate': float(rows[heat_rejection_name][flow_rate_column]) * 1000,
+                        'leaving_water_setpoint_temperature':
+                            float(rows[heat_rejection_name][leaving_setpoint_column]),
+                    }
+                    approach_str = rows[heat_rejection_name][approach_column]
+                    type_of_object = rows[heat_rejection_name][type_column]
+                    if approach_str:
+                        heat_rejection['approach'] = float(approach_str)
+                    heat_rejection['type'] = heat_rejection_type_convert(type_of_object)
+                    fluid_type_str = rows[heat_rejection_name][fluid_type_column].lower()
+                    if fluid_type_str == 'water':
+                        heat_rejection['fluid'] = 'WATER'
+                    else:
+                        heat_rejection['fluid'] = 'OTHER'
+                    heat_rejection['fan_speed_control'] = heat_rejection_fan_speed_convert(type_of_object)
+                    heat_rejections.append(heat_rejection)
         self.model_description['heat_rejections'] = heat_rejections
         return heat_rejections
 
     def add_pumps(self):
         pumps = []
-        tabular_reports = self.json_results_object['TabularReports']
-        for tabular_report in tabular_reports:
-            if tabular_report['ReportName'] == 'EquipmentSummary':
-                tables = tabular_report['Tables']
-                for table in tables:
-                    if table['TableName'] == 'Pumps':
-                        rows = table['Rows']
-                        pump_names = list(rows.keys())
-                        cols = table['Cols']
-                        plant_loop_name_column = cols.index('Plantloop Name')
-                        electricity_column = cols.index('Electricity Rate [W]')
-                        head_column = cols.index('Head [pa]')
-                        motor_efficiency_column = cols.index('Motor Efficiency [W/W]')
-                        type_column = cols.index('Type')
-                        water_flow_column = cols.index('Water Flow [m3/s]')
-                        is_autosized_column = cols.index('Is Autosized')
-                        control_column = cols.index('Control')
-                        for pump_name in pump_names:
-                            if pump_name == 'None':
-                                continue
-                            type_str = rows[pump_name][type_column]
-                            speed_control = 'FIXED_SPEED'
-                            if 'vari' in type_str.lower():
-                                speed_control = 'VARIABLE_SPEED'
-                            is_autosized = False
-                            if 'Y' in rows[pump_name][is_autosized_column]:
-                                is_autosized = True
-                            pump = {
-                                'id': pump_name,
-                                'loop_or_piping': rows[pump_name][plant_loop_name_column],
-                                'specification_method': 'SIMPLE',
-                                'design_electric_power': float(rows[pump_name][electricity_column]),
-                                'design_head': float(rows[pump_name][head_column]),
-                                'motor_efficiency': float(rows[pump_name][motor_efficiency_column]),
-                                'speed_control': speed_control,
-                                'design_flow': float(rows[pump_name][water_flow_column]) * 1000,
-                                'is_flow_calculated': is_autosized
-                            }
-                            pump_extra = {
-                                'control': rows[pump_name][control_column]
-                            }
-                            self.pump_extra[pump_name] = pump_extra
-                            pumps.append(pump)
+        table = self.get_table('EquipmentSummary', 'Pumps')
+        if table:
+            rows = table['Rows']
+            pump_names = list(rows.keys())
+            cols = table['Cols']
+            plant_loop_name_column = cols.index('Plantloop Name')
+            electricity_column = cols.index('Electricity Rate [W]')
+            head_column = cols.index('Head [pa]')
+            motor_efficiency_column = cols.index('Motor Efficiency [W/W]')
+            type_column = cols.index('Type')
+            water_flow_column = cols.index('Water Flow [m3/s]')
+            is_autosized_column = cols.index('Is Autosized')
+            control_column = cols.index('Control')
+            for pump_name in pump_names:
+                if pump_name == 'None':
+                    continue
+                type_str = rows[pump_name][type_column]
+                speed_control = 'FIXED_SPEED'
+                if 'vari' in type_str.lower():
+                    speed_control = 'VARIABLE_SPEED'
+                is_autosized = False
+                if 'Y' in rows[pump_name][is_autosized_column]:
+                    is_autosized = True
+                pump = {
+                    'id': pump_name,
+                    'loop_or_piping': rows[pump_name][plant_loop_name_column],
+                    'specification_method': 'SIMPLE',
+                    'design_electric_power': float(rows[pump_name][electricity_column]),
+                    'design_head': float(rows[pump_name][head_column]),
+                    'motor_efficiency': float(rows[pump_name][motor_efficiency_column]),
+                    'speed_control': speed_control,
+                    'design_flow': float(rows[pump_name][water_flow_column]) * 1000,
+                    'is_flow_calculated': is_autosized
+                }
+                pump_extra = {
+                    'control': rows[pump_name][control_column]
+                }
+                self.pump_extra[pump_name] = pump_extra
+                pumps.append(pump)
         self.model_description['pumps'] = pumps
         return pumps
 
     def add_fluid_loops(self):
         fluid_loops = []
-        plant_loop_arrangements = self.gather_table_into_list('HVACTopology', 'Plant Loop Component Arrangement')
+        plant_topology = self.plant_topology
         loop_equip_summaries = self.get_table_dictionary('EquipmentSummary', 'PlantLoop or CondenserLoop')
         loop_comp_summaries = self.get_table_dictionary('ComponentSizingSummary', 'PlantLoop')
         oa_reset_control_summaries = self.gather_table_into_list('ControlSummary', 'SetpointManager:OutdoorAirReset')
         return_control_summaries = self.gather_table_into_list('ControlSummary', 'SetpointManager:ReturnTemperature')
-        loop_types = {}
-        if plant_loop_arrangements:
-            if plant_loop_arrangements[0]['first column'] == 'None':
-                return fluid_loops
-        for arrangement_row in plant_loop_arrangements:
-            name = arrangement_row['Loop Name']
-            likely_type = ''
-            if arrangement_row['Side'] == 'Supply':
-                if 'CHILLER' in arrangement_row['Component Type']:
-                    likely_type = 'COOLING'
-                elif 'BOILER' in arrangement_row['Component Type']:
-                    likely_type = 'HEATING'
-                elif 'TOWER' in arrangement_row['Component Type']:
-                    likely_type = 'CONDENSER'
-                elif 'FLUIDCOOLER' in arrangement_row['Component Type']:
-                    likely_type = 'CONDENSER'
-            if likely_type:
-                if name in loop_types:
-                    prev_type = loop_types[name]
-                    type_tuple = (likely_type, prev_type)
-                    if type_tuple == ('COOLING', 'HEATING') or type_tuple == ('HEATING', 'COOLING'):
-                        loop_types[name] = 'HEATING_AND_COOLING'
-                    elif type_tuple == ('CONDENSER', 'HEATING') or type_tuple == ('HEATING', 'CONDENSER'):
-                        loop_types[name] = 'HEATING_AND_COOLING'
-                else:
-                    loop_types[name] = likely_type
+        if plant_topology.reports_no_loops:
+            return fluid_loops
+        loop_types = plant_topology.likely_loop_types()
+        pumps_by_id = {}
+        for pump_from_rmd in self.model_description['pumps']:
+            pumps_by_id.setdefault(pump_from_rmd['id'], []).append(pump_from_rmd)
         for loop_name, loop_type in loop_types.items():
             fluid_loop = {
                 'id': loop_name,
@@ -2841,19 +2593,14 @@ class Translator:
             pump_flow_rate = 0
             current_pump_control = ''
             current_pump_speed = ''
-            pumps_from_rmd = self.model_description['pumps']
-            for arrangement_row in plant_loop_arrangements:
-                if loop_name == arrangement_row['Loop Name']:
-                    if 'PUMP' in arrangement_row['Component Type']:
-                        pump_name = arrangement_row['Component Name']
-                        for pump_from_rmd in pumps_from_rmd:
-                            if pump_name == pump_from_rmd['id']:
-                                pump_power = pump_power + pump_from_rmd['design_electric_power']
-                                if pump_from_rmd['design_flow'] > pump_flow_rate:
-                                    pump_flow_rate = pump_from_rmd['design_flow']
-                                current_pump_speed = pump_from_rmd['speed_control']
-                        if pump_name in self.pump_extra:
-                            current_pump_control = self.pump_extra[pump_name]['control']
+            for pump_name in plant_topology.pump_names_by_loop.get(loop_name, []):
+                for pump_from_rmd in pumps_by_id.get(pump_name, []):
+                    pump_power = pump_power + pump_from_rmd['design_electric_power']
+                    if pump_from_rmd['design_flow'] > pump_flow_rate:
+                        pump_flow_rate = pump_from_rmd['design_flow']
+                    current_pump_speed = pump_from_rmd['speed_control']
+                if pump_name in self.pump_extra:
+                    current_pump_control = self.pump_extra[pump_name]['control']
             if pump_flow_rate > 0:
                 fluid_loop['pump_power_per_flow_rate'] = pump_power / pump_flow_rate
             design_control = {
@@ -2906,9 +2653,8 @@ class Translator:
                             oa_reset_control['Minimum Supply Temperature Setpoint [C]'])
             if 'COOLING' in loop_type or 'CONDENSER' == loop_type:
                 fluid_loop['cooling_or_condensing_design_and_control'] = design_control
-                design_control['has_integrated_waterside_economizer'] = do_share_branch('chiller',
-                                                                                        'heatexchanger',
-                                                                                        plant_loop_arrangements)
+                design_control['has_integrated_waterside_economizer'] = plant_topology.do_component_types_share_branch(
+                    'chiller', 'heatexchanger')
             if 'HEATING' in loop_type:
                 fluid_loop['heating_design_and_control'] = design_control
 
@@ -2918,11 +2664,7 @@ class Translator:
 
     def gather_service_water_heater_loops(self) -> Dict[str, str]:
         loop_by_heater: Dict[str, str] = {}
-        plant_loop_arrangements: List[JsonDict] = self.gather_table_into_list(
-            'HVACTopology',
-            'Plant Loop Component Arrangement'
-        )
-        for arrangement_row in plant_loop_arrangements:
+        for arrangement_row in self.plant_topology.rows:
             component_type: str = non_empty_string(arrangement_row.get('Component Type'))
             if 'WATERHEATER' in component_type.upper():
                 component_name: str = non_empty_string(arrangement_row.get('Component Name'))
@@ -3681,69 +3423,83 @@ class Translator:
 
     def ensure_all_id_unique(self):
         self.add_serial_number_nested(self.model_description, 'id')
+        if self.do_verify_ids:
+            duplicate_ids = find_duplicate_ids(self.model_description, 'id')
+            if duplicate_ids:
+                raise Exception(f"Ids are not unique after serial numbers were added: {duplicate_ids}")
 
     def add_serial_number_nested(self, in_dict, key):
-        for k, v in in_dict.items():
-            if key == k:
-                in_dict[k] = self.replace_serial_number(v)
-            elif isinstance(v, dict):
-                self.add_serial_number_nested(v, key)
-            elif isinstance(v, list):
-                for o in v:
-                    if isinstance(o, dict):
-                        self.add_serial_number_nested(o, key)
+        self.id_registry.assign_nested(in_dict, key)
 
     def replace_serial_number(self, original_id):
-        index = original_id.rfind('~~~')
-        if index == -1:
-            if original_id in self.id_used:
-                self.serial_number += 1
-                new_id = original_id + '~~~' + str(self.serial_number).zfill(8)
-                self.id_used.add(new_id)
-                return new_id
-            else:
-                self.id_used.add(original_id)
-                return original_id
-        else:
-            self.serial_number += 1
-            root_id = original_id[:index]
-            new_id = root_id + '~~~' + str(self.serial_number).zfill(8)
-            self.id_used.add(new_id)
-            return new_id
+        return self.id_registry.assign(original_id)
 
-    def process(self):
+    def find_surfaces_by_zone(self):
+        self.surfaces_by_zone = self.get_zone_for_each_surface()
+
+    def run_stage(self, name: str, stage: Callable[[], Any]) -> Any:
+        if self.stage_timer is None:
+            return stage()
+        with self.stage_timer.stage(name):
+            return stage()
+
+    def restore_section_order(self):
+        # stages running at the same time add their sections in whatever order they finish, so the sections are put
+        # back in the order of the stages that write them, which is the order they have when run one at a time
+        for owner_name in SECTION_OWNERS:
+            stage_index_by_section = {}
+            for index, stage in enumerate(MODEL_STAGES):
+                for path in stage.writes:
+                    owner, _, section = path.partition('.')
+                    if owner == owner_name and section and section not in stage_index_by_section:
+                        stage_index_by_section[section] = index
+            owner_dict = getattr(self, owner_name)
+            # the sections made by create_skeleton are not listed and stay first
+            ordered = sorted(owner_dict.items(), key=lambda item: stage_index_by_section.get(item[0], -1))
+            owner_dict.clear()
+            owner_dict.update(ordered)
+
+    def build_shared_structures(self):
+        # built before the stages run at the same time so two stages never build one of them at once
+        _ = self.tabular_catalog, self.fact_cache, self.hvac_topology, self.plant_topology, self.envelope_topology
+
+    def report(self, message: str):
+        self.messages.append(message)
+        if not self.quiet:
+            print(message)
+
+    def translate(self) -> JsonDict:
+        """Builds the project description, merges in the compliance parameters and validates it"""
         epjson = self.epjson_object
         Translator.validate_input_contents(epjson)
-        self.create_skeleton()
-        self.add_external_fluid_source()
-        self.add_weather()
-        self.add_calendar()
-        self.add_materials()
-        self.add_constructions()
-        self.surfaces_by_zone = self.get_zone_for_each_surface()
-        self.gather_coil_connections()
-        self.add_airloop_heating_ventilation_ac_system()
-        self.add_terminal_hvac_system()
-        self.add_chillers()
-        self.add_boilers()
-        self.add_heat_rejection()
-        self.add_pumps()
-        self.add_fluid_loops()
-        self.add_zones()
-        self.add_spaces()
-        self.add_service_water_heating()
-        self.add_exterior_lighting()
-        self.add_simulation_outputs()
-        self.add_schedules()
-        self.add_ground_schedule()
-        self.ensure_all_id_unique()
+
+        def run_model_stage(stage_name: str):
+            self.run_stage(stage_name, getattr(self, stage_name))
+
+        if self.jobs > 1:
+            self.build_shared_structures()
+        if self.jobs > 1 and self.stage_timer is not None:
+            with self.stage_timer.tracing():
+                run_stages(MODEL_STAGES, run_model_stage, self.jobs)
+        else:
+            run_stages(MODEL_STAGES, run_model_stage, self.jobs)
 
         if self.do_use_compliance_parameters:
-            self.compliance_parameter.merge_in_compliance_parameters(self.project_description)
+            self.run_stage('merge_in_compliance_parameters',
+                           lambda: self.compliance_parameter.merge_in_compliance_parameters(self.project_description))
         elif self.do_create_empty_compliance_parameters:
-            self.compliance_parameter.create_empty_compliance_json(self.project_description)
-        passed, message = self.validator.validate_rpd(self.project_description)
+            self.run_stage('create_empty_compliance_json',
+                           lambda: self.compliance_parameter.create_empty_compliance_json(self.project_description))
+        passed, message = self.run_stage('validate_rpd', lambda: self.validator.validate_rpd(self.project_description))
         if not passed:
-            print(message)
-        self.output_file.write(self.project_description)
-        self.status_reporter.generate()
+            self.validation_message = message
+            self.report(message)
+        return self.project_description
+
+    def process(self):
+        self.translate()
+        print(self.validator.timing_summary())
+        self.run_stage('write', lambda: self.output_file.write(self.project_description))
+        print(self.output_file.summary())
+        if self.status_reporter is not None:
+            self.run_stage('status_report', self.status_reporter.generate_if_needed)
@@ -1,57 +1,193 @@
-from json import loads
+from copy import deepcopy
+from os import environ
 from pathlib import Path
-from typing import Tuple
+from time import perf_counter
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
-import jsonschema
+from energyplus_rpd.enumeration_index import EnumerationIndex
+from energyplus_rpd.json_codec import dumps, loads
+
+MAIN_SCHEMA_FILE_NAME = 'ASHRAE229.schema.json'
+ENUM_901_FILE_NAME = 'Enumerations2019ASHRAE901.schema.json'
+ENUM_RESNET_FILE_NAME = 'EnumerationsRESNET.schema.json'
+ENUM_T24_FILE_NAME = 'Enumerations2019T24.schema.json'
+OUTPUT_901_FILE_NAME = 'Output2019ASHRAE901.schema.json'
+SCHEMA_FILE_NAMES = [MAIN_SCHEMA_FILE_NAME, ENUM_901_FILE_NAME, ENUM_RESNET_FILE_NAME, ENUM_T24_FILE_NAME,
+                     OUTPUT_901_FILE_NAME]
+
+# when set, the pre-resolved schema is persisted to and loaded from this path
+SCHEMA_ARTIFACT_ENVIRONMENT_VARIABLE = 'ENERGYPLUS_RPD_SCHEMA_ARTIFACT'
+
+_shared_validator: Optional['Validator'] = None
+
+
+def contains_ref(schema: Any) -> bool:
+    if isinstance(schema, dict):
+        return '$ref' in schema or any(contains_ref(value) for value in schema.values())
+    if isinstance(schema, list):
+        return any(contains_ref(value) for value in schema)
+    return False
+
+
+def build_resolved_schema(schema_store: Dict[str, Dict]) -> Dict:
+    """Combines the schema files into one schema that has no references to other files
+
+    References to definitions in the other files that do not contain references themselves, such as the
+    enumerations, are replaced by a copy of the definition. Every other definition of the other files is copied into
+    the definitions of the main schema under the name '<file name>:<definition name>' and referenced locally.
+    """
+    main_schema = schema_store[MAIN_SCHEMA_FILE_NAME]
+
+    def local_ref(file_name: str, pointer: str) -> str:
+        if file_name in ('', MAIN_SCHEMA_FILE_NAME):
+            return '#' + pointer
+        definition_name, _, rest = pointer[len('/definitions/'):].partition('/')
+        return f'#/definitions/{file_name}:{definition_name}' + (f'/{rest}' if rest else '')
+
+    def resolve(schema: Any, file_name: str) -> Any:
+        if isinstance(schema, list):
+            return [resolve(value, file_name) for value in schema]
+        if not isinstance(schema, dict):
+            return schema
+        resolved = {}
+        for key, value in schema.items():
+            if key == '$ref' and isinstance(value, str):
+                ref_file_name, _, pointer = value.partition('#')
+                ref_file_name = ref_file_name or file_name
+                if ref_file_name not in schema_store or not pointer.startswith('/definitions/'):
+                    resolved[key] = value
+                    continue
+                definition_name = pointer[len('/definitions/'):]
+                definitions = schema_store[ref_file_name].get('definitions', {})
+                target = definitions.get(definition_name)
+                if ref_file_name != MAIN_SCHEMA_FILE_NAME and target is not None and not contains_ref(target):
+                    # draft-07 ignores the keywords next to a $ref so the copy replaces the whole object
+                    return deepcopy(target)
+                resolved[key] = local_ref(ref_file_name, pointer)
+            else:
+                resolved[key] = resolve(value, file_name)
+        return resolved
+
+    resolved_schema = {key: value for key, value in main_schema.items() if key != 'definitions'}
+    resolved_schema = resolve(resolved_schema, MAIN_SCHEMA_FILE_NAME)
+    definitions = {}
+    for name, definition in main_schema.get('definitions', {}).items():
+        definitions[name] = resolve(definition, MAIN_SCHEMA_FILE_NAME)
+    for file_name, schema in schema_store.items():
+        if file_name == MAIN_SCHEMA_FILE_NAME:
+            continue
+        for name, definition in schema.get('definitions', {}).items():
+            definitions[f'{file_name}:{name}'] = resolve(definition, file_name)
+    resolved_schema['definitions'] = definitions
+    return resolved_schema
+
+
+def schema_fingerprint(schema_dir: Path) -> List[List[Any]]:
+    # the sizes and modification times of the schema files tell if a persisted artifact is still current
+    fingerprint = []
+    for file_name in SCHEMA_FILE_NAMES:
+        stat = (schema_dir / file_name).stat()
+        fingerprint.append([file_name, stat.st_size, stat.st_mtime_ns])
+    return fingerprint
+
+
+def get_shared_validator(artifact_path: Optional[Path] = None) -> 'Validator':
+    """Returns the validator shared by the whole process, building it the first time it is asked for
+
+    If artifact_path is not given the path in the ENERGYPLUS_RPD_SCHEMA_ARTIFACT environment variable is used, if
+    any.
+    """
+    global _shared_validator
+    if _shared_validator is None:
+        if artifact_path is None and environ.get(SCHEMA_ARTIFACT_ENVIRONMENT_VARIABLE):
+            artifact_path = Path(environ[SCHEMA_ARTIFACT_ENVIRONMENT_VARIABLE])
+        _shared_validator = Validator(artifact_path)
+    return _shared_validator
 
 
 class Validator:
 
-    def __init__(self):
+    def __init__(self, artifact_path: Optional[Path] = None):
+        start = perf_counter()
+        self._start = start
+        self.time_to_first_validation: Optional[float] = None
         parent_dir = Path(__file__).resolve().parent
+        fingerprint = schema_fingerprint(parent_dir)
+
+        self.resolved_schema = None
+        self.schema_source = 'schema files'
+        if artifact_path is not None and artifact_path.exists():
+            try:
+                artifact = loads(artifact_path.read_text(encoding='utf-8'))
+                if artifact.get('fingerprint') == fingerprint:
+                    self.resolved_schema = artifact['schema']
+                    self.schema_source = 'schema artifact'
+            except Exception as e:
+                print(f"Could not read schema artifact at {artifact_path}, the schema files are used; error: {e}")
 
-        # approach from
-        # https://stackoverflow.com/questions/53968770/how-to-set-up-local-file-references-in-python-jsonschema-document
-
-        main_schema_path = parent_dir / 'ASHRAE229.schema.json'
-        enum_901_path = parent_dir / 'Enumerations2019ASHRAE901.schema.json'
-        enum_resnet_path = parent_dir / 'EnumerationsRESNET.schema.json'
-        enum_t24_path = parent_dir / 'Enumerations2019T24.schema.json'
-        output_901_path = parent_dir / 'Output2019ASHRAE901.schema.json'
-
-        self.main_schema = loads(main_schema_path.read_text())
-        self.enum_901 = loads(enum_901_path.read_text())
-        self.enum_resnet = loads(enum_resnet_path.read_text())
-        self.enum_t24 = loads(enum_t24_path.read_text())
-        self.output_901 = loads(output_901_path.read_text())
-
-        schema_store = {
-            main_schema_path.name: self.main_schema,
-            enum_901_path.name: self.enum_901,
-            enum_resnet_path.name: self.enum_resnet,
-            enum_t24_path.name: self.enum_t24,
-            output_901_path.name: self.output_901
-        }
-
-        resolver = jsonschema.RefResolver.from_schema(self.main_schema, store=schema_store)
-        validator_class_type = jsonschema.validators.validator_for(self.main_schema)
-        self.validator = validator_class_type(self.main_schema, resolver=resolver)
+        if self.resolved_schema is None:
+            schema_store = {file_name: loads((parent_dir / file_name).read_text()) for file_name in SCHEMA_FILE_NAMES}
+            self.resolved_schema = build_resolved_schema(schema_store)
+            if artifact_path is not None:
+                try:
+                    artifact_path.parent.mkdir(parents=True, exist_ok=True)
+                    artifact_path.write_text(dumps({'fingerprint': fingerprint, 'schema': self.resolved_schema}),
+                                             encoding='utf-8')
+                except OSError as e:
+                    print(f"Could not write schema artifact at {artifact_path}; error: {e}")
+
+        self.main_schema = self.resolved_schema
+        self.enum_901 = self.definitions_of(ENUM_901_FILE_NAME)
+        self.enum_resnet = self.definitions_of(ENUM_RESNET_FILE_NAME)
+        self.enum_t24 = self.definitions_of(ENUM_T24_FILE_NAME)
+        self.output_901 = self.definitions_of(OUTPUT_901_FILE_NAME)
+        self.enumeration_index = EnumerationIndex({ENUM_901_FILE_NAME: self.enum_901,
+                                                   ENUM_RESNET_FILE_NAME: self.enum_resnet,
+                                                   ENUM_T24_FILE_NAME: self.enum_t24,
+                                                   OUTPUT_901_FILE_NAME: self.output_901})
+        self.numeric_array_properties = self.find_numeric_array_properties()
+
+        # jsonschema takes a good part of the start up time to import, so it is only imported once it is needed
+        from jsonschema.validators import validator_for
+        validator_class_type = validator_for(self.resolved_schema)
+        self.validator = validator_class_type(self.resolved_schema)
+        self.startup_time = perf_counter() - start
+
+    def find_numeric_array_properties(self) -> FrozenSet[str]:
+        # names of the properties that the schema defines as arrays of numbers wherever they appear
+        numeric, other = set(), set()
+        for definition in self.resolved_schema['definitions'].values():
+            for name, property_schema in definition.get('properties', {}).items():
+                items = property_schema.get('items', {})
+                if property_schema.get('type') == 'array' and items.get('type') in ('number', 'integer'):
+                    numeric.add(name)
+                else:
+                    other.add(name)
+        return frozenset(numeric - other)
+
+    def definitions_of(self, file_name: str) -> Dict:
+        # rebuilds the definitions of one of the schema files from the combined schema
+        prefix = file_name + ':'
+        definitions = {name[len(prefix):]: definition
+                       for name, definition in self.resolved_schema['definitions'].items() if name.startswith(prefix)}
+        return {'definitions': definitions}
 
     def validate_rpd(self, rpd_dict: dict) -> Tuple[bool, str]:
+        from jsonschema.exceptions import ValidationError
         try:
             self.validator.validate(rpd_dict)
             return True, ''
-        except jsonschema.exceptions.ValidationError as err:
+        except ValidationError as err:
             return False, f"invalid: {err.message} at {err.json_path}"
+        finally:
+            if self.time_to_first_validation is None:
+                self.time_to_first_validation = perf_counter() - self._start
+
+    def timing_summary(self) -> str:
+        summary = f'validator: startup {self.startup_time:.3f} s from {self.schema_source}'
+        if self.time_to_first_validation is not None:
+            summary += f', first validation done {self.time_to_first_validation:.3f} s after startup began'
+        return summary
 
     def is_in_901_enumeration(self, enumeration_list_name: str, search_string: str) -> bool:
-        if self.enum_901:
-            if 'definitions' in self.enum_901:
-                dict_of_enumerations = self.enum_901['definitions']
-                if enumeration_list_name in dict_of_enumerations:
-                    enumeration_holder = dict_of_enumerations[enumeration_list_name]
-                    if 'enum' in enumeration_holder:
-                        enumerations = enumeration_holder['enum']
-                        if search_string in enumerations:
-                            return True
-        return False
+        return self.enumeration_index.contains_exactly(enumeration_list_name, search_string, ENUM_901_FILE_NAME)
@@ -27,6 +27,7 @@ setup(
     long_description_content_type='text/markdown',
     keywords='energyplus',
     install_requires=['jsonschema==4.23', 'pyyaml'],
+    extras_require={'fast': ['orjson']},
     entry_points={
         'console_scripts': [
             'createRulesetProjectDescription=energyplus_rpd.runner:run',